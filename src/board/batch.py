@@ -0,0 +1,291 @@
+"""
+Move generation for many positions at once.
+
+Positions are given as a stack of game states of shape (N, 8, 8),
+indexed [board, x, y] like 'Engine.start_game' returns them.
+The moves of every piece are computed with NumPy array operations over
+all boards and all squares together, instead of one position at a time.
+
+The moves are the same as 'Engine.get_all_possible_actions' gives,
+see: chess/board/bitboard.py for the rules, including the squares
+that the king is not allowed to move to.
+Squares are numbered as on the bitboard:
+
+    square = x * 8 + y
+"""
+
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+
+from src.board.bitboard import (
+    BISHOP,
+    GRID_SIZE,
+    KING,
+    KING_ATTACKS,
+    KNIGHT,
+    KNIGHT_ATTACKS,
+    PAWN,
+    PAWN_DIRECTION,
+    PAWN_START_ROW,
+    POSITIONS,
+    QUEEN,
+    ROOK,
+    is_inside_grid,
+    square_of,
+)
+from src.board.moves import CAPTURE, encode_moves
+from src.pieces.rays import DIAGONAL_DIRECTIONS, STRAIGHT_DIRECTIONS
+
+if TYPE_CHECKING:
+    from nptyping import NDArray
+
+N_SQUARES = GRID_SIZE * GRID_SIZE
+SQUARE_BITS = np.array([1 << square for square in range(N_SQUARES)], dtype=np.uint64)
+KNIGHT_MASKS = np.array(KNIGHT_ATTACKS, dtype=np.uint64)
+KING_MASKS = np.array(KING_ATTACKS, dtype=np.uint64)
+
+
+def _step_targets(direction: tuple) -> "NDArray":
+    """
+    Square reached after every number of steps in direction from every square,
+    of shape (7, 64). Steps that leave the board are -1.
+    """
+    output = np.full((GRID_SIZE - 1, N_SQUARES), -1, dtype=np.int64)
+    dx, dy = direction
+    for square, (x, y) in enumerate(POSITIONS):
+        for step in range(1, GRID_SIZE):
+            if not is_inside_grid(x + step * dx, y + step * dy):
+                break
+            output[step - 1, square] = square_of((x + step * dx, y + step * dy))
+    return output
+
+
+STRAIGHT_TARGETS = tuple(_step_targets(d) for d in STRAIGHT_DIRECTIONS)
+DIAGONAL_TARGETS = tuple(_step_targets(d) for d in DIAGONAL_DIRECTIONS)
+
+
+def _pawn_tables(color: Literal["white", "black"]) -> tuple["NDArray", ...]:
+    """
+    Single and double forward steps (-1 if not allowed) and the diagonal
+    kill mask of a pawn of color on every square.
+    """
+    direction = PAWN_DIRECTION[color]
+    single = np.full(N_SQUARES, -1, dtype=np.int64)
+    double = np.full(N_SQUARES, -1, dtype=np.int64)
+    diagonals = np.zeros(N_SQUARES, dtype=np.uint64)
+    for square, (x, y) in enumerate(POSITIONS):
+        if is_inside_grid(x, y + direction):
+            single[square] = square + direction
+            if y == PAWN_START_ROW[color]:
+                double[square] = square + 2 * direction
+        for dx in (-1, 1):
+            if is_inside_grid(x + dx, y + direction):
+                diagonals[square] |= SQUARE_BITS[square_of((x + dx, y + direction))]
+    return single, double, diagonals
+
+
+PAWN_TABLES = {color: _pawn_tables(color) for color in ("white", "black")}
+
+
+def _bits(targets: "NDArray", allowed: "NDArray") -> "NDArray":
+    """
+    Bits of the target squares where allowed, 0 elsewhere.
+    """
+    return np.where(allowed, SQUARE_BITS[np.maximum(targets, 0)], np.uint64(0))
+
+
+def _union(masks: "NDArray", where: "NDArray") -> "NDArray":
+    """
+    Union of the masks of the selected squares of every board.
+    """
+    return np.bitwise_or.reduce(
+        np.where(where, masks, np.uint64(0)), axis=1, dtype=np.uint64
+    )
+
+
+def _rays(flat: "NDArray", all_targets: tuple) -> "NDArray":
+    """
+    Destination masks of a sliding piece on every square of every board,
+    stopping at (and including) the first occupied square of every ray.
+    """
+    empty = flat == 0
+    output = np.zeros(flat.shape, dtype=np.uint64)
+    for targets in all_targets:
+        is_open = np.ones(flat.shape, dtype=bool)
+        for step_targets in targets:
+            lands = is_open & (step_targets >= 0)
+            output |= _bits(step_targets, lands)
+            is_open = lands & empty[:, np.maximum(step_targets, 0)]
+    return output
+
+
+def _pawn_masks(
+    flat: "NDArray", color: Literal["white", "black"], enemies: "NDArray"
+) -> tuple["NDArray", "NDArray"]:
+    """
+    Destination masks and reach (see 'Bitboard.pawn_reach') of a pawn
+    of color on every square of every board.
+    """
+    single, double, diagonals = PAWN_TABLES[color]
+    empty = flat == 0
+    single_ok = (single >= 0) & empty[:, np.maximum(single, 0)]
+    double_ok = single_ok & (double >= 0) & empty[:, np.maximum(double, 0)]
+    moves = (
+        _bits(single, single_ok)
+        | _bits(double, double_ok)
+        | (diagonals & enemies[:, None])
+    )
+
+    forward = _bits(single, single >= 0) | _bits(double, double >= 0)
+    reach = diagonals | (forward & ~enemies[:, None])
+    return moves, reach
+
+
+def _check_boards(boards: "NDArray") -> "NDArray":
+    boards = np.asarray(boards)
+    if boards.ndim != 3 or boards.shape[1:] != (GRID_SIZE, GRID_SIZE):
+        raise ValueError(
+            f"Boards of shape {boards.shape} are not a stack of "
+            f"{GRID_SIZE}x{GRID_SIZE} game states"
+        )
+    return boards
+
+
+def destination_masks(
+    boards: "NDArray", player: Literal["white", "black"]
+) -> "NDArray":
+    """
+    Computes where every piece of player can move on a stack of boards.
+
+    Parameters
+    ----
+    boards: NDArray
+        Integer array of shape (N, 8, 8) with piece numbers.
+    player: Literal['white', 'black']
+        The player to move.
+
+    Returns
+    ----
+        Array of shape (N, 8, 8) and type uint64 with the destination mask
+        of the piece on every position, 0 for positions without a piece
+        of player. Bit 'x * 8 + y' of a mask is set if the piece can move
+        to position (x, y).
+    """
+    boards = _check_boards(boards)
+    flat = boards.reshape(len(boards), N_SQUARES).astype(np.int64)
+    piece_type = (flat - 1) % 6
+    is_white = (flat >= 1) & (flat <= 6)
+    is_black = flat >= 7
+    occupancy = {
+        "white": _union(SQUARE_BITS, is_white),
+        "black": _union(SQUARE_BITS, is_black),
+    }
+
+    straight = _rays(flat, STRAIGHT_TARGETS)
+    diagonal = _rays(flat, DIAGONAL_TARGETS)
+
+    def masks_of(color: Literal["white", "black"]) -> tuple["NDArray", "NDArray"]:
+        """
+        Moves of the pieces of color without the king rules,
+        and the reach of its pawns.
+        """
+        enemy = "black" if color == "white" else "white"
+        pawn_moves, pawn_reach = _pawn_masks(flat, color, occupancy[enemy])
+        moves = np.select(
+            [
+                piece_type == PAWN,
+                piece_type == ROOK,
+                piece_type == KNIGHT,
+                piece_type == BISHOP,
+                piece_type == QUEEN,
+            ],
+            [
+                pawn_moves,
+                straight & ~occupancy[color][:, None],
+                KNIGHT_MASKS & ~occupancy[color][:, None],
+                diagonal & ~occupancy[color][:, None],
+                (straight | diagonal) & ~occupancy[color][:, None],
+            ],
+            KING_MASKS & ~occupancy[color][:, None],
+        )
+        return moves, pawn_reach
+
+    opponent = "black" if player == "white" else "white"
+    is_player = is_white if player == "white" else is_black
+    is_opponent = is_black if player == "white" else is_white
+
+    # Squares the king of player is not allowed to move to,
+    # following the same definition as 'Bitboard.king_danger'
+    enemy_moves, enemy_pawn_reach = masks_of(opponent)
+    enemy_moves = np.where(piece_type == PAWN, enemy_pawn_reach, enemy_moves)
+    enemy_moves = np.where(piece_type == KING, KING_MASKS, enemy_moves)
+    danger = _union(enemy_moves, is_opponent)
+
+    moves, _ = masks_of(player)
+    moves = np.where(piece_type == KING, moves & ~danger[:, None], moves)
+    moves = np.where(is_player, moves, np.uint64(0))
+    return moves.reshape(boards.shape)
+
+
+def move_arrays(masks: "NDArray") -> tuple["NDArray", "NDArray", "NDArray"]:
+    """
+    Lists all moves of a stack of destination masks
+    (see 'destination_masks').
+
+    Returns
+    ----
+        Three integer arrays of equal length with the board index,
+        old square and new square of every move, ordered by board,
+        old square and new square.
+    """
+    flat = np.ascontiguousarray(masks, dtype="<u8").reshape(len(masks), N_SQUARES)
+    bits = np.unpackbits(flat.view(np.uint8), bitorder="little")
+    bits = bits.reshape(len(masks), N_SQUARES, N_SQUARES)
+    return np.nonzero(bits)
+
+
+def batch_moves(
+    boards: "NDArray", player: Literal["white", "black"]
+) -> list[list[tuple[tuple, tuple]]]:
+    """
+    Lists the moves of player on a stack of boards.
+
+    Returns
+    ----
+        A list with the moves of every board as
+        (old_position, new_position) pairs, for example:
+            [[((0, 1), (0, 2)), ((0, 1), (0, 3)), ...], ...]
+    """
+    boards = _check_boards(boards)
+    board_index, old_squares, new_squares = move_arrays(
+        destination_masks(boards, player)
+    )
+    output = [[] for _ in range(len(boards))]
+    for board, old_square, new_square in zip(
+        board_index.tolist(), old_squares.tolist(), new_squares.tolist(), strict=True
+    ):
+        output[board].append((POSITIONS[old_square], POSITIONS[new_square]))
+    return output
+
+
+def batch_move_arrays(
+    boards: "NDArray", player: Literal["white", "black"]
+) -> tuple["NDArray", "NDArray"]:
+    """
+    Lists the moves of player on a stack of boards, in the 16-bit
+    encoding of chess/board/moves.py with the capture flag on kills.
+
+    Returns
+    ----
+        Two arrays of equal length with the board index and the encoded
+        move of every move, ordered by board, old square and new square.
+    """
+    boards = _check_boards(boards)
+    board_index, old_squares, new_squares = move_arrays(
+        destination_masks(boards, player)
+    )
+    # Moves never land on an ally, so every occupied new square is a kill
+    captures = boards.reshape(len(boards), N_SQUARES)[board_index, new_squares] != 0
+    flags = np.where(captures, CAPTURE, 0)
+    return board_index, encode_moves(old_squares, new_squares, flags)
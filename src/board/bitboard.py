@@ -0,0 +1,395 @@
+"""
+Bitboard representation of a chess position.
+
+Every square on the 8x8 board is mapped to one bit of a 64-bit integer:
+
+    square = x * 8 + y
+
+which is the same ordering as 'game_state.ravel()', where x is the column
+(a-h) and y is the row (1-8) of the board. A position is then described by
+one occupancy mask per piece number (see 'Engine.create_piece') and one
+occupancy mask per color.
+
+Move generation on bitboards mirrors the rules in 'Engine', so that
+'Engine.get_all_possible_actions' produces the same actions regardless
+of which position core is used.
+"""
+
+from typing import Literal, NamedTuple
+
+from src.pieces.rays import DIAGONAL_DIRECTIONS, STRAIGHT_DIRECTIONS, ray_table
+
+GRID_SIZE = 8
+FULL_BOARD = (1 << (GRID_SIZE * GRID_SIZE)) - 1
+
+# Piece types in the order of the piece numbers,
+# e.g. 1 and 7 are pawns, 2 and 8 are rooks etc.
+PAWN, ROOK, KNIGHT, BISHOP, QUEEN, KING = range(6)
+
+KNIGHT_OFFSETS = [
+    (-2, 1),
+    (-2, -1),
+    (2, 1),
+    (2, -1),
+    (1, 2),
+    (-1, 2),
+    (1, -2),
+    (-1, -2),
+]
+KING_OFFSETS = [(-1, 1), (0, 1), (1, 1), (-1, 0), (1, 0), (-1, -1), (0, -1), (1, -1)]
+
+# Rows where pawns are allowed to make a double jump
+PAWN_START_ROW = {"white": 1, "black": GRID_SIZE - 2}
+PAWN_DIRECTION = {"white": 1, "black": -1}
+
+
+def square_of(position: tuple) -> int:
+    """
+    Converts a board position (x, y) to its square index.
+    """
+    return position[0] * GRID_SIZE + position[1]
+
+
+def is_inside_grid(x: int, y: int) -> bool:
+    return 0 <= x < GRID_SIZE and 0 <= y < GRID_SIZE
+
+
+# Lookup tables from square index to position and bit.
+POSITIONS = tuple((x, y) for x in range(GRID_SIZE) for y in range(GRID_SIZE))
+BITS = tuple(1 << square for square in range(GRID_SIZE * GRID_SIZE))
+
+
+def _leaper_table(offsets: list[tuple]) -> tuple[int, ...]:
+    """
+    Precomputes the destination mask of a piece with fixed move offsets
+    (knight and king) for every square on the board.
+    """
+    table = []
+    for x, y in POSITIONS:
+        mask = 0
+        for dx, dy in offsets:
+            if is_inside_grid(x + dx, y + dy):
+                mask |= BITS[square_of((x + dx, y + dy))]
+        table.append(mask)
+    return tuple(table)
+
+
+KNIGHT_ATTACKS = _leaper_table(KNIGHT_OFFSETS)
+KING_ATTACKS = _leaper_table(KING_OFFSETS)
+# Squares that a pawn of each color kills on
+PAWN_ATTACKS = {
+    "white": _leaper_table([(-1, 1), (1, 1)]),
+    "black": _leaper_table([(-1, -1), (1, -1)]),
+}
+
+
+def color_of(piece_nr: int) -> Literal["white", "black"]:
+    return "white" if piece_nr < 7 else "black"
+
+
+def piece_type_of(piece_nr: int) -> int:
+    return (piece_nr - 1) % 6
+
+
+def positions_of(mask: int) -> list[tuple]:
+    """
+    Converts a bitboard mask to a list of positions,
+    ordered by square index.
+    """
+    positions = []
+    while mask:
+        lowest_bit = mask & -mask
+        positions.append(POSITIONS[lowest_bit.bit_length() - 1])
+        mask ^= lowest_bit
+    return positions
+
+
+def _ray_masks(direction: tuple) -> tuple[int, ...]:
+    """
+    Precomputes the mask of the ray in 'direction' for every square on the board.
+    """
+    table = ray_table(GRID_SIZE)
+    masks = []
+    for position in POSITIONS:
+        mask = 0
+        for ray_position in table[position][direction]:
+            mask |= BITS[square_of(ray_position)]
+        masks.append(mask)
+    return tuple(masks)
+
+
+def _rays(directions: tuple) -> tuple[tuple, ...]:
+    """
+    Pairs of ray masks and whether the ray runs towards higher square indices.
+    A ray running towards higher square indices is blocked by its lowest
+    occupied bit, otherwise by its highest occupied bit.
+    """
+    return tuple(
+        (_ray_masks(direction), direction[0] * GRID_SIZE + direction[1] > 0)
+        for direction in directions
+    )
+
+
+ROOK_RAYS = _rays(STRAIGHT_DIRECTIONS)
+BISHOP_RAYS = _rays(DIAGONAL_DIRECTIONS)
+QUEEN_RAYS = ROOK_RAYS + BISHOP_RAYS
+
+
+class Constraints(NamedTuple):
+    """
+    Constraints on the moves of a player, that keep its king out of check.
+
+    checkers: Squares of the enemies that check the king.
+    danger: Squares that the king is not allowed to move to.
+    targets: Squares that the other pieces have to move to,
+        which is every square if the king is not in check.
+    pins: Squares that a pinned piece is allowed to move to,
+        by the square of the pinned piece.
+    """
+
+    checkers: int
+    danger: int
+    targets: int
+    pins: dict[int, int]
+
+
+def _nearest(blockers: int, towards_higher: bool) -> int:
+    """
+    Square of the blocker that is nearest on a ray, see '_rays'.
+    """
+    if towards_higher:
+        return (blockers & -blockers).bit_length() - 1
+    return blockers.bit_length() - 1
+
+
+def sliding_moves(square: int, rays: tuple, occupied: int) -> int:
+    """
+    Computes the destination mask of a sliding piece from the precomputed rays.
+    Every ray stops at the first occupied square, which is included
+    in the mask (it may be an enemy to kill).
+    """
+    mask = 0
+    for ray_masks, towards_higher in rays:
+        ray = ray_masks[square]
+        blockers = ray & occupied
+        if blockers:
+            if towards_higher:
+                blocker = (blockers & -blockers).bit_length() - 1
+            else:
+                blocker = blockers.bit_length() - 1
+            # Cut off the part of the ray behind the blocker
+            ray ^= ray_masks[blocker]
+        mask |= ray
+    return mask
+
+
+class Bitboard:
+    """
+    Position core with one 64-bit occupancy mask per piece number
+    and one per color.
+    """
+
+    def __init__(self):
+        # Indexed by piece number, index 0 (empty tiles) is unused
+        self.boards = [0] * 13
+        self.occupancy = {"white": 0, "black": 0}
+
+    @classmethod
+    def from_placement(cls, placement: dict[tuple, int]) -> "Bitboard":
+        """
+        Creates a bitboard from the piece number of every occupied position,
+        see 'PieceTable.placement'.
+        """
+        bitboard = cls()
+        for position, piece_nr in placement.items():
+            bitboard.add(piece_nr=piece_nr, position=position)
+        return bitboard
+
+    @property
+    def occupied(self) -> int:
+        return self.occupancy["white"] | self.occupancy["black"]
+
+    def add(self, piece_nr: int, position: tuple) -> None:
+        bit = BITS[square_of(position)]
+        self.boards[piece_nr] |= bit
+        self.occupancy[color_of(piece_nr)] |= bit
+
+    def remove(self, piece_nr: int, position: tuple) -> None:
+        bit = BITS[square_of(position)]
+        self.boards[piece_nr] &= ~bit
+        self.occupancy[color_of(piece_nr)] &= ~bit
+
+    def move(self, piece_nr: int, old_position: tuple, new_position: tuple) -> None:
+        self.remove(piece_nr=piece_nr, position=old_position)
+        self.add(piece_nr=piece_nr, position=new_position)
+
+    def pawn_moves(self, square: int, color: Literal["white", "black"]) -> int:
+        """
+        Pawns move one step forward onto an empty square, two steps
+        from their starting row if both squares are empty,
+        and diagonally forward only to kill an enemy.
+        """
+        x, y = POSITIONS[square]
+        direction = PAWN_DIRECTION[color]
+        enemies = self.occupancy["black" if color == "white" else "white"]
+        empty = ~self.occupied
+        mask = 0
+
+        if is_inside_grid(x, y + direction):
+            forward = BITS[square + direction]
+            mask |= forward & empty
+            if mask and y == PAWN_START_ROW[color]:
+                mask |= BITS[square + 2 * direction] & empty
+
+        for dx in (-1, 1):
+            if is_inside_grid(x + dx, y + direction):
+                mask |= BITS[square + dx * GRID_SIZE + direction] & enemies
+        return mask
+
+    def pawn_reach(self, square: int, color: Literal["white", "black"]) -> int:
+        """
+        Squares that a pawn denies the enemy king. Just like 'Engine.king_rules',
+        this is both diagonals and the forward jumps that do not
+        land on an enemy.
+        """
+        x, y = POSITIONS[square]
+        direction = PAWN_DIRECTION[color]
+        enemies = self.occupancy["black" if color == "white" else "white"]
+        mask = 0
+        for dx in (-1, 1):
+            if is_inside_grid(x + dx, y + direction):
+                mask |= BITS[square + dx * GRID_SIZE + direction]
+
+        if is_inside_grid(x, y + direction):
+            forward = BITS[square + direction]
+            if y == PAWN_START_ROW[color]:
+                forward |= BITS[square + 2 * direction]
+            # Forward jumps are blocked if they hit an enemy
+            mask |= forward & ~enemies
+        return mask
+
+    def moves(self, piece_nr: int, position: tuple) -> int:
+        """
+        Destination mask of a piece, ignoring whether the king is safe.
+        """
+        square = square_of(position)
+        color = color_of(piece_nr)
+        piece_type = piece_type_of(piece_nr)
+        allies = self.occupancy[color]
+
+        if piece_type == PAWN:
+            return self.pawn_moves(square, color)
+        elif piece_type == KNIGHT:
+            mask = KNIGHT_ATTACKS[square]
+        elif piece_type == KING:
+            mask = KING_ATTACKS[square]
+        elif piece_type == ROOK:
+            mask = sliding_moves(square, ROOK_RAYS, self.occupied)
+        elif piece_type == BISHOP:
+            mask = sliding_moves(square, BISHOP_RAYS, self.occupied)
+        else:
+            mask = sliding_moves(square, QUEEN_RAYS, self.occupied)
+        return mask & ~allies
+
+    def king_danger(self, color: Literal["white", "black"]) -> int:
+        """
+        Squares where the king of 'color' is not allowed to move,
+        following the same definition as 'Engine.king_rules'.
+        """
+        enemy_color = "black" if color == "white" else "white"
+        offset = 0 if enemy_color == "white" else 6
+        danger = 0
+        for piece_type in range(6):
+            piece_nr = piece_type + 1 + offset
+            mask = self.boards[piece_nr]
+            while mask:
+                lowest_bit = mask & -mask
+                square = lowest_bit.bit_length() - 1
+                mask ^= lowest_bit
+                if piece_type == PAWN:
+                    danger |= self.pawn_reach(square, enemy_color)
+                elif piece_type == KING:
+                    danger |= KING_ATTACKS[square]
+                else:
+                    danger |= self.moves(piece_nr, POSITIONS[square])
+        return danger & FULL_BOARD
+
+    def attacks(self, color: Literal["white", "black"], occupied: int) -> int:
+        """
+        Squares where the pieces of 'color' would kill an enemy, including
+        squares of their allies. Sliding pieces are blocked by 'occupied'.
+        """
+        offset = 0 if color == "white" else 6
+        attacked = 0
+        for piece_type in range(6):
+            mask = self.boards[piece_type + 1 + offset]
+            while mask:
+                lowest_bit = mask & -mask
+                square = lowest_bit.bit_length() - 1
+                mask ^= lowest_bit
+                if piece_type == PAWN:
+                    attacked |= PAWN_ATTACKS[color][square]
+                elif piece_type == KNIGHT:
+                    attacked |= KNIGHT_ATTACKS[square]
+                elif piece_type == KING:
+                    attacked |= KING_ATTACKS[square]
+                elif piece_type == ROOK:
+                    attacked |= sliding_moves(square, ROOK_RAYS, occupied)
+                elif piece_type == BISHOP:
+                    attacked |= sliding_moves(square, BISHOP_RAYS, occupied)
+                else:
+                    attacked |= sliding_moves(square, QUEEN_RAYS, occupied)
+        return attacked
+
+    def constraints(self, color: Literal["white", "black"]) -> Constraints | None:
+        """
+        Pins and checks on the king of 'color', computed from the king outwards.
+        Returns None if the player has no king.
+        """
+        offset = 0 if color == "white" else 6
+        king = self.boards[KING + 1 + offset]
+        if not king:
+            return None
+
+        enemy_color = "black" if color == "white" else "white"
+        enemy_offset = 6 - offset
+        allies = self.occupancy[color]
+        occupied = self.occupied
+        square = king.bit_length() - 1
+
+        # The king may not step back along the ray of a sliding piece,
+        # so the attacks are computed as if the king was not on the board
+        danger = self.attacks(enemy_color, occupied & ~king)
+
+        checkers = (
+            PAWN_ATTACKS[color][square] & self.boards[PAWN + 1 + enemy_offset]
+        ) | (KNIGHT_ATTACKS[square] & self.boards[KNIGHT + 1 + enemy_offset])
+        targets = checkers
+        pins = {}
+        enemy_queens = self.boards[QUEEN + 1 + enemy_offset]
+        for rays, sliders in (
+            (ROOK_RAYS, self.boards[ROOK + 1 + enemy_offset] | enemy_queens),
+            (BISHOP_RAYS, self.boards[BISHOP + 1 + enemy_offset] | enemy_queens),
+        ):
+            for ray_masks, towards_higher in rays:
+                blockers = ray_masks[square] & occupied
+                if not blockers:
+                    continue
+                first = _nearest(blockers, towards_higher)
+                if BITS[first] & sliders:
+                    checkers |= BITS[first]
+                    targets |= ray_masks[square] ^ ray_masks[first]
+                elif BITS[first] & allies:
+                    # An ally is pinned if an enemy slider is right behind it
+                    blockers = ray_masks[first] & occupied
+                    if blockers:
+                        second = _nearest(blockers, towards_higher)
+                        if BITS[second] & sliders:
+                            pins[first] = ray_masks[square] ^ ray_masks[second]
+
+        if not checkers:
+            targets = FULL_BOARD
+        elif checkers & (checkers - 1):
+            # Only the king can answer a check by two pieces
+            targets = 0
+        return Constraints(checkers=checkers, danger=danger, targets=targets, pins=pins)
@@ -1,9 +1,26 @@
-from typing import TYPE_CHECKING, Literal, Union
+from array import array
+from collections import Counter
+from collections.abc import Iterator, KeysView
+from typing import TYPE_CHECKING, Literal, NamedTuple, Union
 
 import numpy as np
 
+from src.board.bitboard import (
+    BITS,
+    FULL_BOARD,
+    KING_ATTACKS,
+    Bitboard,
+    Constraints,
+    color_of,
+    positions_of,
+    square_of,
+)
+from src.board.fen import format_fen, parse_fen
 from src.board.files import read_yaml
-from src.pieces import Bishop, Color, King, Knight, Pawn, Queen, Rook
+from src.board.moves import CAPTURE, decode_move, encode_move, new_move_array
+from src.board.zobrist import BLACK_TO_MOVE, hash_position, piece_key
+from src.pieces import Bishop, Color, King, Knight, Pawn, PieceTable, Queen, Rook
+from src.pieces.rays import DIAGONAL_DIRECTIONS, STRAIGHT_DIRECTIONS, ray_table
 
 if TYPE_CHECKING:
     from nptyping import NDArray
@@ -11,18 +28,161 @@ if TYPE_CHECKING:
     from src.pieces.abstract import AbstractChessPiece
 
 
+# Number of moves (of both players) without a kill or pawn move
+# before the game is a draw by the fifty-move rule
+FIFTY_MOVE_LIMIT = 100
+# Number of times a position occurs before the game is a draw by repetition
+REPETITION_LIMIT = 3
+
+# Positions where pawns are allowed to make a double jump
+PAWN_START_POSITIONS = {
+    "white": frozenset((x, 1) for x in range(8)),
+    "black": frozenset((x, 6) for x in range(8)),
+}
+
+
 class GameError(Exception):
     pass
 
 
+class MoveRecord(NamedTuple):
+    """
+    Record of a move on the undo stack of the engine,
+    with everything needed to take back the move.
+    """
+
+    player: Literal["white", "black"]
+    piece: "AbstractChessPiece"
+    old_position: tuple
+    new_position: tuple
+    killed: Union["AbstractChessPiece", None]
+    side_to_move: Literal["white", "black"]
+    halfmove_clock: int
+    fullmove_number: int
+    position_hash: int
+
+
+class AlivePieces:
+    """
+    Read-only view on the alive pieces of a color, see 'Engine._alive_pieces'.
+    Killed pieces keep their entry as None and are skipped.
+    """
+
+    __slots__ = ("_pieces",)
+
+    def __init__(self, pieces: dict[int, Union["AbstractChessPiece", None]]):
+        self._pieces = pieces
+
+    def __iter__(self) -> Iterator["AbstractChessPiece"]:
+        return (piece for piece in self._pieces.values() if piece is not None)
+
+    def __len__(self) -> int:
+        return sum(piece is not None for piece in self._pieces.values())
+
+
 class Engine:
+    """
+    Chess engine that keeps track of the pieces in game
+    and applies the game rules.
+
+    Parameters
+    ----
+    config_path: str
+        Path to the game configuration-file.
+    use_bitboard: bool
+        If True, move generation runs on the bitboard position core
+        instead of scanning the lists of pieces.
+        See: chess/board/bitboard.py
+    """
+
     opponent_of = {"white": "black", "black": "white"}
 
-    def __init__(self, config_path: str):
+    def __init__(self, config_path: str, use_bitboard: bool = False):
+        self.config_path = config_path
         self.config = read_yaml(config_path)
         self.representation = self.config["PIECE_REPRESENTATION"]
         self.start_state = self.config["GAME_START"]
+        self.use_bitboard = use_bitboard
         self.pieces = {}
+        self.bitboard = Bitboard()
+
+        # Storage of the pieces in game, the pieces are views on its slots.
+        # See: chess/pieces/piece_table.py
+        self.piece_table = PieceTable()
+
+        # Player to move and move counters, as in FEN
+        self.side_to_move = "white"
+        self.halfmove_clock = 0
+        self.fullmove_number = 1
+
+        # Zobrist hash of the current position, see: chess/board/zobrist.py
+        self.position_hash = hash_position(placement={}, side_to_move="white")
+        # Number of times each position hash occurred in game
+        self._position_counts = Counter([self.position_hash])
+
+        # Indexes for looking up pieces by instance ID (per color),
+        # the alive pieces (per color) and alive pieces by position (per color).
+        # These are updated incrementally when pieces move or get killed.
+        # A killed piece keeps its entry in the alive pieces as None,
+        # so that taking back the kill restores it in place.
+        self._pieces_by_id = {"white": {}, "black": {}}
+        self._alive_pieces = {"white": {}, "black": {}}
+        self._occupied = {"white": {}, "black": {}}
+
+        # Caches of the current position.
+        # Cleared whenever the position changes.
+        self._moves_cache = {}
+        self._king_danger_cache = {}
+        self._constraints_cache = {}
+
+        # Moves made in game, see 'make_move' and 'unmake_move'
+        self._undo_stack = []
+
+    def _invalidate_cache(self) -> None:
+        """
+        Clears everything that is computed from the current position.
+        Must be called whenever pieces are moved, killed or spawned.
+        """
+        self._moves_cache = {}
+        self._king_danger_cache = {}
+        self._constraints_cache = {}
+
+    def _set_pieces(
+        self,
+        pieces: dict[str, list],
+        side_to_move: Literal["white", "black"] = "white",
+        halfmove_clock: int = 0,
+        fullmove_number: int = 1,
+    ) -> None:
+        """
+        Sets the pieces in game and rebuilds the position core
+        and the piece indexes from them.
+        """
+        self.side_to_move = side_to_move
+        self.halfmove_clock = halfmove_clock
+        self.fullmove_number = fullmove_number
+        self.pieces = pieces
+        placement = self._get_placement()
+        self.bitboard = Bitboard.from_placement(placement)
+        self._pieces_by_id = {"white": {}, "black": {}}
+        self._alive_pieces = {"white": {}, "black": {}}
+        self._occupied = {"white": {}, "black": {}}
+        for color_pieces in pieces.values():
+            for piece in color_pieces:
+                self._index_piece(piece)
+        self.position_hash = hash_position(
+            placement=placement, side_to_move=side_to_move
+        )
+        self._position_counts = Counter([self.position_hash])
+        self._undo_stack = []
+        self._invalidate_cache()
+
+    def _index_piece(self, piece: "AbstractChessPiece") -> None:
+        color = piece.color.name
+        self._pieces_by_id[color][piece.id] = piece
+        if piece.status:
+            self._alive_pieces[color][piece.id] = piece
+            self._occupied[color][piece.position] = piece
 
     def start_game(self) -> "NDArray":
         """
@@ -39,7 +199,8 @@ class Engine:
 
         # Create pieces in game and save in dictionary
         # for later monitoring of each pieces position
-        self.pieces = self.initiate_pieces(board=game_state)
+        self.piece_table = PieceTable()
+        self._set_pieces(self.initiate_pieces(board=game_state, table=self.piece_table))
 
         # Starting game
         return game_state
@@ -57,12 +218,58 @@ class Engine:
 
         assert game_state.shape[0] == 8, "Board has to have 8 rows"
         assert game_state.shape[1] == 8, "Board has to have 8 columns"
-        self.pieces = self.initiate_pieces(board=game_state)
+        self.piece_table = PieceTable()
+        self._set_pieces(self.initiate_pieces(board=game_state, table=self.piece_table))
 
         return game_state
 
+    def load_fen(self, fen: str) -> "NDArray":
+        """
+        Initiates chess board from a FEN string, including the player
+        to move and the move counters. For example the starting position:
+            rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1
+        See: chess/board/fen.py
+        """
+        placement, side_to_move, halfmove_clock, fullmove_number = parse_fen(fen)
+
+        # Create pieces directly from the string
+        game_state = np.zeros(shape=(8, 8), dtype=int)
+        pieces = {"white": [], "black": []}
+        self.piece_table = PieceTable()
+        for piece_nr, position in placement:
+            created_piece = self.create_piece(
+                piece_nr=piece_nr, position=position, table=self.piece_table
+            )
+            pieces[color_of(piece_nr)].append(created_piece)
+            game_state[position] = piece_nr
+
+        self._set_pieces(
+            pieces,
+            side_to_move=side_to_move,
+            halfmove_clock=halfmove_clock,
+            fullmove_number=fullmove_number,
+        )
+        return game_state
+
+    def _get_placement(self) -> dict[tuple, int]:
+        """
+        Collect the piece number of every occupied position.
+        """
+        return self.piece_table.placement()
+
+    def to_fen(self) -> str:
+        """
+        Returns the current position as a FEN string.
+        """
+        return format_fen(
+            placement=self._get_placement(),
+            side_to_move=self.side_to_move,
+            halfmove_clock=self.halfmove_clock,
+            fullmove_number=self.fullmove_number,
+        )
+
     def create_piece(
-        self, piece_nr: int, position: tuple
+        self, piece_nr: int, position: tuple, table: PieceTable | None = None
     ) -> Union["AbstractChessPiece", None]:
         """
         Method for creating a chess piece.
@@ -87,8 +294,12 @@ class Engine:
 
         position: tuple
             A tuple where the chess piece is desired to be spawned.
+
+        table: PieceTable, optional
+            The piece table to store the chess piece in.
+            If not given, the chess piece gets a table of its own.
         """
-        kwargs = {"position": position, "piece_nr": piece_nr}
+        kwargs = {"position": position, "piece_nr": piece_nr, "table": table}
         if (piece_nr < 7) and (piece_nr > 0):
             kwargs["color"] = Color.white
         elif (piece_nr >= 7) and (piece_nr <= 12):
@@ -109,11 +320,21 @@ class Engine:
         else:
             return
 
-    def initiate_pieces(self, board: "NDArray") -> dict[str, list]:
+    def initiate_pieces(
+        self, board: "NDArray", table: PieceTable | None = None
+    ) -> dict[str, list]:
         """
         Method used to initiate and keep track of position
         of each piece in the game.
 
+        Parameters
+        ---
+        board: NDArray
+            Game state with the piece number of every position.
+
+        table: PieceTable, optional
+            The piece table to store the chess pieces in, see 'create_piece'.
+
         Returns a dictionary with white and black pieces:
             {
                 'white': [...],
@@ -122,25 +343,27 @@ class Engine:
         """
         black_pieces = []
         white_pieces = []
-        nrows, ncols = board.shape
 
-        # Loop through all entries in array to create pieces
-        for i in range(nrows):
-            for j in range(ncols):
-                created_piece = self.create_piece(piece_nr=board[i, j], position=(i, j))
+        # Loop through all occupied entries in array to create pieces
+        for i, j in np.argwhere(board).tolist():
+            created_piece = self.create_piece(
+                piece_nr=int(board[i, j]), position=(i, j), table=table
+            )
 
-                # If piece is created, distribute piece
-                # to respective color group
-                if created_piece:
-                    if created_piece.color.name == "white":
-                        white_pieces.append(created_piece)
-                    elif created_piece.color.name == "black":
-                        black_pieces.append(created_piece)
+            # If piece is created, distribute piece
+            # to respective color group
+            if created_piece:
+                if created_piece.color.name == "white":
+                    white_pieces.append(created_piece)
+                elif created_piece.color.name == "black":
+                    black_pieces.append(created_piece)
 
         return {"white": white_pieces, "black": black_pieces}
 
     def spawn_piece(self, piece_nr: int, position: tuple) -> None:
-        created_piece = self.create_piece(piece_nr=piece_nr, position=position)
+        created_piece = self.create_piece(
+            piece_nr=piece_nr, position=position, table=self.piece_table
+        )
 
         if (piece_nr < 7) and (piece_nr > 0):
             self.pieces["white"].append(created_piece)
@@ -149,6 +372,14 @@ class Engine:
         else:
             raise ValueError("Nothing was added")
 
+        self.bitboard.add(piece_nr=piece_nr, position=position)
+        self._index_piece(created_piece)
+        self.position_hash ^= piece_key(piece_nr=piece_nr, position=position)
+        # Setting up a position starts its history anew, and the moves
+        # before it can no longer be taken back
+        self._position_counts = Counter([self.position_hash])
+        self._undo_stack = []
+        self._invalidate_cache()
         name = created_piece.name
         color = created_piece.color.name
         position = created_piece.position
@@ -214,45 +445,34 @@ class Engine:
             return [p for p in trajectory if p != attacker.position]
         return []
 
+    def _get_king(self, player: Literal["white", "black"]) -> "AbstractChessPiece":
+        if player == "black":
+            return self.get_black_king()[-1]
+        elif player == "white":
+            return self.get_white_king()[-1]
+
     def _threats_to_the_king(
         self, player: Literal["white", "black"]
     ) -> list["AbstractChessPiece"]:
         """
         Method for retrieving all pieces that are a threat to
         the king, e.g., enemy units that in one turn can kill the king.
-        NOTE: In chess there is only 1 threat to the king at a time.
 
         Returns a list of chess pieces that are threats.
         """
-        threats_id = []
-        opponent = self.opponent_of[player]
-
-        # Get king position
-        if player == "black":
-            king = self.get_black_king()[-1]
-        elif player == "white":
-            king = self.get_white_king()[-1]
-
-        king_position = king.position
-
-        # Get all possible moves for opponent player
-        opponent_actions = self.get_all_possible_actions(opponent)
-
-        # If opponent moves overlap with king position,
-        # then there is a check
-        for _, pieces in opponent_actions.items():
-            for piece in pieces:
-                if king_position in piece.get("actions"):
-                    threats_id.append(piece.get("id"))
-
-        # Get chess pieces from their IDs
-        threats_piece = []
-        for threat in threats_id:
-            threats_piece.append(self.get_piece_by_id(id=threat, player=opponent))
-
-        return threats_piece
+        constraints = self._get_constraints(color=player)
+        if constraints is None:
+            return []
+        occupied = self._occupied[self.opponent_of[player]]
+        return [occupied[position] for position in positions_of(constraints.checkers)]
 
     def _player_is_in_check(self, player: Literal["white", "black"]) -> bool:
+        """
+        Same as 'is_in_check'.
+        """
+        return self.is_in_check(player)
+
+    def is_in_check(self, player: Literal["white", "black"]) -> bool:
         """
         Method for evaluating whether player is in check.
 
@@ -261,8 +481,10 @@ class Engine:
             True, if player is in check.
             False, otherwise.
         """
-        threats = self._threats_to_the_king(player)
-        return len(threats) > 0
+        constraints = self._get_constraints(color=player)
+        if constraints is None:
+            return False
+        return constraints.checkers != 0
 
     def _king_cannot_move(self, player: Literal["white", "black"]) -> bool:
         """
@@ -273,14 +495,11 @@ class Engine:
             True,  if king cannot move.
             False, if king can move.
         """
-        # Get king position
-        if player == "black":
-            king = self.get_black_king()[-1]
-        elif player == "white":
-            king = self.get_white_king()[-1]
-
-        moves = self.get_possible_actions(id=king.id, color=player)
-
+        moves = self._legal_king_moves(
+            position=self._get_king(player).position,
+            color=player,
+            constraints=self._get_constraints(color=player),
+        )
         return len(moves) == 0
 
     def _cannot_protect_king(self, player: Literal["white", "black"]) -> bool:
@@ -293,61 +512,78 @@ class Engine:
             True, if king cannot be protected.
             False, if king can be protected.
         """
-        threats = self._threats_to_the_king(player)
-
         # If no threats, there is no need to protect
         # hence we return False
-        if len(threats) == 0:
+        if not self._threats_to_the_king(player):
             return False
 
-        # The assumption is that there can be only 1 threat
-        # at a time in chess.
-        if len(threats) > 1:
-            # TODO: Logging of errors
-            raise GameError(
-                "Unknown game state. More than one attacking king at the same time."
-            )
+        # In check, the only legal moves of other units
+        # are those that kill the threat or block the hit
+        return all(piece.name == "King" for piece, _ in self.iter_moves(player))
 
-        # Retrieve information about the threat
-        threat = threats[-1]
-        threat_position = threat.position
+    def is_checkmate(self, player: Literal["white", "black"]) -> bool:
+        """
+        Method for evaluating game for checkmate:
+        player is in check and has no legal move.
+        """
+        return self.is_in_check(player) and not self.has_legal_move(player)
 
-        ally_actions = self.get_all_possible_actions(player=player)
-        if player == "white":
-            king = self.get_white_king()[0]
-        else:
-            king = self.get_black_king()[0]
+    def is_stalemate(self, player: Literal["white", "black"]) -> bool:
+        """
+        Method for evaluating game for stalemate:
+        player is not in check, but has no legal move.
+        """
+        return not self.is_in_check(player) and not self.has_legal_move(player)
 
-        attack_trajectory = set(self.attack_trajectory(attacker=threat, target=king))
-        for _, pieces in ally_actions.items():
-            for piece in pieces:
-                ally_piece_actions = set(piece.get("actions"))
-                # See whether an ally unit can kill the threat.
-                if threat_position in ally_piece_actions:
-                    return False
+    def repetition_count(self) -> int:
+        """
+        Number of times the current position occurred in game,
+        including now. Positions are compared by their hash.
+        """
+        return self._position_counts[self.position_hash]
 
-                # See whether ally unit can block the attack.
-                if len(attack_trajectory.intersection(ally_piece_actions)) > 0:
-                    return False
-        return True
+    def is_threefold_repetition(self) -> bool:
+        return self.repetition_count() >= REPETITION_LIMIT
 
-    def is_checkmate(self, player: Literal["white", "black"]):
+    def is_fifty_move_rule(self) -> bool:
+        return self.halfmove_clock >= FIFTY_MOVE_LIMIT
+
+    def draw_reason(self, player: Literal["white", "black"]) -> str | None:
         """
-        Method for evaluating game for checkmate.
+        Reason that the game is a draw with player to move,
+        or None if the game is not a draw.
+        A checkmate on the last move of the fifty-move rule is not a draw,
+        so checkmate has to be evaluated first.
+
+        Returns
+        ----
+            'threefold repetition', 'fifty-move rule', 'stalemate' or None
         """
-        is_in_check = self._player_is_in_check(player)
-        king_cannot_move = self._king_cannot_move(player)
-        cannot_protect_king = self._cannot_protect_king(player)
-        return is_in_check and king_cannot_move and cannot_protect_king
+        if self.is_threefold_repetition():
+            return "threefold repetition"
+        if self.is_fifty_move_rule():
+            return "fifty-move rule"
+        if self.is_stalemate(player):
+            return "stalemate"
+        return None
 
-    def handle_game(
-        self,
-        player: Literal["white", "black"],
-        player_input: dict,
-        game_state: "NDArray",
-    ) -> "NDArray":
+    def make_move(
+        self, player: Literal["white", "black"], player_input: dict
+    ) -> MoveRecord:
         """
-        Method for making updates according to player input.
+        Moves a piece according to player input and kills the enemy
+        on the new position, if any.
+        The move is recorded on the undo stack, so it can be taken back
+        with 'unmake_move'.
+
+        Parameters
+        ----
+        player: str
+            possible values are 'white' or 'black'
+        player_input: dict
+            Dictionary containing two keys:
+                id: ID of chess piece
+                action: New position for specififed chess piece
         """
         piece_id = player_input.get("id")
         action = player_input.get("action")
@@ -355,28 +591,128 @@ class Engine:
         old_position = piece.position
         piece_nr = piece.piece_nr
 
+        # Kill enemy piece if new position hits an enemy
+        opponent = self.opponent_of[player]
+        enemy_piece = self._occupied[opponent].pop(action, None)
+        if enemy_piece is not None:
+            enemy_piece.kill()
+            self._alive_pieces[opponent][enemy_piece.id] = None
+            self.bitboard.remove(piece_nr=enemy_piece.piece_nr, position=action)
+
         # Update piece position in the piece object
         piece.set_position(position=action)
+        self.bitboard.move(
+            piece_nr=piece_nr, old_position=old_position, new_position=action
+        )
+        del self._occupied[player][old_position]
+        self._occupied[player][action] = piece
+        self._invalidate_cache()
+
+        record = MoveRecord(
+            player=player,
+            piece=piece,
+            old_position=old_position,
+            new_position=action,
+            killed=enemy_piece,
+            side_to_move=self.side_to_move,
+            halfmove_clock=self.halfmove_clock,
+            fullmove_number=self.fullmove_number,
+            position_hash=self.position_hash,
+        )
+        self._undo_stack.append(record)
+
+        # Update hash of the position
+        self.position_hash ^= piece_key(piece_nr=piece_nr, position=old_position)
+        self.position_hash ^= piece_key(piece_nr=piece_nr, position=action)
+        if enemy_piece is not None:
+            self.position_hash ^= piece_key(
+                piece_nr=enemy_piece.piece_nr, position=action
+            )
+        if self.side_to_move != opponent:
+            self.position_hash ^= BLACK_TO_MOVE
 
-        # Update board
-        game_state[old_position] = 0  # empty old position
-        game_state[action] = piece_nr  # move chess piece to new position
+        # Update player to move and move counters
+        if enemy_piece is not None or piece.name == "Pawn":
+            self.halfmove_clock = 0
+        else:
+            self.halfmove_clock += 1
+        if player == "black":
+            self.fullmove_number += 1
+        self.side_to_move = opponent
+        self._position_counts[self.position_hash] += 1
+
+        return record
+
+    def unmake_move(self) -> MoveRecord:
+        """
+        Takes back the last move made with 'make_move',
+        and revives the enemy that was killed by it.
+        Note that the game state array of 'handle_game' is not restored.
+        """
+        if not self._undo_stack:
+            raise GameError("There are no moves to take back.")
+
+        record = self._undo_stack.pop()
+        player = record.player
+        piece = record.piece
+
+        self._position_counts[self.position_hash] -= 1
+        if not self._position_counts[self.position_hash]:
+            del self._position_counts[self.position_hash]
+        self.side_to_move = record.side_to_move
+        self.halfmove_clock = record.halfmove_clock
+        self.fullmove_number = record.fullmove_number
+        self.position_hash = record.position_hash
+
+        # Move piece back to its old position
+        piece.set_position(position=record.old_position)
+        self.bitboard.move(
+            piece_nr=piece.piece_nr,
+            old_position=record.new_position,
+            new_position=record.old_position,
+        )
+        del self._occupied[player][record.new_position]
+        self._occupied[player][record.old_position] = piece
+
+        # Revive the killed enemy
+        enemy_piece = record.killed
+        if enemy_piece is not None:
+            opponent = self.opponent_of[player]
+            enemy_piece.revive()
+            self._alive_pieces[opponent][enemy_piece.id] = enemy_piece
+            self._occupied[opponent][record.new_position] = enemy_piece
+            self.bitboard.add(
+                piece_nr=enemy_piece.piece_nr, position=record.new_position
+            )
 
-        # Kill enemy piece if new position hits an enemy
-        enemy_pieces = [
-            piece for piece in self.pieces.get(self.opponent_of[player]) if piece.status
-        ]
+        self._invalidate_cache()
+        return record
+
+    def handle_game(
+        self,
+        player: Literal["white", "black"],
+        player_input: dict,
+        game_state: "NDArray",
+    ) -> "NDArray":
+        """
+        Method for making updates according to player input.
+        """
+        record = self.make_move(player=player, player_input=player_input)
 
-        for enemy_piece in enemy_pieces:
-            if enemy_piece.position == action:
-                # if true then kill enemy and update board
-                enemy_piece.kill()
+        # Update board
+        game_state[record.old_position] = 0  # empty old position
+        # move chess piece to new position
+        game_state[record.new_position] = record.piece.piece_nr
 
         return game_state
 
-    def _get_all_pieces_by_color(self, color: Literal["white", "black"]):
+    def _get_all_pieces_by_color(
+        self, color: Literal["white", "black"]
+    ) -> "AlivePieces":
         """
-        Collect all alive pieces by color
+        Collect all alive pieces by color.
+        Returns a read-only view that follows the game,
+        so it must not be iterated while moves are handled.
 
         Parameters:
         ---
@@ -384,7 +720,7 @@ class Engine:
             The color of the chess pieces to retrieve
 
         """
-        return [piece for piece in self.pieces.get(color) if piece.status]
+        return AlivePieces(self._alive_pieces[color])
 
     def _get_enemy_pieces(self, color: Literal["white", "black"]):
         """
@@ -410,11 +746,13 @@ class Engine:
         """
         return self._get_all_pieces_by_color(color=color)
 
-    def _get_positions_by_color(self, color: Literal["white", "black"]) -> list[tuple]:
+    def _get_positions_by_color(
+        self, color: Literal["white", "black"]
+    ) -> KeysView[tuple]:
         """
         Collect all positions of chess pieces by color.
         This method is different from '_get_all_pieces_by_color' as
-        it only returns a list of positions.
+        it only returns the positions, as a read-only set-like view.
 
         Parameters:
         ---
@@ -422,7 +760,7 @@ class Engine:
             The color of the chess pieces to retrieve
 
         """
-        return [piece.position for piece in self.pieces.get(color) if piece.status]
+        return self._occupied[color].keys()
 
     def _get_ally_positions(self, color: Literal["white", "black"]):
         """
@@ -451,9 +789,15 @@ class Engine:
     def apply_game_rules(self, piece: type["AbstractChessPiece"]) -> list:
         """
         Method for applying game rules based on piece type.
+        The moves are cached until the position changes.
         """
+        cached_moves = self._moves_cache.get(piece.id)
+        if cached_moves is not None:
+            return list(cached_moves)
 
-        if piece.name == "Pawn":
+        if self.use_bitboard:
+            moves = self.bitboard_rules(piece=piece)
+        elif piece.name == "Pawn":
             moves = self.pawn_rules(piece=piece)
         elif piece.name == "Rook":
             moves = self.rook_rules(piece=piece)
@@ -468,7 +812,18 @@ class Engine:
         else:
             raise ValueError(f"Unknown chess piece [{piece.name}] used.")
 
-        return moves
+        self._moves_cache[piece.id] = moves
+        return list(moves)
+
+    def bitboard_rules(self, piece: type["AbstractChessPiece"]) -> list:
+        """
+        Method for applying game rules on the bitboard position core.
+        Gives the same moves as the rules of each piece type.
+        """
+        moves = self.bitboard.moves(piece_nr=piece.piece_nr, position=piece.position)
+        if piece.name == "King":
+            moves &= ~self.bitboard.king_danger(color=piece.color.name)
+        return positions_of(moves)
 
     def get_piece_by_id(
         self, id: int, player: Literal["white", "black"]
@@ -483,17 +838,29 @@ class Engine:
         player: str
             possible values are 'white' or 'black'
         """
-        player_pieces = self.pieces.get(player)
-
-        piece = [piece for piece in player_pieces if piece.id == id]
+        piece = self._pieces_by_id[player].get(id)
 
-        if len(piece) == 0:
+        if piece is None:
             raise ValueError(f"ID [{id}] does not exist")
 
-        if len(piece) > 1:
-            raise ValueError(f"Two or more instances has same id [{id}]")
+        return piece
+
+    def get_piece_by_position(
+        self, position: tuple
+    ) -> Union["AbstractChessPiece", None]:
+        """
+        Get alive piece in game standing on position.
+        Returns None if the position is empty.
 
-        return piece[0]
+        Parameters
+        ----
+        position: tuple
+            the position on the board, for example (0, 1)
+        """
+        for occupied in self._occupied.values():
+            if position in occupied:
+                return occupied[position]
+        return None
 
     def get_possible_actions(
         self, id: int, color: Literal["white", "black"]
@@ -566,10 +933,9 @@ class Engine:
         for piece in player_pieces:
             # Create information dict
             name = piece.name
-            color = piece.color.name
             piece_id = piece.id
             piece_info = {
-                "actions": self.get_possible_actions(id=piece_id, color=color),
+                "actions": self.apply_game_rules(piece),
                 "id": piece_id,
                 "position": piece.position,
                 "piece_nr": piece.piece_nr,
@@ -584,6 +950,153 @@ class Engine:
 
         return all_piece_actions
 
+    def get_all_legal_actions(
+        self,
+        player: Literal["white", "black"],
+    ) -> dict[str, list]:
+        """
+        Get the actions of all pieces that belong to the desired player,
+        that do not leave the king of the player in check.
+        The actions are in the same format as 'get_all_possible_actions'.
+
+        Pinned pieces and the answers to a check are computed up front
+        from the king, see 'Bitboard.constraints', so the actions do not
+        have to be made and taken back to test them.
+        The moves of the king are the squares next to it that no enemy
+        attacks, instead of the moves of 'king_rules'.
+
+        Parameters
+        ----
+        player, optional 'white' or 'black'
+            Determines which player to get all legal actions.
+        """
+        all_piece_actions = self.get_all_possible_actions(player=player)
+        constraints = self._get_constraints(color=player)
+        if constraints is None:
+            return all_piece_actions
+
+        for name, pieces in all_piece_actions.items():
+            for piece_info in pieces:
+                if name == "King":
+                    piece_info["actions"] = self._legal_king_moves(
+                        position=piece_info["position"],
+                        color=player,
+                        constraints=constraints,
+                    )
+                    continue
+
+                allowed = self._allowed_squares(
+                    position=piece_info["position"], constraints=constraints
+                )
+                piece_info["actions"] = [
+                    action
+                    for action in piece_info["actions"]
+                    if BITS[square_of(action)] & allowed
+                ]
+
+        return all_piece_actions
+
+    def _get_constraints(self, color: Literal["white", "black"]) -> Constraints | None:
+        """
+        Pins and checks on the king of 'color', see 'Bitboard.constraints'.
+        Cached until the position changes.
+        """
+        if color not in self._constraints_cache:
+            self._constraints_cache[color] = self.bitboard.constraints(color=color)
+        return self._constraints_cache[color]
+
+    def _allowed_squares(self, position: tuple, constraints: Constraints | None) -> int:
+        """
+        Mask of the squares that a piece other than the king is allowed
+        to move to, without leaving its king in check.
+        """
+        if constraints is None:
+            return FULL_BOARD
+        return constraints.targets & constraints.pins.get(
+            square_of(position), FULL_BOARD
+        )
+
+    def _legal_king_moves(
+        self,
+        position: tuple,
+        color: Literal["white", "black"],
+        constraints: Constraints,
+    ) -> list[tuple]:
+        """
+        Legal moves of the king of color: the squares next to it that are
+        neither taken by an ally nor attacked by an enemy.
+        Unlike 'king_rules', the squares in front of an enemy pawn
+        are not attacked by the pawn.
+        """
+        moves = KING_ATTACKS[square_of(position)]
+        moves &= ~self.bitboard.occupancy[color] & ~constraints.danger
+        return positions_of(moves)
+
+    def iter_moves(
+        self, player: Literal["white", "black"]
+    ) -> Iterator[tuple["AbstractChessPiece", tuple]]:
+        """
+        Lazily generates the legal moves of player as (piece, new_position)
+        pairs, one piece at a time. Stopping early skips the move generation
+        of the remaining pieces.
+
+        Parameters
+        ----
+        player, optional 'white' or 'black'
+            Determines which player to generate the moves of.
+        """
+        constraints = self._get_constraints(color=player)
+        for piece in self._get_ally_pieces(color=player):
+            if piece.name == "King" and constraints is not None:
+                for action in self._legal_king_moves(
+                    position=piece.position, color=player, constraints=constraints
+                ):
+                    yield piece, action
+                continue
+
+            allowed = self._allowed_squares(
+                position=piece.position, constraints=constraints
+            )
+            if not allowed:
+                continue
+            for action in self.apply_game_rules(piece):
+                if BITS[square_of(action)] & allowed:
+                    yield piece, action
+
+    def has_legal_move(self, player: Literal["white", "black"]) -> bool:
+        """
+        Whether player has at least one legal move.
+        Stops at the first legal move found, see 'iter_moves'.
+        """
+        return next(self.iter_moves(player=player), None) is not None
+
+    def get_move_array(self, player: Literal["white", "black"]) -> array:
+        """
+        Legal moves of player encoded in 16 bits each,
+        with the capture flag on kills, see: chess/board/moves.py
+
+        Parameters
+        ----
+        player, optional 'white' or 'black'
+            Determines which player to get the moves of.
+        """
+        enemies = self.bitboard.occupancy[self.opponent_of[player]]
+        moves = new_move_array()
+        for piece, action in self.iter_moves(player=player):
+            flags = CAPTURE if BITS[square_of(action)] & enemies else 0
+            moves.append(encode_move(piece.position, action, flags))
+        return moves
+
+    def get_player_input(self, move: int, player: Literal["white", "black"]) -> dict:
+        """
+        Converts an encoded move of player to the input of 'make_move'.
+        """
+        old_position, new_position = decode_move(move)
+        piece = self._occupied[player].get(old_position)
+        if piece is None:
+            raise ValueError(f"No piece of [{player}] on position [{old_position}]")
+        return {"id": piece.id, "action": new_position}
+
     def _get_pieces(self, name: str, pieces: list):
         """
         Method to filter on list of pieces
@@ -668,37 +1181,41 @@ class Engine:
         )
         return not_walk_through_allies and not_walk_through_enemies
 
+    def _walk_rays(
+        self,
+        start_position: tuple,
+        directions: tuple,
+        piece: type["AbstractChessPiece"],
+    ) -> list:
+        """
+        Walks the precomputed rays from the start position in the given
+        directions. A ray ends before an ally or on an enemy.
+        """
+        rays = ray_table(piece.grid_size)[start_position]
+        ally_positions = self._get_ally_positions(color=piece.color.name)
+        enemy_positions = self._get_enemy_positions(color=piece.color.name)
+        output = []
+        for direction in directions:
+            for move in rays[direction]:
+                if move in ally_positions:
+                    break
+                output.append(move)
+                if move in enemy_positions:
+                    break
+        return output
+
     def handle_blocked_straight_path(
         self, start_position: tuple, piece: type["AbstractChessPiece"]
     ) -> list:
         """
         Removes moves where allies or enemies are blocking the straight path
         """
-        moves = piece.get_applied_moves()
-        output = []
-
-        vertical_moves = self.get_vertical_moves(
-            start_position=start_position, moves=moves
-        )
-        horizontal_moves = self.get_horizontal_moves(
-            start_position=start_position, moves=moves
+        return self._walk_rays(
+            start_position=start_position,
+            directions=STRAIGHT_DIRECTIONS,
+            piece=piece,
         )
 
-        # Horizontal
-        for move in horizontal_moves:
-            if self.horizontal_move_is_legal(
-                start_position=start_position, move=move, color=piece.color
-            ):
-                output.append(move)
-        # Vertical
-        for move in vertical_moves:
-            if self.vertical_move_is_legal(
-                start_position=start_position, move=move, color=piece.color
-            ):
-                output.append(move)
-
-        return output
-
     def diagonal_incline_move_is_legal(
         self, start_position: tuple, move: tuple, color: Color
     ) -> bool:
@@ -775,31 +1292,12 @@ class Engine:
         """
         Removes moves where allies or enemies are blocking the diagonal path
         """
-        moves = piece.get_applied_moves()
-        output = []
-
-        incline_moves = self.get_diagonal_moves_incline(
-            start_position=start_position, moves=moves
-        )
-        decline_moves = self.get_diagonal_moves_decline(
-            start_position=start_position, moves=moves
+        return self._walk_rays(
+            start_position=start_position,
+            directions=DIAGONAL_DIRECTIONS,
+            piece=piece,
         )
 
-        # Incline
-        for move in incline_moves:
-            if self.diagonal_incline_move_is_legal(
-                start_position=start_position, move=move, color=piece.color
-            ):
-                output.append(move)
-        # Decline
-        for move in decline_moves:
-            if self.diagonal_decline_move_is_legal(
-                start_position=start_position, move=move, color=piece.color
-            ):
-                output.append(move)
-
-        return output
-
     def _pawn_rule_handle_double_jump(
         self, moves: list, position: tuple, color: Literal["white", "black"]
     ) -> list:
@@ -809,18 +1307,14 @@ class Engine:
         if this is the case, then double jump is allowed.
         Otherwise, the double jump is removed from the allowed movement list.
         """
-        start_positions = {
-            "white": [(0, 1), (1, 1), (2, 1), (3, 1), (4, 1), (5, 1), (6, 1), (7, 1)],
-            "black": [(0, 6), (1, 6), (2, 6), (3, 6), (4, 6), (5, 6), (6, 6), (7, 6)],
-        }
-        double_jump = {
-            "white": (position[0], position[1] + 2),
-            "black": (position[0], position[1] - 2),
-        }
+        if position in PAWN_START_POSITIONS[color]:
+            return moves
 
         # If pawn is not in starting position, then remove double jump
-        if position not in start_positions[color] and double_jump[color] in moves:
-            moves.remove(double_jump[color])
+        direction = 2 if color == "white" else -2
+        double_jump = (position[0], position[1] + direction)
+        if double_jump in moves:
+            moves.remove(double_jump)
 
         return moves
 
@@ -882,11 +1376,13 @@ class Engine:
             moves=moves, position=position, color=color
         )
 
-        # Check for legal horizontal_moves moves
+        # Check that straight moves are not jumping over other pieces.
+        # Diagonal moves are single steps and cannot be blocked.
         moves = [
             move
             for move in moves
-            if self.vertical_move_is_legal(
+            if move[0] != position[0]
+            or self.vertical_move_is_legal(
                 start_position=position, move=move, color=piece.color
             )
         ]
@@ -908,12 +1404,16 @@ class Engine:
         )
         return moves
 
-    def king_rules(self, piece: type["AbstractChessPiece"]):
-        moves = piece.get_applied_moves()
-        enemy_pieces = self._get_enemy_pieces(color=piece.color.name)
+    def _get_king_danger(self, color: Literal["white", "black"]) -> set[tuple]:
+        """
+        Collect the positions where the king of 'color' would be killed
+        by an enemy. Cached until the position changes.
+        """
+        if color in self._king_danger_cache:
+            return self._king_danger_cache[color]
 
-        enemy_moves = []
-        for enemy_piece in enemy_pieces:
+        enemy_moves = set()
+        for enemy_piece in self._get_enemy_pieces(color=color):
             # Pawn and king are treated specially.
             # Pawn: Has a kill-move only if an enemy is diagonal to it.
             #       The kill-move will not be apparent if we apply game rules.
@@ -940,13 +1440,20 @@ class Engine:
                 pawn_moves = self._pawn_rule_enemy_blocking(
                     moves=pawn_moves, position=enemy_position, color=enemy_color
                 )
-                enemy_moves.extend(pawn_moves)
+                enemy_moves.update(pawn_moves)
 
             elif enemy_piece.name == "King":
-                enemy_moves.extend(enemy_piece.get_applied_moves())
+                enemy_moves.update(enemy_piece.get_applied_moves())
 
             else:
-                enemy_moves.extend(self.apply_game_rules(piece=enemy_piece))
+                enemy_moves.update(self.apply_game_rules(piece=enemy_piece))
+
+        self._king_danger_cache[color] = enemy_moves
+        return enemy_moves
+
+    def king_rules(self, piece: type["AbstractChessPiece"]):
+        moves = piece.get_applied_moves()
+        enemy_moves = self._get_king_danger(color=piece.color.name)
 
         moves = [move for move in moves if move not in enemy_moves]
 
@@ -980,7 +1487,8 @@ class Engine:
 
         # Create pieces in game and save in dictionary
         # for later monitoring of each pieces position
-        self.pieces = self.initiate_pieces(board=game_state)
+        self.piece_table = PieceTable()
+        self._set_pieces(self.initiate_pieces(board=game_state, table=self.piece_table))
 
         # Starting game
         return game_state
@@ -0,0 +1,168 @@
+"""
+Static evaluation of chess positions.
+
+A position is scored by material and piece-square tables,
+which give a bonus or penalty for a piece standing on a square.
+Scores are given in centipawns, white minus black, or from the
+point of view of a player, so a positive score means the player is ahead.
+
+Boards are evaluated one at a time on the engine (see 'evaluate'),
+or many at a time as a stack of game states (see 'evaluate_boards').
+"""
+
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+
+from src.board.bitboard import GRID_SIZE, square_of
+
+if TYPE_CHECKING:
+    from nptyping import NDArray
+
+    from src.board.engine import Engine
+
+# Value of the piece types in the order of the piece numbers
+# (pawn, rook, knight, bishop, queen, king). The king is not counted,
+# since losing it ends the game, see: chess/board/search.py
+PIECE_VALUES = (100, 500, 320, 330, 900, 0)
+
+# Piece-square tables of white, in the order of the piece numbers.
+# Rows go from row 8 to row 1 and columns from a to h,
+# as the board is seen by white.
+PIECE_SQUARE_TABLES = (
+    # Pawn
+    (
+        (0, 0, 0, 0, 0, 0, 0, 0),
+        (50, 50, 50, 50, 50, 50, 50, 50),
+        (10, 10, 20, 30, 30, 20, 10, 10),
+        (5, 5, 10, 25, 25, 10, 5, 5),
+        (0, 0, 0, 20, 20, 0, 0, 0),
+        (5, -5, -10, 0, 0, -10, -5, 5),
+        (5, 10, 10, -20, -20, 10, 10, 5),
+        (0, 0, 0, 0, 0, 0, 0, 0),
+    ),
+    # Rook
+    (
+        (0, 0, 0, 0, 0, 0, 0, 0),
+        (5, 10, 10, 10, 10, 10, 10, 5),
+        (-5, 0, 0, 0, 0, 0, 0, -5),
+        (-5, 0, 0, 0, 0, 0, 0, -5),
+        (-5, 0, 0, 0, 0, 0, 0, -5),
+        (-5, 0, 0, 0, 0, 0, 0, -5),
+        (-5, 0, 0, 0, 0, 0, 0, -5),
+        (0, 0, 0, 5, 5, 0, 0, 0),
+    ),
+    # Knight
+    (
+        (-50, -40, -30, -30, -30, -30, -40, -50),
+        (-40, -20, 0, 0, 0, 0, -20, -40),
+        (-30, 0, 10, 15, 15, 10, 0, -30),
+        (-30, 5, 15, 20, 20, 15, 5, -30),
+        (-30, 0, 15, 20, 20, 15, 0, -30),
+        (-30, 5, 10, 15, 15, 10, 5, -30),
+        (-40, -20, 0, 5, 5, 0, -20, -40),
+        (-50, -40, -30, -30, -30, -30, -40, -50),
+    ),
+    # Bishop
+    (
+        (-20, -10, -10, -10, -10, -10, -10, -20),
+        (-10, 0, 0, 0, 0, 0, 0, -10),
+        (-10, 0, 5, 10, 10, 5, 0, -10),
+        (-10, 5, 5, 10, 10, 5, 5, -10),
+        (-10, 0, 10, 10, 10, 10, 0, -10),
+        (-10, 10, 10, 10, 10, 10, 10, -10),
+        (-10, 5, 0, 0, 0, 0, 5, -10),
+        (-20, -10, -10, -10, -10, -10, -10, -20),
+    ),
+    # Queen
+    (
+        (-20, -10, -10, -5, -5, -10, -10, -20),
+        (-10, 0, 0, 0, 0, 0, 0, -10),
+        (-10, 0, 5, 5, 5, 5, 0, -10),
+        (-5, 0, 5, 5, 5, 5, 0, -5),
+        (0, 0, 5, 5, 5, 5, 0, -5),
+        (-10, 5, 5, 5, 5, 5, 0, -10),
+        (-10, 0, 5, 0, 0, 0, 0, -10),
+        (-20, -10, -10, -5, -5, -10, -10, -20),
+    ),
+    # King
+    (
+        (-30, -40, -40, -50, -50, -40, -40, -30),
+        (-30, -40, -40, -50, -50, -40, -40, -30),
+        (-30, -40, -40, -50, -50, -40, -40, -30),
+        (-30, -40, -40, -50, -50, -40, -40, -30),
+        (-20, -30, -30, -40, -40, -30, -30, -20),
+        (-10, -20, -20, -20, -20, -20, -20, -10),
+        (20, 20, 0, 0, 0, 0, 20, 20),
+        (20, 30, 10, 0, 0, 10, 30, 20),
+    ),
+)
+
+
+def _square_scores() -> "NDArray":
+    """
+    Score of every piece number on every position, indexed [piece_nr, x, y]
+    like the game state. Black pieces count negative and use the tables
+    of white mirrored vertically. Piece number 0 (empty tiles) scores 0.
+    """
+    output = np.zeros((13, GRID_SIZE, GRID_SIZE), dtype=np.int64)
+    for piece_type, (value, table) in enumerate(
+        zip(PIECE_VALUES, PIECE_SQUARE_TABLES, strict=True)
+    ):
+        # Rows of the table are rows of the board in reverse order
+        white = value + np.array(table, dtype=np.int64)[::-1].T
+        output[piece_type + 1] = white
+        output[piece_type + 7] = -white[:, ::-1]
+    return output
+
+
+SQUARE_SCORES = _square_scores()
+# Same scores by piece number and square, for evaluating a single board
+_SQUARE_SCORES = tuple(tuple(scores.ravel().tolist()) for scores in SQUARE_SCORES)
+
+
+def evaluate(engine: "Engine", player: Literal["white", "black"]) -> int:
+    """
+    Evaluates the current position of the engine.
+
+    Parameters
+    ----
+    engine: Engine
+        An engine with a game in progress.
+    player: Literal['white', 'black']
+        The player to score the position for.
+    """
+    score = 0
+    for color in ("white", "black"):
+        for piece in engine._get_all_pieces_by_color(color=color):
+            score += _SQUARE_SCORES[piece.piece_nr][square_of(piece.position)]
+    return score if player == "white" else -score
+
+
+def evaluate_boards(boards: "NDArray") -> "NDArray":
+    """
+    Evaluates a stack of game states in one go.
+
+    Parameters
+    ----
+    boards: NDArray
+        Array of shape (N, 8, 8) with piece numbers,
+        indexed [board, x, y] like 'Engine.start_game' returns them.
+        Float boards, like those of 'Engine.initiate_empty_board',
+        are converted to integers.
+
+    Returns
+    ----
+        Integer array of shape (N,) with the score of every board,
+        white minus black.
+    """
+    boards = np.asarray(boards).astype(np.int64, copy=False)
+    if boards.ndim != 3 or boards.shape[1:] != (GRID_SIZE, GRID_SIZE):
+        raise ValueError(
+            f"Boards of shape {boards.shape} are not a stack of "
+            f"{GRID_SIZE}x{GRID_SIZE} game states"
+        )
+
+    x = np.arange(GRID_SIZE)[:, None]
+    y = np.arange(GRID_SIZE)[None, :]
+    return SQUARE_SCORES[boards, x, y].sum(axis=(1, 2))
@@ -0,0 +1,134 @@
+"""
+Parsing and formatting of positions in Forsyth-Edwards Notation (FEN).
+
+A FEN string has six fields, for example the starting position:
+
+    rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1
+
+1. Placement of pieces, from row 8 to row 1 and column a to h.
+2. Player to move, 'w' or 'b'.
+3. Castling rights.
+4. En passant target square.
+5. Halfmove clock, moves since last kill or pawn move.
+6. Fullmove number, starting at 1 and incremented after black moves.
+
+The engine does not support castling and en passant,
+so these fields are ignored when parsing and written as '-'.
+"""
+
+from typing import Literal
+
+GRID_SIZE = 8
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+# FEN letters of the piece numbers, see 'Engine.create_piece'
+FEN_PIECES = {
+    "P": 1,
+    "R": 2,
+    "N": 3,
+    "B": 4,
+    "Q": 5,
+    "K": 6,
+    "p": 7,
+    "r": 8,
+    "n": 9,
+    "b": 10,
+    "q": 11,
+    "k": 12,
+}
+PIECE_LETTERS = {piece_nr: letter for letter, piece_nr in FEN_PIECES.items()}
+SIDE_TO_MOVE = {"w": "white", "b": "black"}
+
+
+def parse_fen(
+    fen: str,
+) -> tuple[list[tuple[int, tuple]], Literal["white", "black"], int, int]:
+    """
+    Parses a FEN string.
+    Missing trailing fields get their default value ('w - - 0 1').
+
+    Returns
+    ----
+        A tuple with:
+            list of (piece_nr, position) pairs
+            player to move, 'white' or 'black'
+            halfmove clock
+            fullmove number
+    """
+    fields = fen.split()
+    if not fields:
+        raise ValueError("FEN string is empty")
+    fields.extend(["w", "-", "-", "0", "1"][len(fields) - 1 :])
+
+    rows = fields[0].split("/")
+    if len(rows) != GRID_SIZE:
+        raise ValueError(f"FEN [{fen}] does not have {GRID_SIZE} rows")
+
+    placement = []
+    for i, row in enumerate(rows):
+        y = GRID_SIZE - 1 - i
+        x = 0
+        for char in row:
+            if char.isdigit():
+                x += int(char)
+            elif char in FEN_PIECES:
+                if x >= GRID_SIZE:
+                    raise ValueError(f"FEN [{fen}] does not have {GRID_SIZE} columns")
+                placement.append((FEN_PIECES[char], (x, y)))
+                x += 1
+            else:
+                raise ValueError(f"FEN [{fen}] has unknown piece [{char}]")
+        if x != GRID_SIZE:
+            raise ValueError(f"FEN [{fen}] does not have {GRID_SIZE} columns")
+
+    if fields[1] not in SIDE_TO_MOVE:
+        raise ValueError(f"FEN [{fen}] has unknown player to move [{fields[1]}]")
+
+    try:
+        halfmove_clock = int(fields[4])
+        fullmove_number = int(fields[5])
+    except ValueError as e:
+        raise ValueError(f"FEN [{fen}] has invalid move counters") from e
+
+    return placement, SIDE_TO_MOVE[fields[1]], halfmove_clock, fullmove_number
+
+
+def format_fen(
+    placement: dict[tuple, int],
+    side_to_move: Literal["white", "black"],
+    halfmove_clock: int,
+    fullmove_number: int,
+) -> str:
+    """
+    Formats a position as a FEN string.
+
+    Parameters
+    ----
+    placement: dict[tuple, int]
+        Piece number of every occupied position.
+    side_to_move: Literal['white', 'black']
+        The player to move.
+    halfmove_clock: int
+        Number of moves since the last kill or pawn move.
+    fullmove_number: int
+        Number of the full move, starting at 1.
+    """
+    rows = []
+    for y in range(GRID_SIZE - 1, -1, -1):
+        row = []
+        empty = 0
+        for x in range(GRID_SIZE):
+            piece_nr = placement.get((x, y))
+            if piece_nr is None:
+                empty += 1
+                continue
+            if empty:
+                row.append(str(empty))
+                empty = 0
+            row.append(PIECE_LETTERS[piece_nr])
+        if empty:
+            row.append(str(empty))
+        rows.append("".join(row))
+
+    side = "w" if side_to_move == "white" else "b"
+    return f"{'/'.join(rows)} {side} - - {halfmove_clock} {fullmove_number}"
@@ -37,7 +37,7 @@ class Chess:
             self.displayer.display_player_turn(self.player_turn)
 
             # Compute possible actions
-            actions = self.engine.get_all_possible_actions(player=self.player_turn)
+            actions = self.engine.get_all_legal_actions(player=self.player_turn)
             player_input = self.displayer.await_input(actions)
 
             # If player surrendered, then end the game
@@ -54,9 +54,15 @@ class Chess:
                 game_state=self.game_state,
             )
 
-            # Evaluate game state for player
-            if self.engine.is_checkmate(player=self.switch[self.player_turn]):
+            # Evaluate game state for the opponent, who is to move next
+            opponent = self.switch[self.player_turn]
+            if self.engine.is_checkmate(player=opponent):
                 self.game_over = True
                 self.displayer.game_over_message(player=self.player_turn)
+            else:
+                draw_reason = self.engine.draw_reason(player=opponent)
+                if draw_reason is not None:
+                    self.game_over = True
+                    self.displayer.draw_message(reason=draw_reason)
 
             self.switch_turn()
@@ -0,0 +1,102 @@
+"""
+Compact encoding of a move in 16 bits:
+
+    bits 0-5:   new square
+    bits 6-11:  old square
+    bits 12-15: flags
+
+Squares are numbered as on the bitboard (see: chess/board/bitboard.py):
+
+    square = x * 8 + y
+
+so for example (4, 1) -> (4, 3) is encoded as 33 << 6 | 35.
+The move lists of a position are arrays of encoded moves,
+two bytes per move, which NumPy reads without copying:
+
+    np.frombuffer(moves, dtype=np.uint16)
+"""
+
+from array import array
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from src.board.bitboard import POSITIONS, square_of
+
+if TYPE_CHECKING:
+    from nptyping import NDArray
+
+# Type code of move arrays, see 'array.array'
+MOVE_TYPECODE = "H"
+
+SQUARE_BITS = 6
+SQUARE_MASK = (1 << SQUARE_BITS) - 1
+FLAG_SHIFT = 2 * SQUARE_BITS
+# Old and new square of a move, without its flags
+SQUARES_MASK = (1 << FLAG_SHIFT) - 1
+
+# Flags of a move
+CAPTURE = 1 << FLAG_SHIFT
+# Reserved for promotions, castling and en passant,
+# which the engine does not have yet
+PROMOTION = 2 << FLAG_SHIFT
+SPECIAL = 4 << FLAG_SHIFT
+
+
+def encode_move(old_position: tuple, new_position: tuple, flags: int = 0) -> int:
+    return square_of(old_position) << SQUARE_BITS | square_of(new_position) | flags
+
+
+def old_square(move: int) -> int:
+    return move >> SQUARE_BITS & SQUARE_MASK
+
+
+def new_square(move: int) -> int:
+    return move & SQUARE_MASK
+
+
+def move_flags(move: int) -> int:
+    return move & ~SQUARES_MASK
+
+
+def is_capture(move: int) -> bool:
+    return bool(move & CAPTURE)
+
+
+def decode_move(move: int) -> tuple[tuple, tuple]:
+    """
+    Decodes a move to its (old_position, new_position), without its flags.
+    """
+    return POSITIONS[move >> SQUARE_BITS & SQUARE_MASK], POSITIONS[move & SQUARE_MASK]
+
+
+def new_move_array(moves=()) -> array:
+    return array(MOVE_TYPECODE, moves)
+
+
+def encode_moves(
+    old_squares: "NDArray", new_squares: "NDArray", flags: "NDArray | int" = 0
+) -> "NDArray":
+    """
+    Encodes arrays of old and new squares (and flags) to an array of moves.
+    """
+    old_squares = np.asarray(old_squares, dtype=np.uint16)
+    new_squares = np.asarray(new_squares, dtype=np.uint16)
+    return old_squares << SQUARE_BITS | new_squares | np.uint16(flags)
+
+
+def decode_moves(moves) -> tuple["NDArray", "NDArray", "NDArray"]:
+    """
+    Decodes an array of moves (NumPy or 'array.array').
+
+    Returns
+    ----
+        Three arrays of equal length with the old square,
+        new square and flags of every move.
+    """
+    moves = np.asarray(moves, dtype=np.uint16)
+    return (
+        moves >> SQUARE_BITS & SQUARE_MASK,
+        moves & SQUARE_MASK,
+        moves & ~np.uint16(SQUARES_MASK),
+    )
@@ -0,0 +1,19 @@
+"""
+Readable notation of positions and moves, for example:
+    (0, 1) -> 'a2'
+    (4, 1), (4, 3) -> 'e2e4'
+"""
+
+from string import ascii_lowercase
+
+
+def position_to_str(position: tuple) -> str:
+    return f"{ascii_lowercase[position[0]]}{position[1] + 1}"
+
+
+def str_to_position(name: str) -> tuple[int, int]:
+    return (ascii_lowercase.index(name[0]), int(name[1:]) - 1)
+
+
+def move_to_str(old_position: tuple, new_position: tuple) -> str:
+    return position_to_str(old_position) + position_to_str(new_position)
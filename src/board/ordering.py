@@ -0,0 +1,127 @@
+"""
+Move ordering for the search, see: chess/board/search.py
+
+Alpha-beta prunes the most when the best move is searched first,
+so moves are searched in the order:
+    1. The best move from the transposition table
+    2. Kills, most valuable victim first and least valuable attacker
+       first among kills of the same victim (MVV-LVA)
+    3. Killer moves, moves that caused a cutoff at the same ply
+    4. All other moves, by their history score
+"""
+
+from typing import TYPE_CHECKING
+
+from src.board.bitboard import square_of
+from src.board.moves import encode_move
+
+if TYPE_CHECKING:
+    from src.board.engine import Engine
+
+# Rank of the piece types in the order of the piece numbers
+# (pawn, rook, knight, bishop, queen, king)
+PIECE_RANKS = (1, 4, 2, 3, 5, 6)
+
+FIRST_MOVE_SCORE = 1 << 30
+KILL_SCORE = 1 << 20
+KILLER_SCORE = 1 << 19
+MAX_HISTORY = KILLER_SCORE - 1
+KILLERS_PER_PLY = 2
+
+
+def mvv_lva(victim_nr: int, attacker_nr: int) -> int:
+    """
+    Score of killing victim with attacker.
+    """
+    return 8 * PIECE_RANKS[(victim_nr - 1) % 6] - PIECE_RANKS[(attacker_nr - 1) % 6]
+
+
+class MoveOrdering:
+    """
+    Orders moves of the search and learns from its cutoffs.
+    Moves are (id, old_position, new_position, piece_nr) tuples.
+
+    Parameters
+    ----
+    max_ply: int
+        Deepest ply to keep killer moves for.
+    """
+
+    def __init__(self, max_ply: int = 64):
+        self.max_ply = max_ply
+        # Killer moves by ply and history scores by move,
+        # in the encoding of chess/board/moves.py (without flags)
+        self.killers = [[None] * KILLERS_PER_PLY for _ in range(max_ply)]
+        self.history = [0] * 64 * 64
+
+    def new_search(self) -> None:
+        """
+        Forgets the killer moves and ages the history scores,
+        so that the next search favours what it learns itself.
+        """
+        self.killers = [[None] * KILLERS_PER_PLY for _ in range(self.max_ply)]
+        self.history = [score // 2 for score in self.history]
+
+    def score(self, engine: "Engine", move: tuple, ply: int) -> int:
+        """
+        Ordering score of a move, higher is searched first.
+        """
+        _, old_position, new_position, piece_nr = move
+        new_square = square_of(new_position)
+        if engine.bitboard.occupied >> new_square & 1:
+            victim = engine.get_piece_by_position(new_position)
+            return KILL_SCORE + mvv_lva(victim.piece_nr, piece_nr)
+
+        encoded_move = encode_move(old_position, new_position)
+        if ply < self.max_ply and encoded_move in self.killers[ply]:
+            return (
+                KILLER_SCORE + KILLERS_PER_PLY - self.killers[ply].index(encoded_move)
+            )
+
+        return self.history[encoded_move]
+
+    def order(
+        self,
+        engine: "Engine",
+        moves: list[tuple],
+        ply: int,
+        first_move: tuple | None = None,
+    ) -> list[tuple]:
+        """
+        Sorts moves in place in search order and returns them.
+
+        Parameters
+        ----
+        engine: Engine
+            The engine in the position of the moves.
+        moves: list[tuple]
+            Moves as (id, old_position, new_position, piece_nr) tuples.
+        ply: int
+            Number of moves from the root of the search.
+        first_move: tuple, optional
+            (old_position, new_position) of the move to search first.
+        """
+        moves.sort(
+            key=lambda move: (
+                FIRST_MOVE_SCORE
+                if move[1:3] == first_move
+                else self.score(engine=engine, move=move, ply=ply)
+            ),
+            reverse=True,
+        )
+        return moves
+
+    def update(self, move: tuple, depth: int, ply: int) -> None:
+        """
+        Remembers a move that is not a kill and caused a cutoff.
+        """
+        encoded_move = encode_move(move[1], move[2])
+        if ply < self.max_ply:
+            killers = self.killers[ply]
+            if encoded_move != killers[0]:
+                killers.insert(0, encoded_move)
+                killers.pop()
+
+        self.history[encoded_move] += depth * depth
+        if self.history[encoded_move] > MAX_HISTORY:
+            self.history = [score // 2 for score in self.history]
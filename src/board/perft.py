@@ -0,0 +1,237 @@
+"""
+Performance test (perft) of the move generation.
+Counts all leaf nodes of the game tree down to a given depth,
+which is both a correctness check and a benchmark of
+'Engine.get_all_possible_actions', or of 'Engine.get_all_legal_actions'
+when counting legal moves only. Counts of legal moves are comparable to
+the published perft counts of positions without castling, en passant
+and promotions in the counted moves.
+
+Deep counts can be split into subtrees of the first one or two moves,
+which are counted in parallel by a pool of processes (see 'parallel_divide').
+"""
+
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Literal
+
+from src.board.engine import Engine
+from src.board.notation import move_to_str
+
+
+def _get_actions(
+    engine: Engine, player: Literal["white", "black"], legal: bool
+) -> dict[str, list]:
+    if legal:
+        return engine.get_all_legal_actions(player=player)
+    return engine.get_all_possible_actions(player=player)
+
+
+def perft(
+    engine: Engine, player: Literal["white", "black"], depth: int, legal: bool = False
+) -> int:
+    """
+    Counts the leaf nodes of the game tree from the current position.
+
+    Parameters
+    ----
+    engine: Engine
+        An engine with a game in progress.
+    player: Literal['white', 'black']
+        The player to move.
+    depth: int
+        Number of moves to look ahead.
+    legal: bool
+        If True, only legal moves are counted.
+        Otherwise, all moves of the piece rules are counted.
+    """
+    if depth == 0:
+        return 1
+
+    actions = _get_actions(engine=engine, player=player, legal=legal)
+
+    # Moves at the last level do not have to be made to be counted
+    if depth == 1:
+        return sum(
+            len(piece.get("actions")) for pieces in actions.values() for piece in pieces
+        )
+
+    opponent = engine.opponent_of[player]
+    nodes = 0
+    for pieces in actions.values():
+        for piece in pieces:
+            for action in piece.get("actions"):
+                engine.make_move(
+                    player=player,
+                    player_input={"id": piece.get("id"), "action": action},
+                )
+                nodes += perft(
+                    engine=engine, player=opponent, depth=depth - 1, legal=legal
+                )
+                engine.unmake_move()
+    return nodes
+
+
+def divide(
+    engine: Engine, player: Literal["white", "black"], depth: int, legal: bool = False
+) -> dict[str, int]:
+    """
+    Same as 'perft', but the leaf nodes are counted per move
+    of the current position.
+
+    Returns a dictionary from moves to node counts, for example:
+        {'a2a3': 20, 'a2a4': 20, ...}
+    """
+    if depth < 1:
+        raise ValueError("Depth has to be at least 1")
+
+    actions = _get_actions(engine=engine, player=player, legal=legal)
+    opponent = engine.opponent_of[player]
+    output = {}
+    for pieces in actions.values():
+        for piece in pieces:
+            for action in piece.get("actions"):
+                move = move_to_str(piece.get("position"), action)
+                engine.make_move(
+                    player=player,
+                    player_input={"id": piece.get("id"), "action": action},
+                )
+                output[move] = perft(
+                    engine=engine, player=opponent, depth=depth - 1, legal=legal
+                )
+                engine.unmake_move()
+    return output
+
+
+def _subtrees(
+    engine: Engine, player: Literal["white", "black"], depth: int, legal: bool = False
+) -> list[list[tuple]]:
+    """
+    All sequences of depth moves from the current position,
+    as lists of (old_position, new_position) pairs.
+    """
+    if depth == 0:
+        return [[]]
+
+    actions = _get_actions(engine=engine, player=player, legal=legal)
+    opponent = engine.opponent_of[player]
+    output = []
+    for pieces in actions.values():
+        for piece in pieces:
+            for action in piece.get("actions"):
+                engine.make_move(
+                    player=player,
+                    player_input={"id": piece.get("id"), "action": action},
+                )
+                for path in _subtrees(
+                    engine=engine, player=opponent, depth=depth - 1, legal=legal
+                ):
+                    output.append([(piece.get("position"), action), *path])
+                engine.unmake_move()
+    return output
+
+
+# Engine of the current worker process, see 'parallel_divide'
+_worker_engine = None
+
+
+def _init_worker(config_path: str, use_bitboard: bool) -> None:
+    global _worker_engine
+    _worker_engine = Engine(config_path=config_path, use_bitboard=use_bitboard)
+
+
+def _perft_subtree(
+    fen: str,
+    player: Literal["white", "black"],
+    path: list[tuple],
+    depth: int,
+    legal: bool = False,
+) -> int:
+    """
+    Counts the leaf nodes of a subtree in a worker process.
+    The subtree starts after the moves in path from the position in fen.
+    """
+    engine = _worker_engine
+    engine.load_fen(fen)
+    for old_position, new_position in path:
+        piece = engine.get_piece_by_position(old_position)
+        engine.make_move(
+            player=player, player_input={"id": piece.id, "action": new_position}
+        )
+        player = engine.opponent_of[player]
+    return perft(engine=engine, player=player, depth=depth, legal=legal)
+
+
+def parallel_divide(
+    engine: Engine,
+    player: Literal["white", "black"],
+    depth: int,
+    workers: int,
+    split_depth: int = 1,
+    progress: Callable[[str, int, int, int], None] | None = None,
+    legal: bool = False,
+) -> dict[str, int]:
+    """
+    Same as 'divide', but the subtrees are counted by a pool of processes.
+
+    Parameters
+    ----
+    engine: Engine
+        An engine with a game in progress.
+    player: Literal['white', 'black']
+        The player to move.
+    depth: int
+        Number of moves to look ahead.
+    workers: int
+        Number of processes.
+    split_depth: int
+        Number of moves (1 or 2) that a subtree starts after. Splitting
+        after two moves gives many small subtrees, which spreads the work
+        more evenly across the processes.
+    progress: Callable, optional
+        Called whenever a subtree is counted, with its moves
+        (for example 'e2e4 e7e5'), its node count, the number of subtrees
+        counted so far and the total number of subtrees.
+    legal: bool
+        If True, only legal moves are counted, see 'perft'.
+    """
+    if depth < 1:
+        raise ValueError("Depth has to be at least 1")
+    if workers < 1:
+        raise ValueError("Number of workers has to be at least 1")
+    if split_depth not in (1, 2):
+        raise ValueError("Subtrees can only be split after one or two moves")
+
+    split_depth = min(split_depth, depth)
+    fen = engine.to_fen()
+    paths = _subtrees(engine=engine, player=player, depth=split_depth, legal=legal)
+
+    # Every move gets a count, also if the opponent cannot answer it
+    output = {
+        move_to_str(*path[0]): 0
+        for path in _subtrees(engine=engine, player=player, depth=1, legal=legal)
+    }
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(engine.config_path, engine.use_bitboard),
+    ) as pool:
+        futures = {
+            pool.submit(
+                _perft_subtree,
+                fen=fen,
+                player=player,
+                path=path,
+                depth=depth - split_depth,
+                legal=legal,
+            ): path
+            for path in paths
+        }
+        for i, future in enumerate(as_completed(futures), start=1):
+            path = futures[future]
+            nodes = future.result()
+            output[move_to_str(*path[0])] += nodes
+            if progress is not None:
+                moves = " ".join(move_to_str(*move) for move in path)
+                progress(moves, nodes, i, len(paths))
+    return output
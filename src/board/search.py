@@ -0,0 +1,506 @@
+"""
+Search for the best move of a player with negamax alpha-beta
+and iterative deepening.
+
+The search deepens one move at a time until a time or node budget
+runs out, and always answers with the best move of the deepest
+completed iteration, so it can be stopped at any moment.
+
+With more than one worker, the moves of the root position are split
+across a pool of processes, each with its own engine. The first move
+is searched alone, and its score is the lower bound (alpha) for the
+other moves, raised whenever a worker finds a better move.
+
+The search only plays legal moves (see 'Engine.iter_moves'), so a player
+without moves is checkmated if in check and stalemated otherwise.
+A move that kills the enemy king still ends the game in the search,
+for positions that are set up with a king in check.
+
+Moves are stored in the transposition table in the 16-bit encoding
+of chess/board/moves.py.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Literal
+
+from src.board.engine import Engine
+from src.board.evaluation import evaluate
+from src.board.moves import decode_move, encode_move
+from src.board.ordering import MoveOrdering
+from src.board.transposition import Bound, TranspositionTable
+from src.board.zobrist import BLACK_TO_MOVE
+
+MATE = 100_000
+INFINITY = MATE + 1
+MAX_DEPTH = 64
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+def _to_table(score: int, ply: int) -> int:
+    """
+    Mate scores count from the root of the search.
+    In the table they are stored relative to the position instead.
+    """
+    if score > MATE - MAX_DEPTH:
+        return score + ply
+    if score < -MATE + MAX_DEPTH:
+        return score - ply
+    return score
+
+
+def _from_table(score: int, ply: int) -> int:
+    if score > MATE - MAX_DEPTH:
+        return score - ply
+    if score < -MATE + MAX_DEPTH:
+        return score + ply
+    return score
+
+
+class Search:
+    """
+    Alpha-beta search on top of the engine.
+    Moves are made and taken back on the engine with
+    'Engine.make_move' and 'Engine.unmake_move', so the position
+    of the engine is the same before and after a search,
+    including the player to move and the position hash.
+
+    Parameters
+    ----
+    engine: Engine
+        An engine with a game in progress.
+    table: TranspositionTable
+        Table for search results of positions, shared between searches.
+        A new table is created if not given.
+    ordering: MoveOrdering
+        Move ordering of the search, see: chess/board/ordering.py
+        A new ordering is created if not given.
+    workers: int
+        Number of processes to split the root moves across.
+        With 1 worker, the search runs in the current process.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        table: TranspositionTable | None = None,
+        ordering: MoveOrdering | None = None,
+        workers: int = 1,
+    ):
+        if workers < 1:
+            raise ValueError("Number of workers has to be at least 1")
+
+        self.engine = engine
+        self.table = table if table is not None else TranspositionTable()
+        self.ordering = ordering if ordering is not None else MoveOrdering()
+        self.workers = workers
+
+        # Information about the last search
+        self.nodes = 0
+        self.depth = 0
+        self.score = 0
+
+        self._deadline = None
+        self._max_nodes = None
+        self._pool = None
+
+    def close(self) -> None:
+        """
+        Shuts down the worker processes, if any.
+        """
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """
+        Starts the worker processes on first use.
+        Every worker gets its own engine and transposition table.
+        """
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(
+                    self.engine.config_path,
+                    self.engine.use_bitboard,
+                    self.table.size_mb,
+                ),
+            )
+        return self._pool
+
+    def _set_budget(self, time_limit: float | None, max_nodes: int | None) -> None:
+        self.nodes = 0
+        self._deadline = (
+            time.perf_counter() + time_limit if time_limit is not None else None
+        )
+        self._max_nodes = max_nodes
+
+    def _remaining_budget(self) -> tuple[float | None, int | None]:
+        """
+        Time and nodes left of the budget, to pass on to a worker.
+        """
+        self._check_budget()
+        time_limit = (
+            self._deadline - time.perf_counter() if self._deadline is not None else None
+        )
+        max_nodes = (
+            self._max_nodes - self.nodes if self._max_nodes is not None else None
+        )
+        return time_limit, max_nodes
+
+    def _key(self, player: Literal["white", "black"]) -> int:
+        """
+        Hash of the current position with player to move.
+        """
+        key = self.engine.position_hash
+        if self.engine.side_to_move != player:
+            key ^= BLACK_TO_MOVE
+        return key
+
+    def _check_budget(self) -> None:
+        if self._max_nodes is not None and self.nodes >= self._max_nodes:
+            raise SearchTimeout
+        if self._deadline is not None and time.perf_counter() >= self._deadline:
+            raise SearchTimeout
+
+    def _moves(
+        self, player: Literal["white", "black"], ply: int = 0, first_move: int = 0
+    ) -> list[tuple]:
+        """
+        All legal moves of player as (id, old_position, new_position, piece_nr)
+        tuples, in search order. The encoded first_move is searched first.
+        """
+        moves = [
+            (piece.id, piece.position, action, piece.piece_nr)
+            for piece, action in self.engine.iter_moves(player=player)
+        ]
+        return self.ordering.order(
+            engine=self.engine,
+            moves=moves,
+            ply=ply,
+            first_move=decode_move(first_move) if first_move else None,
+        )
+
+    def search(
+        self,
+        player: Literal["white", "black"],
+        max_depth: int = MAX_DEPTH,
+        time_limit: float | None = None,
+        max_nodes: int | None = None,
+    ) -> dict | None:
+        """
+        Searches for the best move of player in the current position.
+
+        Parameters
+        ----
+        player: Literal['white', 'black']
+            The player to move.
+        max_depth: int
+            Maximum number of moves to look ahead.
+        time_limit: float, optional
+            Seconds the search is allowed to take.
+        max_nodes: int, optional
+            Number of positions the search is allowed to visit.
+
+        Returns
+        ----
+        The best move in the format of 'Engine.handle_game', for example:
+            {'id': 1234, 'action': (4, 3)}
+        or None if player cannot move.
+        """
+        if max_depth < 1:
+            raise ValueError("Depth has to be at least 1")
+
+        self._set_budget(time_limit=time_limit, max_nodes=max_nodes)
+        self.depth = 0
+        self.score = 0
+        self.ordering.new_search()
+
+        moves = self._moves(player=player)
+        if not moves:
+            return None
+
+        search_root = self._search_root if self.workers == 1 else self._split_root
+        best_move = moves[0]
+        for depth in range(1, min(max_depth, MAX_DEPTH) + 1):
+            try:
+                score, move = search_root(player=player, depth=depth, moves=moves)
+            except SearchTimeout:
+                break
+
+            best_move = move
+            self.depth = depth
+            self.score = score
+
+            # Search the best move first in the next iteration
+            moves.insert(0, moves.pop(moves.index(move)))
+
+            # No need to look further if the game is decided
+            if abs(score) > MATE - MAX_DEPTH:
+                break
+
+        return {"id": best_move[0], "action": best_move[2]}
+
+    def _search_root(
+        self, player: Literal["white", "black"], depth: int, moves: list[tuple]
+    ) -> tuple[int, tuple]:
+        """
+        Searches all moves of the root position to depth.
+        Returns the best score and move.
+        """
+        alpha = -INFINITY
+        best_move = moves[0]
+        for move in moves:
+            score = self._search_move(
+                player=player,
+                move=move,
+                depth=depth,
+                alpha=-INFINITY,
+                beta=-alpha,
+                ply=0,
+            )
+            if score > alpha:
+                alpha = score
+                best_move = move
+
+        self.table.store(
+            key=self._key(player),
+            depth=depth,
+            score=_to_table(alpha, 0),
+            bound=Bound.exact,
+            move=encode_move(best_move[1], best_move[2]),
+        )
+        return alpha, best_move
+
+    def _split_root(
+        self, player: Literal["white", "black"], depth: int, moves: list[tuple]
+    ) -> tuple[int, tuple]:
+        """
+        Same as '_search_root', but the moves are searched by the workers.
+        Every move is sent with the best score found so far as alpha,
+        and at most one move per worker is in progress at a time.
+
+        A node budget is shared by the moves in progress: every move gets
+        an equal share of the nodes that are not reserved by the others.
+        Note that 'Future.cancel' does not stop a move that is already
+        being searched. When the search stops, such moves run on until
+        their own budget runs out, so with only a node budget the workers
+        may still be busy when the next search starts.
+        """
+        pool = self._get_pool()
+        fen = self.engine.to_fen()
+        alpha = -INFINITY
+        best_move = moves[0]
+        in_progress = {}
+        reserved = {}
+
+        def submit(move: tuple, sharing: int) -> bool:
+            time_limit, max_nodes = self._remaining_budget()
+            if max_nodes is not None:
+                # Charge the nodes up front, so that the moves in progress
+                # together stay within the budget
+                max_nodes -= sum(reserved.values())
+                if max_nodes < 1:
+                    return False
+                max_nodes = max(max_nodes // sharing, 1)
+            future = pool.submit(
+                _search_root_move,
+                fen=fen,
+                player=player,
+                move=(move[1], move[2]),
+                depth=depth,
+                alpha=alpha,
+                time_limit=time_limit,
+                max_nodes=max_nodes,
+            )
+            in_progress[future] = move
+            reserved[future] = max_nodes or 0
+            return True
+
+        try:
+            # The first move is searched alone, to get a bound for the others
+            submit(moves[0], sharing=1)
+            remaining = moves[1:]
+            while in_progress:
+                done, _ = wait(in_progress, return_when=FIRST_COMPLETED)
+                for future in done:
+                    move = in_progress.pop(future)
+                    del reserved[future]
+                    score, nodes = future.result()
+                    self.nodes += nodes
+                    if score is None:
+                        raise SearchTimeout
+                    if score > alpha:
+                        alpha = score
+                        best_move = move
+
+                while remaining and len(in_progress) < self.workers:
+                    if not submit(remaining[0], self.workers - len(in_progress)):
+                        break
+                    remaining.pop(0)
+        except SearchTimeout:
+            # Only moves that have not started yet are cancelled,
+            # the others stop on their own when their budget runs out
+            for future in in_progress:
+                future.cancel()
+            raise
+
+        return alpha, best_move
+
+    def _search_move(
+        self,
+        player: Literal["white", "black"],
+        move: tuple,
+        depth: int,
+        alpha: int,
+        beta: int,
+        ply: int,
+    ) -> int:
+        """
+        Makes a move, searches the position after it and takes it back.
+        Returns the score of the move for player.
+        Note that alpha and beta are the bounds of the opponent.
+        """
+        piece_id, _, action, _ = move
+        record = self.engine.make_move(
+            player=player, player_input={"id": piece_id, "action": action}
+        )
+        try:
+            if record.killed is not None and record.killed.name == "King":
+                return MATE - ply
+            return -self._negamax(
+                player=self.engine.opponent_of[player],
+                depth=depth - 1,
+                alpha=alpha,
+                beta=beta,
+                ply=ply + 1,
+            )
+        finally:
+            self.engine.unmake_move()
+
+    def _negamax(
+        self,
+        player: Literal["white", "black"],
+        depth: int,
+        alpha: int,
+        beta: int,
+        ply: int,
+    ) -> int:
+        """
+        Score of the current position for player, searched to depth.
+        """
+        self.nodes += 1
+        self._check_budget()
+
+        key = self._key(player)
+        original_alpha = alpha
+        table_move = 0
+        entry = self.table.probe(key)
+        if entry is not None:
+            table_move = entry.move
+            if entry.depth >= depth:
+                score = _from_table(entry.score, ply)
+                if entry.bound == Bound.exact:
+                    return score
+                if entry.bound == Bound.lower:
+                    alpha = max(alpha, score)
+                else:
+                    beta = min(beta, score)
+                if alpha >= beta:
+                    return score
+
+        if depth == 0:
+            return evaluate(engine=self.engine, player=player)
+
+        moves = self._moves(player=player, ply=ply, first_move=table_move)
+        if not moves:
+            # The king is not allowed to move into check,
+            # so a player without moves is either checkmated or stalemated
+            if self.engine.is_in_check(player=player):
+                return -MATE + ply
+            return 0
+
+        best_score = -INFINITY
+        best_move = moves[0]
+        for move in moves:
+            score = self._search_move(
+                player=player,
+                move=move,
+                depth=depth,
+                alpha=-beta,
+                beta=-alpha,
+                ply=ply,
+            )
+            if score > best_score:
+                best_score = score
+                best_move = move
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                if self.engine.get_piece_by_position(move[2]) is None:
+                    self.ordering.update(move=move, depth=depth, ply=ply)
+                break
+
+        if best_score <= original_alpha:
+            bound = Bound.upper
+        elif best_score >= beta:
+            bound = Bound.lower
+        else:
+            bound = Bound.exact
+        self.table.store(
+            key=key,
+            depth=depth,
+            score=_to_table(best_score, ply),
+            bound=bound,
+            move=encode_move(best_move[1], best_move[2]),
+        )
+        return best_score
+
+
+# Search of the current worker process, see 'Search._get_pool'
+_worker_search = None
+
+
+def _init_worker(config_path: str, use_bitboard: bool, table_size_mb: float) -> None:
+    global _worker_search
+    _worker_search = Search(
+        engine=Engine(config_path=config_path, use_bitboard=use_bitboard),
+        table=TranspositionTable(size_mb=table_size_mb),
+    )
+
+
+def _search_root_move(
+    fen: str,
+    player: Literal["white", "black"],
+    move: tuple[tuple, tuple],
+    depth: int,
+    alpha: int,
+    time_limit: float | None,
+    max_nodes: int | None,
+) -> tuple[int | None, int]:
+    """
+    Searches a single move of the root position in a worker process.
+    Returns the score of the move, or None if the budget ran out,
+    and the number of positions visited.
+    """
+    search = _worker_search
+    search.engine.load_fen(fen)
+    search._set_budget(time_limit=time_limit, max_nodes=max_nodes)
+
+    old_position, new_position = move
+    piece = search.engine.get_piece_by_position(old_position)
+    try:
+        score = search._search_move(
+            player=player,
+            move=(piece.id, old_position, new_position, piece.piece_nr),
+            depth=depth,
+            alpha=-INFINITY,
+            beta=-alpha,
+            ply=0,
+        )
+    except SearchTimeout:
+        score = None
+    return score, search.nodes
@@ -0,0 +1,209 @@
+"""
+Self-play tournament of the search against itself, without any display.
+
+Games are played in parallel by a pool of processes, each with its own
+engine, and the result and moves of every game are written to a
+JSON Lines file as soon as the game is over, for example:
+
+    {"game": 0, "winner": "white", "reason": "checkmate", "moves": [...], ...}
+
+Every game starts with a few random moves (from a seed per game),
+so that games between the same players do not all play out the same.
+"""
+
+import json
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Literal, NamedTuple
+
+from src.board.engine import Engine
+from src.board.notation import move_to_str
+from src.board.search import Search
+from src.board.transposition import TranspositionTable
+
+
+class PlayerSettings(NamedTuple):
+    """
+    Search settings of a player, see 'Search.search'.
+    """
+
+    max_depth: int = 3
+    time_limit: float | None = None
+    max_nodes: int | None = None
+
+
+def _random_move(engine: Engine, player: str, rng: random.Random) -> dict | None:
+    actions = engine.get_all_legal_actions(player=player)
+    moves = [
+        {"id": piece.get("id"), "action": action}
+        for pieces in actions.values()
+        for piece in pieces
+        for action in piece.get("actions")
+    ]
+    return rng.choice(moves) if moves else None
+
+
+def play_game(
+    config_path: str,
+    white: PlayerSettings,
+    black: PlayerSettings,
+    game: int = 0,
+    seed: int = 0,
+    random_moves: int = 2,
+    max_moves: int = 200,
+    table_size_mb: float = 16,
+) -> dict:
+    """
+    Plays a game of the search against itself.
+
+    Parameters
+    ----
+    config_path: str
+        Path to the game configuration-file.
+    white: PlayerSettings
+        Search settings of white.
+    black: PlayerSettings
+        Search settings of black.
+    game: int
+        Number of the game in the tournament.
+    seed: int
+        Seed of the random moves, combined with the number of the game.
+    random_moves: int
+        Number of random moves (of both players) to start the game with.
+    max_moves: int
+        Number of moves (of both players) before the game is a draw.
+    table_size_mb: float
+        Size of the transposition table of each player.
+
+    Returns
+    ----
+    A dictionary with the result of the game, for example:
+        {
+            'game': 0,
+            'winner': 'white',
+            'reason': 'checkmate',
+            'moves': ['e2e4', 'e7e5', ...],
+            'fen': '...',
+            'seconds': 12.3,
+        }
+    """
+    start = time.perf_counter()
+    rng = random.Random(f"{seed}-{game}")
+    engine = Engine(config_path=config_path, use_bitboard=True)
+    engine.start_game()
+    settings = {"white": white, "black": black}
+    searches = {
+        color: Search(engine=engine, table=TranspositionTable(size_mb=table_size_mb))
+        for color in settings
+    }
+
+    player = "white"
+    winner = None
+    reason = "move limit"
+    moves = []
+    while len(moves) < max_moves:
+        if len(moves) < random_moves:
+            player_input = _random_move(engine=engine, player=player, rng=rng)
+        else:
+            player_input = searches[player].search(
+                player=player, **settings[player]._asdict()
+            )
+
+        opponent = engine.opponent_of[player]
+        if player_input is None:
+            if engine.is_in_check(player=player):
+                winner, reason = opponent, "checkmate"
+            else:
+                reason = "stalemate"
+            break
+
+        record = engine.make_move(player=player, player_input=player_input)
+        moves.append(move_to_str(record.old_position, record.new_position))
+        if record.killed is not None and record.killed.name == "King":
+            winner, reason = player, "king killed"
+            break
+        if engine.is_checkmate(player=opponent):
+            winner, reason = player, "checkmate"
+            break
+        draw_reason = engine.draw_reason(player=opponent)
+        if draw_reason is not None:
+            reason = draw_reason
+            break
+        player = opponent
+
+    return {
+        "game": game,
+        "winner": winner,
+        "reason": reason,
+        "moves": moves,
+        "fen": engine.to_fen(),
+        "seconds": round(time.perf_counter() - start, 3),
+    }
+
+
+def run_tournament(
+    config_path: str,
+    games: int,
+    output_path: str,
+    workers: int = 1,
+    white: PlayerSettings | None = None,
+    black: PlayerSettings | None = None,
+    **kwargs,
+) -> dict:
+    """
+    Plays games in parallel and writes their results to output_path,
+    one JSON object per line. Players without settings use the defaults
+    of 'PlayerSettings'. Other keyword arguments are passed on to 'play_game'.
+
+    Returns
+    ----
+    A summary of the tournament, for example:
+        {
+            'games': 100,
+            'white': 40,
+            'black': 35,
+            'draw': 25,
+            'seconds': 3600.0,
+            'games_per_hour': 100.0,
+        }
+    """
+    if workers < 1:
+        raise ValueError("Number of workers has to be at least 1")
+
+    white = white if white is not None else PlayerSettings()
+    black = black if black is not None else PlayerSettings()
+    start = time.perf_counter()
+    summary: dict[Literal["white", "black", "draw"], int] = {
+        "white": 0,
+        "black": 0,
+        "draw": 0,
+    }
+    with (
+        ProcessPoolExecutor(max_workers=workers) as pool,
+        open(output_path, "w") as file,
+    ):
+        futures = [
+            pool.submit(
+                play_game,
+                config_path=config_path,
+                white=white,
+                black=black,
+                game=game,
+                **kwargs,
+            )
+            for game in range(games)
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            summary[result.get("winner") or "draw"] += 1
+            file.write(json.dumps(result) + "\n")
+            file.flush()
+
+    seconds = time.perf_counter() - start
+    return {
+        "games": games,
+        **summary,
+        "seconds": round(seconds, 3),
+        "games_per_hour": round(games / seconds * 3600, 1) if seconds > 0 else 0,
+    }
@@ -0,0 +1,149 @@
+"""
+Transposition table for caching search results of positions,
+keyed by the Zobrist hash of the position (see 'Engine.position_hash').
+
+The table has a fixed size in memory and is backed by flat arrays,
+one array per field, instead of a dictionary of objects.
+Entries are grouped in buckets of two slots:
+    - a depth-preferred slot, which keeps the deepest search result
+    - an always-replace slot, which keeps the most recent search result
+"""
+
+from array import array
+from enum import IntEnum
+from typing import NamedTuple
+
+# Bytes per entry: key (8), score (4), move (2), depth (1) and bound (1)
+ENTRY_SIZE = 16
+SLOTS_PER_BUCKET = 2
+MAX_DEPTH = 127
+EMPTY = -1
+
+
+class Bound(IntEnum):
+    exact: int = 0
+    lower: int = 1
+    upper: int = 2
+
+
+class TranspositionEntry(NamedTuple):
+    depth: int
+    score: int
+    bound: Bound
+    move: int
+
+
+class TranspositionTable:
+    """
+    Fixed-size transposition table.
+
+    Parameters
+    ----
+    size_mb: float
+        Memory used by the table in megabytes. The number of buckets is
+        rounded down to a power of two.
+    """
+
+    def __init__(self, size_mb: float = 16):
+        n_buckets = int(size_mb * 1024 * 1024) // (ENTRY_SIZE * SLOTS_PER_BUCKET)
+        if n_buckets < 1:
+            raise ValueError(f"Size [{size_mb} MB] is too small for a table")
+
+        # Round down to a power of two, so buckets can be found with a mask
+        n_buckets = 1 << (n_buckets.bit_length() - 1)
+        self.size_mb = size_mb
+        self._mask = n_buckets - 1
+        self.size = n_buckets * SLOTS_PER_BUCKET
+
+        self.keys = array("Q", [0]) * self.size
+        self.scores = array("i", [0]) * self.size
+        self.moves = array("H", [0]) * self.size
+        self.depths = array("b", [EMPTY]) * self.size
+        self.bounds = array("B", [0]) * self.size
+
+        self.hits = 0
+        self.misses = 0
+        self.collisions = 0
+
+    def _bucket(self, key: int) -> int:
+        """
+        Index of the depth-preferred slot in the bucket of key.
+        The always-replace slot follows right after.
+        """
+        return (key & self._mask) * SLOTS_PER_BUCKET
+
+    def probe(self, key: int) -> TranspositionEntry | None:
+        """
+        Looks up the entry of a position.
+        Returns None if the position is not in the table.
+        """
+        index = self._bucket(key)
+        occupied = False
+        for slot in (index, index + 1):
+            if self.depths[slot] == EMPTY:
+                continue
+            if self.keys[slot] == key:
+                self.hits += 1
+                return TranspositionEntry(
+                    depth=self.depths[slot],
+                    score=self.scores[slot],
+                    bound=Bound(self.bounds[slot]),
+                    move=self.moves[slot],
+                )
+            occupied = True
+
+        self.misses += 1
+        # Another position is using the bucket
+        if occupied:
+            self.collisions += 1
+        return None
+
+    def store(
+        self, key: int, depth: int, score: int, bound: Bound, move: int = 0
+    ) -> None:
+        """
+        Stores the search result of a position.
+        The depth-preferred slot is replaced if the new result is searched
+        at least as deep or belongs to the same position.
+        Otherwise, the result goes to the always-replace slot.
+
+        Parameters
+        ----
+        key: int
+            Hash of the position.
+        depth: int
+            Remaining search depth of the result.
+        score: int
+            Score of the position from the point of view of the player to move.
+        bound: Bound
+            Whether the score is exact, a lower bound or an upper bound.
+        move: int
+            The best move found in the position, packed into 16 bits.
+        """
+        index = self._bucket(key)
+        if not (self.keys[index] == key or depth >= self.depths[index]):
+            index += 1
+
+        self.keys[index] = key
+        self.depths[index] = min(depth, MAX_DEPTH)
+        self.scores[index] = score
+        self.bounds[index] = bound
+        self.moves[index] = move
+
+    def clear(self) -> None:
+        """
+        Removes all entries and resets the counters.
+        """
+        self.depths = array("b", [EMPTY]) * self.size
+        self.hits = 0
+        self.misses = 0
+        self.collisions = 0
+
+    def usage(self) -> float:
+        """
+        Fraction of slots in use.
+        """
+        return sum(1 for depth in self.depths if depth != EMPTY) / self.size
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "collisions": self.collisions}
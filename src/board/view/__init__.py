@@ -26,3 +26,6 @@ class View:
 
     def surrender_message(self, player: str):
         raise NotImplementedError('method "surrender_message" is not implemented')
+
+    def draw_message(self, reason: str):
+        raise NotImplementedError('method "draw_message" is not implemented')
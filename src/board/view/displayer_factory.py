@@ -1,21 +1,41 @@
+from collections.abc import Callable
 from enum import Enum
-from typing import Generic, TypeVar
+from queue import Queue
+from typing import Generic, TypeVar, Union
 
+from src.board.view.headless_view import HeadlessView
 from src.board.view.pygame_view import PygameView
 from src.board.view.terminal_view import TerminalView
 
-View = TypeVar("View", TerminalView, PygameView)
+View = TypeVar("View", TerminalView, PygameView, HeadlessView)
 
 
 class Displayer(Enum):
     terminal: str = "terminal"
     pygame: str = "pygame"
+    headless: str = "headless"
 
 
-def displayer_factory(displayer: Displayer, config_path: str) -> Generic[View]:
+def displayer_factory(
+    displayer: Displayer,
+    config_path: str,
+    source: Union[Callable[[dict], dict], "Queue[dict]", None] = None,
+    differential: bool = False,
+) -> Generic[View]:
+    """
+    Creates the view of a displayer.
+    The headless displayer takes its moves from source,
+    see: chess/board/view/headless_view.py
+    The terminal displayer only redraws changed cells if differential is True,
+    see: chess/board/view/terminal_view.py
+    """
     if displayer.name == "terminal":
-        return TerminalView(config_path)
+        return TerminalView(config_path, differential=differential)
     elif displayer.name == "pygame":
         return PygameView(config_path)
+    elif displayer.name == "headless":
+        if source is None:
+            raise ValueError("Headless displayer needs a source of moves.")
+        return HeadlessView(config_path, source=source)
     else:
         raise ValueError(f"Displayer {displayer} is not supported.")
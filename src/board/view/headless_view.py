@@ -0,0 +1,104 @@
+"""
+This class is used to play chess without any display,
+for example in tests and benchmarks of the game loop.
+
+Moves are taken from a programmatic source instead of a player:
+    - a callable, which gets the possible actions and returns a move
+    - a queue, from which the moves are taken in order
+
+Everything the game shows is recorded in memory as events,
+for example:
+
+    [('initialize', None), ('display_player_turn', 'white'), ...]
+"""
+
+from collections.abc import Callable
+from queue import Empty, Queue
+from typing import TYPE_CHECKING, Union
+
+from src.board.files import read_yaml
+from src.board.view import View
+
+if TYPE_CHECKING:
+    from nptyping import NDArray
+
+
+class HeadlessView(View):
+    """
+    View without display.
+
+    Parameters
+    ----
+    config_path: str
+        Path to the game configuration-file.
+    source: Callable or Queue
+        Source of the moves, in the format of 'TerminalView.await_input'.
+        A move that is None or an empty dict surrenders the game,
+        and so does an empty queue.
+    record_boards: bool
+        If True, a copy of every displayed board is recorded.
+        Otherwise, the board is recorded as None.
+    """
+
+    def __init__(
+        self,
+        config_path: str,
+        source: Union[Callable[[dict], dict], "Queue[dict]"],
+        record_boards: bool = False,
+    ):
+        self.config = read_yaml(config_path)
+        self.representation = self.config["PIECE_REPRESENTATION"]
+        self.source = source
+        self.record_boards = record_boards
+        self.events = []
+
+    def _record(self, event: str, data=None) -> None:
+        self.events.append((event, data))
+
+    def initialize(self) -> None:
+        self._record("initialize")
+
+    def display_board(self, board: "NDArray") -> None:
+        self._record("display_board", board.copy() if self.record_boards else None)
+
+    def display_player_turn(self, player: str) -> None:
+        self._record("display_player_turn", player)
+
+    def await_input(self, possible_actions: dict) -> dict:
+        """
+        Takes the next move from the source.
+
+        Returns
+        ----
+            Dictionary containing two keys:
+                id: ID of chess piece
+                action: New position for specififed chess piece
+            returns empty dict if player surrenders,
+            or if the queue of moves is empty.
+        """
+        if isinstance(self.source, Queue):
+            try:
+                player_input = self.source.get_nowait()
+            except Empty:
+                player_input = {}
+        else:
+            player_input = self.source(possible_actions)
+
+        player_input = player_input or {}
+        self._record("await_input", player_input)
+        return player_input
+
+    def game_over_message(self, player: str) -> None:
+        self._record("game_over_message", player)
+
+    def surrender_message(self, player: str) -> None:
+        self._record("surrender_message", player)
+
+    def draw_message(self, reason: str) -> None:
+        self._record("draw_message", reason)
+
+    def get_events(self, event: str) -> list:
+        """
+        Data of all recorded events of a kind, in order.
+        """
+        return [data for name, data in self.events if name == event]
@@ -15,8 +15,16 @@ White                        Black
 | 6 | King    | K |         | 12| King    | k |
 -------------------         -------------------
 
+The board is drawn with column a to h from left to right,
+and row 8 to 1 from top to bottom.
+
+With differential rendering, the board is drawn in full only once.
+After that, only the cells that changed since the last drawn board
+are redrawn, by moving the cursor to them with escape codes.
+
 """
 
+import sys
 from string import ascii_lowercase
 from typing import TYPE_CHECKING
 
@@ -30,10 +38,30 @@ if TYPE_CHECKING:
     from nptyping import NDArray
 
 
+# Terminal row and column (starting at 1) of the first cell of the board
+FIRST_CELL_ROW = 3
+FIRST_CELL_COLUMN = 5
+
+
 class TerminalView(View):
-    def __init__(self, config_path: str):
+    """
+    Parameters
+    ----
+    config_path: str
+        Path to the game configuration-file.
+    differential: bool
+        If True, only the cells that changed are redrawn.
+        Otherwise, the terminal is cleared and the board
+        is drawn in full on every move.
+    """
+
+    def __init__(self, config_path: str, differential: bool = False):
         self.config = read_yaml(config_path)
         self.representation = self.config["PIECE_REPRESENTATION"]
+        self.differential = differential
+
+        # Last drawn board, for differential rendering
+        self._frame = None
 
     def initialize(self):
         """
@@ -43,10 +71,6 @@ class TerminalView(View):
 
     def generate_view(self, board: "NDArray") -> str:
         grid_size = len(board)
-        copied_board = board.copy()
-
-        # Rotate board to create better view
-        copied_board = np.rot90(copied_board, k=5)
 
         line = f'{(grid_size*4+5)*"-"}\n'
 
@@ -62,15 +86,52 @@ class TerminalView(View):
             output.append(f"| {j} ")
         divider()
 
-        # Other rows
+        # Other rows, from the last row of the board to the first
         for i in range(0, grid_size, 1):
+            y = grid_size - 1 - i
             output.append(f"{grid_size - i} ")
-            for j in range(grid_size):
-                output.append(f"| {self.representation.get(copied_board[i, j])} ")
+            for x in range(grid_size):
+                output.append(f"| {self.representation.get(board[x, y])} ")
             divider()
         return "".join(output)
 
+    def _cell_location(self, position: tuple, grid_size: int) -> tuple[int, int]:
+        """
+        Terminal row and column (starting at 1) of the cell
+        showing a board position.
+        """
+        x, y = position
+        row = FIRST_CELL_ROW + 2 * (grid_size - 1 - y)
+        column = FIRST_CELL_COLUMN + 4 * x
+        return row, column
+
+    def generate_update(self, board: "NDArray") -> str:
+        """
+        Escape codes that redraw the cells that changed since the last drawn
+        board, or the full board if nothing is drawn yet. The cursor is left
+        below the board, with everything below it cleared.
+        """
+        grid_size = len(board)
+        if self._frame is None or self._frame.shape != board.shape:
+            # Move cursor to the top left corner and clear the terminal
+            output = ["\033[H\033[2J", self.generate_view(board)]
+        else:
+            output = []
+            for x, y in np.argwhere(board != self._frame):
+                row, column = self._cell_location((x, y), grid_size)
+                representation = self.representation.get(board[x, y])
+                output.append(f"\033[{row};{column}H{representation}")
+            output.append(f"\033[{FIRST_CELL_ROW + 2 * grid_size};1H\033[J")
+
+        self._frame = board.copy()
+        return "".join(output)
+
     def display_board(self, board: "NDArray") -> None:
+        if self.differential:
+            sys.stdout.write(self.generate_update(board))
+            sys.stdout.flush()
+            return
+
         # Clear terminal
         print("\033c")
 
@@ -136,6 +197,9 @@ class TerminalView(View):
     def surrender_message(self, player: str) -> None:
         print(f"Player {player} surrendered. Game over.")
 
+    def draw_message(self, reason: str) -> None:
+        print(f"Draw by {reason}. Game over.")
+
     def await_input(self, possible_actions: dict) -> dict:
         """
         Method for showing console menu that awaits
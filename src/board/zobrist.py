@@ -0,0 +1,50 @@
+"""
+Zobrist hashing of chess positions.
+
+Every combination of piece number and square gets a random 64-bit key,
+and the hash of a position is the XOR of the keys of all pieces on the
+board (and a key for black to move). Moving a piece is then only a few
+XOR operations on the hash, see 'Engine.make_move'.
+
+The keys are generated from a fixed seed, so that hashes are the same
+across processes and runs.
+"""
+
+import random
+from typing import Literal
+
+from src.board.bitboard import square_of
+
+SEED = 20220102
+
+_random = random.Random(SEED)
+
+# Indexed by piece number and square, piece number 0 (empty tiles) is unused
+PIECE_KEYS = tuple(
+    tuple(_random.getrandbits(64) if piece_nr else 0 for _ in range(64))
+    for piece_nr in range(13)
+)
+BLACK_TO_MOVE = _random.getrandbits(64)
+
+
+def piece_key(piece_nr: int, position: tuple) -> int:
+    return PIECE_KEYS[piece_nr][square_of(position)]
+
+
+def hash_position(
+    placement: dict[tuple, int], side_to_move: Literal["white", "black"]
+) -> int:
+    """
+    Computes the hash of a position from scratch.
+
+    Parameters
+    ----
+    placement: dict[tuple, int]
+        Piece number of every occupied position.
+    side_to_move: Literal['white', 'black']
+        The player to move.
+    """
+    output = BLACK_TO_MOVE if side_to_move == "black" else 0
+    for position, piece_nr in placement.items():
+        output ^= piece_key(piece_nr, position)
+    return output
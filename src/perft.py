@@ -0,0 +1,87 @@
+"""
+Simple py.file to run perft on the chess engine
+"""
+
+import argparse
+import sys
+import time
+
+from src.board.engine import Engine
+from src.board.perft import divide, parallel_divide
+
+
+def print_progress(moves: str, nodes: int, done: int, total: int) -> None:
+    print(f"[{done}/{total}] {moves}: {nodes}", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Count leaf nodes of the move generation (perft)."
+    )
+    parser.add_argument("--c", help="Chess game configuration-file")
+    parser.add_argument(
+        "--fen", help="Starting position as FEN, instead of config.GAME_START"
+    )
+    parser.add_argument("--depth", type=int, default=3, help="Depth of the search")
+    parser.add_argument(
+        "--player",
+        choices=["white", "black"],
+        help="Player to move in the starting position. Defaults to white, "
+        "or the player to move in the FEN.",
+    )
+    parser.add_argument(
+        "--bitboard",
+        action="store_true",
+        help="Run the move generation on the bitboard position core",
+    )
+    parser.add_argument(
+        "--legal",
+        action="store_true",
+        help="Count legal moves only, comparable to published perft counts",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes to count subtrees in parallel",
+    )
+    parser.add_argument(
+        "--split-depth",
+        type=int,
+        choices=[1, 2],
+        default=1,
+        help="Number of moves that a subtree starts after, with --workers",
+    )
+    args = parser.parse_args()
+
+    engine = Engine(config_path=args.c, use_bitboard=args.bitboard)
+    if args.fen:
+        engine.load_fen(args.fen)
+    else:
+        engine.start_game()
+    player = args.player or engine.side_to_move
+
+    start = time.perf_counter()
+    if args.workers > 1:
+        counts = parallel_divide(
+            engine=engine,
+            player=player,
+            depth=args.depth,
+            workers=args.workers,
+            split_depth=args.split_depth,
+            progress=print_progress,
+            legal=args.legal,
+        )
+    else:
+        counts = divide(
+            engine=engine, player=player, depth=args.depth, legal=args.legal
+        )
+    elapsed = time.perf_counter() - start
+
+    for move, nodes in counts.items():
+        print(f"{move}: {nodes}")
+
+    total = sum(counts.values())
+    print(f"\nNodes searched: {total}")
+    print(f"Time: {elapsed:.3f} s")
+    print(f"Nodes/second: {total / elapsed if elapsed > 0 else 0:.0f}")
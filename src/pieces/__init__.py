@@ -4,6 +4,7 @@ from src.pieces.color import Color
 from src.pieces.king import King
 from src.pieces.knight import Knight
 from src.pieces.pawn import Pawn
+from src.pieces.piece_table import PieceTable
 from src.pieces.queen import Queen
 from src.pieces.rook import Rook
 
@@ -13,6 +14,7 @@ __all__ = [
     "King",
     "Knight",
     "Pawn",
+    "PieceTable",
     "Queen",
     "Rook",
     "Color",
@@ -1,22 +1,71 @@
 from abc import ABC, abstractmethod
 
 from src.pieces.color import Color
+from src.pieces.piece_table import GRID_SIZE, OFF_BOARD, POSITIONS, PieceTable
+from src.pieces.rays import destination_table
 
 
 class AbstractChessPiece(ABC):
     """
-    Abstract class for chess pieces
+    Abstract class for chess pieces.
+
+    The position, piece number and status of a piece are stored in a slot
+    of a piece table, which is shared by all pieces in a game.
+    A piece that is created without a table gets a table of its own.
+    See: chess/pieces/piece_table.py
+
+    The destinations of the moves are looked up in a table per piece type,
+    which is built once per color and grid size.
     """
 
-    grid_size = 8  # Grid size of a chess board
-    status = 1  # Status of chess piece: Alive [1] or dead [0]
+    __slots__ = ("_table", "_slot", "piece_nr", "color", "id", "grid_size")
 
-    def __init__(self, position: tuple, piece_nr: int, color: Color):
-        self.position = position
+    def __init__(
+        self,
+        position: tuple,
+        piece_nr: int,
+        color: Color,
+        table: PieceTable | None = None,
+    ):
+        if table is None:
+            table = PieceTable()
+        self._table = table
+        self._slot = table.add(piece_nr, position, color)
+        # The piece number never changes, so it is also kept on the piece
+        # to read it without going through the table
         self.piece_nr = piece_nr
         self.color = color
-        self.name = self.__class__.__name__
         self.id = id(self)
+        self.grid_size = GRID_SIZE  # Grid size of a chess board
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.name = cls.__name__
+        # Destination tables of the piece type, by color and grid size
+        cls._destinations = {}
+
+    @property
+    def slot(self) -> int:
+        return self._slot
+
+    @property
+    def position(self) -> tuple:
+        # Same as 'PieceTable.position', inlined since it is read very often
+        square = self._table.squares[self._slot]
+        if square == OFF_BOARD:
+            return self._table.position(self._slot)
+        return POSITIONS[square]
+
+    @position.setter
+    def position(self, position: tuple) -> None:
+        self._table.set_position(slot=self._slot, position=position)
+
+    @property
+    def status(self) -> int:
+        """
+        Status of chess piece: Alive [1] or dead [0]
+        """
+        return self._table.alive[self._slot]
 
     @property
     @abstractmethod
@@ -39,7 +88,8 @@ class AbstractChessPiece(ABC):
         return [coord for coord in moves if self.is_inside_grid(coord)]
 
     def apply_move(self, move: tuple) -> tuple:
-        return (self.position[0] + move[0], self.position[1] + move[1])
+        x, y = self.position
+        return (x + move[0], y + move[1])
 
     def update(self, move: tuple) -> None:
         self.position = self.apply_move(move)
@@ -50,11 +100,29 @@ class AbstractChessPiece(ABC):
     def set_grid_size(self, size: int):
         self.grid_size = size
 
+    def get_destinations(self) -> dict[tuple, tuple]:
+        """
+        Destinations of the moves of the piece from every position,
+        see 'destination_table'.
+        """
+        key = (self.color, self.grid_size)
+        destinations = self._destinations.get(key)
+        if destinations is None:
+            destinations = destination_table(tuple(self.moves), self.grid_size)
+            self._destinations[key] = destinations
+        return destinations
+
     def get_applied_moves(self) -> list:
-        output = self.filter_by_grid_size(
-            [self.apply_move(move) for move in self.moves]
-        )
-        return output
+        position = self.position
+        destinations = self.get_destinations().get(position)
+        if destinations is None:
+            # Positions outside the grid are not in the table
+            x, y = position
+            return self.filter_by_grid_size([(x + dx, y + dy) for dx, dy in self.moves])
+        return list(destinations)
 
     def kill(self) -> None:
-        self.status = 0
+        self._table.kill(self._slot)
+
+    def revive(self) -> None:
+        self._table.revive(self._slot)
@@ -1,10 +1,10 @@
 from src.pieces.abstract import AbstractChessPiece
+from src.pieces.rays import DIAGONAL_DIRECTIONS, ray_offsets
 
 
 class Bishop(AbstractChessPiece):
+    __slots__ = ()
+
     @property
     def moves(self):
-        output = []
-        for i in range(1, self.grid_size):
-            output.extend([(i, i), (-i, i), (i, -i), (-i, -i)])
-        return output
+        return ray_offsets(DIAGONAL_DIRECTIONS, self.grid_size)
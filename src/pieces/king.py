@@ -2,6 +2,8 @@ from src.pieces.abstract import AbstractChessPiece
 
 
 class King(AbstractChessPiece):
+    __slots__ = ()
+
     @property
     def moves(self):
         output = [(-1, 1), (0, 1), (1, 1), (-1, 0), (1, 0), (-1, -1), (0, -1), (1, -1)]
@@ -2,6 +2,8 @@ from src.pieces.abstract import AbstractChessPiece
 
 
 class Knight(AbstractChessPiece):
+    __slots__ = ()
+
     @property
     def moves(self):
         output = [
@@ -3,6 +3,8 @@ from src.pieces.color import Color
 
 
 class Pawn(AbstractChessPiece):
+    __slots__ = ()
+
     @property
     def moves(self):
         if self.color == Color.white:
@@ -0,0 +1,120 @@
+"""
+Compact store of the pieces in a game, as a struct of arrays.
+
+Every piece has a slot with its piece number, color, square and whether
+it is alive, each stored in a flat array of bytes. The chess piece
+classes are thin views on a slot, see: chess/pieces/abstract.py
+
+Squares are numbered as on the bitboard (see: chess/board/bitboard.py):
+
+    square = x * 8 + y
+
+Positions outside the 8x8 board are only used by pieces outside a game,
+and are kept aside with square -1.
+"""
+
+from array import array
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from src.pieces.color import Color
+
+if TYPE_CHECKING:
+    from nptyping import NDArray
+
+GRID_SIZE = 8
+OFF_BOARD = -1
+POSITIONS = tuple((x, y) for x in range(GRID_SIZE) for y in range(GRID_SIZE))
+
+# Colors are stored as 0 (white) and 1 (black), or -1 if unknown
+COLOR_CODES = {Color.white: 0, Color.black: 1}
+
+
+class PieceTable:
+    """
+    Struct-of-arrays store of pieces, one slot per piece.
+    Slots are never removed, killed pieces are only marked as dead.
+    """
+
+    __slots__ = ("piece_nrs", "colors", "squares", "alive", "_off_board")
+
+    def __init__(self):
+        self.piece_nrs = array("b")
+        self.colors = array("b")
+        self.squares = array("b")
+        self.alive = array("b")
+        self._off_board = {}
+
+    def __len__(self) -> int:
+        return len(self.piece_nrs)
+
+    def add(self, piece_nr: int, position: tuple, color: Color) -> int:
+        """
+        Adds an alive piece and returns its slot.
+        """
+        slot = len(self.piece_nrs)
+        self.piece_nrs.append(piece_nr)
+        # Compared by identity, as hashing an Enum member is slow
+        if color is Color.white:
+            self.colors.append(0)
+        elif color is Color.black:
+            self.colors.append(1)
+        else:
+            self.colors.append(-1)
+        self.alive.append(1)
+        x, y = position
+        if 0 <= x < GRID_SIZE and 0 <= y < GRID_SIZE:
+            self.squares.append(x * GRID_SIZE + y)
+        else:
+            self.squares.append(OFF_BOARD)
+            self._off_board[slot] = position
+        return slot
+
+    def position(self, slot: int) -> tuple:
+        square = self.squares[slot]
+        if square == OFF_BOARD:
+            return self._off_board[slot]
+        return POSITIONS[square]
+
+    def set_position(self, slot: int, position: tuple) -> None:
+        x, y = position
+        if 0 <= x < GRID_SIZE and 0 <= y < GRID_SIZE:
+            self.squares[slot] = x * GRID_SIZE + y
+            self._off_board.pop(slot, None)
+        else:
+            self.squares[slot] = OFF_BOARD
+            self._off_board[slot] = position
+
+    def kill(self, slot: int) -> None:
+        self.alive[slot] = 0
+
+    def revive(self, slot: int) -> None:
+        self.alive[slot] = 1
+
+    def slots(self, color: Color | None = None, alive: bool | None = True) -> "NDArray":
+        """
+        Slots of the pieces of color (all colors if None),
+        that are alive, dead or either (if alive is None).
+        Meant for bulk queries over the table, the engine itself
+        keeps indexes of its pieces for the move generation.
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if color is not None:
+            mask &= np.array(self.colors, dtype=np.int8) == COLOR_CODES[color]
+        if alive is not None:
+            mask &= np.array(self.alive, dtype=bool) == alive
+        return np.flatnonzero(mask)
+
+    def placement(self) -> dict[tuple, int]:
+        """
+        Piece number of every position with an alive piece on the board.
+        """
+        # A plain loop, as a game has too few pieces for NumPy to pay off
+        return {
+            POSITIONS[square]: piece_nr
+            for square, piece_nr, alive in zip(
+                self.squares, self.piece_nrs, self.alive, strict=True
+            )
+            if alive and square != OFF_BOARD
+        }
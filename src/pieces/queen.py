@@ -1,17 +1,11 @@
 from src.pieces.abstract import AbstractChessPiece
+from src.pieces.rays import DIAGONAL_DIRECTIONS, STRAIGHT_DIRECTIONS, ray_offsets
 
 
 class Queen(AbstractChessPiece):
+    __slots__ = ()
+
     @property
     def moves(self):
-        output = []
-
-        # Straight moves
-        for i in range(1, self.grid_size):
-            output.extend([(i, 0), (0, i), (-i, 0), (0, -i)])
-
-        # Diagonal moves
-        for i in range(1, self.grid_size):
-            output.extend([(i, i), (-i, i), (i, -i), (-i, -i)])
-
-        return output
+        # Straight moves and diagonal moves
+        return ray_offsets(STRAIGHT_DIRECTIONS + DIAGONAL_DIRECTIONS, self.grid_size)
@@ -0,0 +1,70 @@
+"""
+Precomputed rays of the sliding chess pieces (Rook, Bishop and Queen),
+and the destinations of every piece from every position.
+
+The tables only depend on the grid size, so they are built once
+per grid size and shared by all pieces and engines.
+"""
+
+from functools import lru_cache
+
+STRAIGHT_DIRECTIONS = ((1, 0), (0, 1), (-1, 0), (0, -1))
+DIAGONAL_DIRECTIONS = ((1, 1), (-1, 1), (1, -1), (-1, -1))
+
+
+@lru_cache
+def ray_offsets(directions: tuple, grid_size: int) -> tuple:
+    """
+    All move offsets along the given directions
+    on a board of size 'grid_size'.
+    """
+    output = []
+    for i in range(1, grid_size):
+        output.extend([(i * dx, i * dy) for dx, dy in directions])
+    return tuple(output)
+
+
+@lru_cache
+def ray_table(grid_size: int) -> dict[tuple, dict[tuple, tuple]]:
+    """
+    Table of rays from every position on the board.
+    Each ray lists the positions from the nearest to the farthest,
+    and stops at the edge of the board.
+
+    For example:
+        ray_table(8)[(5, 5)][(1, 1)] == ((6, 6), (7, 7))
+    """
+    table = {}
+    for x in range(grid_size):
+        for y in range(grid_size):
+            rays = {}
+            for dx, dy in STRAIGHT_DIRECTIONS + DIAGONAL_DIRECTIONS:
+                ray = []
+                i, j = x + dx, y + dy
+                while 0 <= i < grid_size and 0 <= j < grid_size:
+                    ray.append((i, j))
+                    i, j = i + dx, j + dy
+                rays[(dx, dy)] = tuple(ray)
+            table[(x, y)] = rays
+    return table
+
+
+@lru_cache
+def destination_table(offsets: tuple, grid_size: int) -> dict[tuple, tuple]:
+    """
+    Table of the destinations from every position on the board,
+    when moving by one of the offsets. Destinations outside the board
+    are left out, and the order of the offsets is kept.
+
+    For example:
+        destination_table(((1, 1), (-1, 1)), 8)[(0, 0)] == ((1, 1),)
+    """
+    table = {}
+    for x in range(grid_size):
+        for y in range(grid_size):
+            table[(x, y)] = tuple(
+                (x + dx, y + dy)
+                for dx, dy in offsets
+                if 0 <= x + dx < grid_size and 0 <= y + dy < grid_size
+            )
+    return table
@@ -1,10 +1,10 @@
 from src.pieces.abstract import AbstractChessPiece
+from src.pieces.rays import STRAIGHT_DIRECTIONS, ray_offsets
 
 
 class Rook(AbstractChessPiece):
+    __slots__ = ()
+
     @property
     def moves(self):
-        output = []
-        for i in range(1, self.grid_size):
-            output.extend([(i, 0), (0, i), (-i, 0), (0, -i)])
-        return output
+        return ray_offsets(STRAIGHT_DIRECTIONS, self.grid_size)
@@ -12,10 +12,19 @@ from src.board.view.displayer_factory import Displayer, displayer_factory
 def main():
     parser = argparse.ArgumentParser(description="Start Chess game.")
     parser.add_argument("--c", help="Chess game configuration-file")
+    parser.add_argument(
+        "--differential",
+        action="store_true",
+        help="Only redraw the cells of the board that changed",
+    )
     args = parser.parse_args()
     config_path = args.c
 
-    view = displayer_factory(displayer=Displayer.terminal, config_path=config_path)
+    view = displayer_factory(
+        displayer=Displayer.terminal,
+        config_path=config_path,
+        differential=args.differential,
+    )
     engine = Engine(config_path=config_path)
     chess = Chess(engine=engine, displayer=view)
     chess.run()
@@ -0,0 +1,63 @@
+"""
+Simple py.file to run a self-play tournament of the chess engine
+"""
+
+import argparse
+
+from src.board.tournament import PlayerSettings, run_tournament
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Play games of the engine against itself, without display."
+    )
+    parser.add_argument("--c", help="Chess game configuration-file")
+    parser.add_argument("--games", type=int, default=10, help="Number of games")
+    parser.add_argument(
+        "--workers", type=int, default=1, help="Number of processes playing games"
+    )
+    parser.add_argument(
+        "--output", default="tournament.jsonl", help="File to write the results to"
+    )
+    parser.add_argument(
+        "--white-depth", type=int, default=3, help="Search depth of white"
+    )
+    parser.add_argument(
+        "--black-depth", type=int, default=3, help="Search depth of black"
+    )
+    parser.add_argument(
+        "--time-limit", type=float, help="Seconds each player may think per move"
+    )
+    parser.add_argument(
+        "--max-moves",
+        type=int,
+        default=200,
+        help="Number of moves before a game is a draw",
+    )
+    parser.add_argument(
+        "--random-moves",
+        type=int,
+        default=2,
+        help="Number of random moves to start each game with",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random moves")
+    args = parser.parse_args()
+
+    summary = run_tournament(
+        config_path=args.c,
+        games=args.games,
+        output_path=args.output,
+        workers=args.workers,
+        white=PlayerSettings(max_depth=args.white_depth, time_limit=args.time_limit),
+        black=PlayerSettings(max_depth=args.black_depth, time_limit=args.time_limit),
+        max_moves=args.max_moves,
+        random_moves=args.random_moves,
+        seed=args.seed,
+    )
+
+    print(f"Games: {summary['games']}")
+    print(f"White wins: {summary['white']}")
+    print(f"Black wins: {summary['black']}")
+    print(f"Draws: {summary['draw']}")
+    print(f"Time: {summary['seconds']:.1f} s")
+    print(f"Games/hour: {summary['games_per_hour']:.1f}")
@@ -0,0 +1,83 @@
+import pytest
+
+from src.board.engine import Engine, GameError
+
+
+def shuffle_knights(engine: Engine, times: int = 1) -> None:
+    """
+    Helper that moves the knights on b1 and b8 out and back again.
+    """
+    for _ in range(times):
+        for player, old, new in [
+            ("white", (1, 0), (2, 2)),
+            ("black", (1, 7), (2, 5)),
+            ("white", (2, 2), (1, 0)),
+            ("black", (2, 5), (1, 7)),
+        ]:
+            knight = engine.get_piece_by_position(old)
+            engine.make_move(
+                player=player, player_input={"id": knight.id, "action": new}
+            )
+
+
+def test_threefold_repetition(config_path):
+    engine = Engine(config_path)
+    engine.start_game()
+    assert engine.repetition_count() == 1
+
+    shuffle_knights(engine)
+    assert engine.repetition_count() == 2
+    assert engine.draw_reason(player="white") is None
+
+    shuffle_knights(engine)
+    assert engine.repetition_count() == 3
+    assert engine.is_threefold_repetition()
+    assert engine.draw_reason(player="white") == "threefold repetition"
+
+    # See that taking back moves also takes back the repetitions
+    for _ in range(4):
+        engine.unmake_move()
+    assert engine.repetition_count() == 2
+    assert not engine.is_threefold_repetition()
+
+
+def test_repetition_count_after_load_fen(config_path):
+    engine = Engine(config_path)
+    engine.start_game()
+    shuffle_knights(engine)
+    assert engine.repetition_count() == 2
+
+    # See that a new position starts a new history
+    engine.load_fen("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1")
+    assert engine.repetition_count() == 1
+
+
+def test_repetition_count_after_spawn(config_path):
+    engine = Engine(config_path)
+    engine.start_game()
+    shuffle_knights(engine)
+    engine.spawn_piece(piece_nr=5, position=(3, 3))
+    assert engine.repetition_count() == 1
+
+    # See that the history before the spawn cannot be taken back
+    with pytest.raises(GameError):
+        engine.unmake_move()
+    assert engine.repetition_count() == 1
+
+
+def test_fifty_move_rule(config_path):
+    engine = Engine(config_path)
+    engine.load_fen("k7/8/8/8/8/8/8/R6K w - - 99 80")
+    assert not engine.is_fifty_move_rule()
+
+    rook = engine.get_piece_by_position((0, 0))
+    engine.make_move(player="white", player_input={"id": rook.id, "action": (0, 3)})
+    assert engine.halfmove_clock == 100
+    assert engine.is_fifty_move_rule()
+    assert engine.draw_reason(player="black") == "fifty-move rule"
+
+
+def test_stalemate_draw_reason(config_path):
+    engine = Engine(config_path)
+    engine.load_fen("k7/8/1Q6/8/8/8/8/7K b - - 0 1")
+    assert engine.draw_reason(player="black") == "stalemate"
@@ -99,3 +99,69 @@ def test_player_is_not_in_check(config_path, player):
         engine.spawn_piece(piece_nr=2, position=(4, 6))
 
     assert not engine._player_is_in_check(player=player)
+
+
+def test_piece_indexes_follow_moves(config_path):
+    """
+    Test that pieces can be looked up by id and position
+    after moves and kills.
+    """
+    engine = Engine(config_path)
+    game_state = engine.initiate_empty_board()
+
+    # Spawn white rook and black pawn
+    engine.spawn_piece(piece_nr=2, position=(4, 4))
+    engine.spawn_piece(piece_nr=7, position=(4, 6))
+    white_rook = engine.pieces["white"][0]
+    black_pawn = engine.pieces["black"][0]
+
+    assert engine.get_piece_by_position((4, 4)) is white_rook
+    assert engine.get_piece_by_id(id=black_pawn.id, player="black") is black_pawn
+
+    # Let white rook kill black pawn
+    player_input = {"id": white_rook.id, "action": (4, 6)}
+    engine.handle_game(player="white", player_input=player_input, game_state=game_state)
+
+    # See that the indexes are updated
+    assert engine.get_piece_by_position((4, 4)) is None
+    assert engine.get_piece_by_position((4, 6)) is white_rook
+    assert black_pawn.status == 0
+
+    # See that dead pieces can still be found by id
+    assert engine.get_piece_by_id(id=black_pawn.id, player="black") is black_pawn
+
+    # See that pieces are not found on the wrong color
+    with pytest.raises(ValueError):
+        engine.get_piece_by_id(id=white_rook.id, player="black")
+
+
+def test_occupancy_follows_moves(config_path):
+    """
+    Test that the positions and alive pieces of each color
+    are kept up to date after moves and kills.
+    """
+    engine = Engine(config_path)
+    game_state = engine.initiate_empty_board()
+
+    # Spawn white rook and black pawn
+    engine.spawn_piece(piece_nr=2, position=(4, 4))
+    engine.spawn_piece(piece_nr=7, position=(4, 6))
+    white_rook = engine.pieces["white"][0]
+    black_pawn = engine.pieces["black"][0]
+
+    white_positions = engine._get_ally_positions(color="white")
+    black_pieces = engine._get_ally_pieces(color="black")
+    assert set(white_positions) == {(4, 4)}
+    assert list(black_pieces) == [black_pawn]
+
+    # Let white rook kill black pawn
+    player_input = {"id": white_rook.id, "action": (4, 6)}
+    engine.handle_game(player="white", player_input=player_input, game_state=game_state)
+
+    # See that the views follow the game
+    assert set(white_positions) == {(4, 6)}
+    assert len(black_pieces) == 0
+    assert len(engine._get_enemy_positions(color="white")) == 0
+
+    # See that the views are read-only
+    assert not hasattr(white_positions, "add")
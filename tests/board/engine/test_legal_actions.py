@@ -0,0 +1,162 @@
+import pytest
+
+from src.board.engine import Engine
+
+
+def actions_by_position(engine: Engine, player: str) -> dict[tuple, set]:
+    output = {}
+    for pieces in engine.get_all_legal_actions(player=player).values():
+        for piece in pieces:
+            output[piece.get("position")] = set(piece.get("actions"))
+    return output
+
+
+@pytest.mark.parametrize("use_bitboard", [False, True])
+def test_legal_actions_start_game(config_path, use_bitboard):
+    engine = Engine(config_path, use_bitboard=use_bitboard)
+    engine.start_game()
+
+    # See that nothing is pinned or in check in the starting position
+    legal_actions = actions_by_position(engine, player="white")
+    for pieces in engine.get_all_possible_actions(player="white").values():
+        for piece in pieces:
+            assert legal_actions[piece.get("position")] == set(piece.get("actions"))
+
+
+def test_pinned_piece(config_path):
+    engine = Engine(config_path)
+    engine.initiate_empty_board()
+    engine.spawn_piece(piece_nr=6, position=(4, 0))  # White king
+    engine.spawn_piece(piece_nr=2, position=(4, 2))  # White rook, pinned
+    engine.spawn_piece(piece_nr=3, position=(2, 0))  # White knight
+    engine.spawn_piece(piece_nr=4, position=(5, 1))  # White bishop, pinned
+    engine.spawn_piece(piece_nr=8, position=(4, 6))  # Black rook
+    engine.spawn_piece(piece_nr=10, position=(7, 3))  # Black bishop
+    engine.spawn_piece(piece_nr=12, position=(0, 7))  # Black king
+
+    actions = actions_by_position(engine, player="white")
+
+    # See that the rook only moves along the file of the pin
+    assert actions[(4, 2)] == {(4, 1), (4, 3), (4, 4), (4, 5), (4, 6)}
+    # See that the bishop only moves along the diagonal of the pin
+    assert actions[(5, 1)] == {(6, 2), (7, 3)}
+    # See that the knight is free to move
+    assert actions[(2, 0)] == {(0, 1), (1, 2), (3, 2), (4, 1)}
+
+
+def test_check_evasions(config_path):
+    engine = Engine(config_path)
+    engine.initiate_empty_board()
+    engine.spawn_piece(piece_nr=6, position=(4, 0))  # White king
+    engine.spawn_piece(piece_nr=2, position=(0, 3))  # White rook
+    engine.spawn_piece(piece_nr=3, position=(6, 3))  # White knight
+    engine.spawn_piece(piece_nr=8, position=(4, 5))  # Black rook
+    engine.spawn_piece(piece_nr=12, position=(0, 7))  # Black king
+
+    actions = actions_by_position(engine, player="white")
+
+    # See that the rook and knight can only block or kill the attacker
+    assert actions[(0, 3)] == {(4, 3)}
+    assert actions[(6, 3)] == {(4, 2), (4, 4)}
+    # See that the king cannot step back along the file of the attacker
+    assert actions[(4, 0)] == {(3, 0), (5, 0), (3, 1), (5, 1)}
+
+
+def test_double_check(config_path):
+    engine = Engine(config_path)
+    engine.initiate_empty_board()
+    engine.spawn_piece(piece_nr=6, position=(4, 0))  # White king
+    engine.spawn_piece(piece_nr=5, position=(0, 4))  # White queen
+    engine.spawn_piece(piece_nr=8, position=(4, 4))  # Black rook
+    engine.spawn_piece(piece_nr=9, position=(3, 2))  # Black knight
+    engine.spawn_piece(piece_nr=12, position=(0, 7))  # Black king
+
+    actions = actions_by_position(engine, player="white")
+
+    # See that only the king can move when checked by two pieces
+    assert actions[(0, 4)] == set()
+    assert actions[(4, 0)] == {(3, 0), (5, 0), (3, 1)}
+
+
+def test_king_cannot_kill_defended_piece(config_path):
+    engine = Engine(config_path)
+    engine.initiate_empty_board()
+    engine.spawn_piece(piece_nr=6, position=(4, 0))  # White king
+    engine.spawn_piece(piece_nr=9, position=(4, 1))  # Black knight
+    engine.spawn_piece(piece_nr=8, position=(4, 5))  # Black rook, defends (4, 1)
+    engine.spawn_piece(piece_nr=12, position=(0, 7))  # Black king
+
+    white_king = engine.get_white_king()[-1]
+    assert (4, 1) in engine.apply_game_rules(white_king)
+
+    # See that the king is not allowed to kill the defended knight
+    actions = actions_by_position(engine, player="white")
+    assert actions[(4, 0)] == {(3, 0), (5, 0), (3, 1), (5, 1)}
+
+
+def test_iter_moves(config_path):
+    engine = Engine(config_path)
+    engine.start_game()
+
+    # See that the moves are the same as the legal actions
+    moves = {(piece.position, action) for piece, action in engine.iter_moves("white")}
+    expected_moves = {
+        (position, action)
+        for position, actions in actions_by_position(engine, "white").items()
+        for action in actions
+    }
+    assert moves == expected_moves
+    assert len(moves) == 20
+
+
+def test_has_legal_move_stops_early(config_path, monkeypatch):
+    engine = Engine(config_path)
+    engine.start_game()
+
+    calls = []
+    apply_game_rules = engine.apply_game_rules
+    monkeypatch.setattr(
+        engine,
+        "apply_game_rules",
+        lambda piece: calls.append(piece) or apply_game_rules(piece),
+    )
+
+    # See that move generation stops at the first piece with a move
+    assert engine.has_legal_move("white")
+    assert len(calls) < 16
+
+
+@pytest.mark.parametrize(
+    "fen, is_checkmate, is_stalemate",
+    [
+        ("k7/1Q6/1K6/8/8/8/8/8 b - - 0 1", True, False),
+        ("k7/8/1Q6/8/8/8/8/7K b - - 0 1", False, True),
+        ("k7/8/1Q6/8/8/7p/8/7K b - - 0 1", False, False),
+        ("k7/1Q6/8/8/8/8/8/7K b - - 0 1", False, False),
+        # The king escapes to the square in front of an enemy pawn
+        ("R6k/8/6P1/8/8/8/8/K7 b - - 0 1", False, False),
+    ],
+)
+def test_game_end(config_path, fen, is_checkmate, is_stalemate):
+    engine = Engine(config_path)
+    engine.load_fen(fen)
+    assert engine.is_checkmate("black") == is_checkmate
+    assert engine.is_stalemate("black") == is_stalemate
+    assert engine.has_legal_move("black") == (not is_checkmate and not is_stalemate)
+
+
+def test_king_escapes_in_front_of_pawn(config_path):
+    engine = Engine(config_path)
+    engine.load_fen("R6k/8/6P1/8/8/8/8/K7 b - - 0 1")
+
+    # See that the king is in check, but may step in front of the pawn
+    assert engine.is_in_check("black")
+    assert actions_by_position(engine, player="black") == {(7, 7): {(6, 6)}}
+    assert [action for _, action in engine.iter_moves("black")] == [(6, 6)]
+
+    # See that the check rules agree with the legal moves
+    assert engine._threats_to_the_king("black") == [
+        engine.get_piece_by_position((0, 7))
+    ]
+    assert not engine._king_cannot_move("black")
+    assert engine._cannot_protect_king("black")
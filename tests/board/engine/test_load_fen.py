@@ -0,0 +1,54 @@
+import numpy as np
+
+from src.board.engine import Engine
+from src.board.fen import START_FEN
+
+
+def test_load_fen_start_game(config_path):
+    """
+    See that the starting position from FEN
+    equals the starting position from the config.
+    """
+    engine = Engine(config_path)
+    expected_game_state = engine.start_game()
+    game_state = engine.load_fen(START_FEN)
+
+    assert np.array_equal(game_state, expected_game_state)
+    assert len(engine.pieces["white"]) == 16
+    assert len(engine.pieces["black"]) == 16
+    assert engine.side_to_move == "white"
+
+
+def test_to_fen_start_game(config_path):
+    engine = Engine(config_path)
+    engine.start_game()
+    assert engine.to_fen() == "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1"
+
+
+def test_fen_round_trip(config_path):
+    fen = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R b - - 4 12"
+    engine = Engine(config_path)
+    engine.load_fen(fen)
+    assert engine.to_fen() == fen
+
+
+def test_move_counters(config_path):
+    engine = Engine(config_path)
+    engine.start_game()
+
+    # White knight to f3
+    knight = engine.get_piece_by_position((6, 0))
+    engine.make_move(player="white", player_input={"id": knight.id, "action": (5, 2)})
+    assert engine.to_fen().endswith(" b - - 1 1")
+
+    # Black pawn to e5
+    pawn = engine.get_piece_by_position((4, 6))
+    engine.make_move(player="black", player_input={"id": pawn.id, "action": (4, 4)})
+    assert engine.to_fen() == (
+        "rnbqkbnr/pppp1ppp/8/4p3/8/5N2/PPPPPPPP/RNBQKB1R w - - 0 2"
+    )
+
+    # See that the counters are taken back
+    engine.unmake_move()
+    engine.unmake_move()
+    assert engine.to_fen() == "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1"
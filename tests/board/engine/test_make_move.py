@@ -0,0 +1,127 @@
+import random
+
+import pytest
+
+from src.board.engine import Engine, GameError
+from src.board.zobrist import hash_position
+
+
+def snapshot(engine: Engine) -> dict:
+    """
+    Helper that collects the state of all pieces in engine.
+    """
+    return {
+        "pieces": {
+            piece.id: (piece.position, piece.status)
+            for pieces in engine.pieces.values()
+            for piece in pieces
+        },
+        "bitboard": list(engine.bitboard.boards),
+        "white": set(engine._get_ally_positions(color="white")),
+        "black": set(engine._get_ally_positions(color="black")),
+    }
+
+
+def test_unmake_kill(config_path):
+    engine = Engine(config_path)
+    engine.initiate_empty_board()
+
+    # Spawn white rook and black pawn
+    engine.spawn_piece(piece_nr=2, position=(4, 4))
+    engine.spawn_piece(piece_nr=7, position=(4, 6))
+    white_rook = engine.pieces["white"][0]
+    black_pawn = engine.pieces["black"][0]
+    before = snapshot(engine)
+
+    # Let white rook kill black pawn
+    record = engine.make_move(
+        player="white", player_input={"id": white_rook.id, "action": (4, 6)}
+    )
+    assert record.killed is black_pawn
+    assert black_pawn.status == 0
+
+    # See that the kill is taken back
+    engine.unmake_move()
+    assert black_pawn.status == 1
+    assert white_rook.position == (4, 4)
+    assert engine.get_piece_by_position((4, 6)) is black_pawn
+    assert snapshot(engine) == before
+
+
+def test_unmake_without_moves(config_path):
+    engine = Engine(config_path)
+    engine.start_game()
+
+    with pytest.raises(GameError):
+        engine.unmake_move()
+
+
+def test_unmake_out_of_turn(config_path):
+    engine = Engine(config_path)
+    engine.start_game()
+    start_hash = engine.position_hash
+    black_knight = engine.get_piece_by_position((1, 7))
+
+    # Let black move while it is the turn of white
+    engine.make_move(
+        player="black", player_input={"id": black_knight.id, "action": (2, 5)}
+    )
+    assert engine.side_to_move == "white"
+    engine.unmake_move()
+
+    # See that the player to move and the hash are restored
+    assert engine.side_to_move == "white"
+    assert engine.fullmove_number == 1
+    assert engine.position_hash == start_hash
+    assert engine.position_hash == hash_position(
+        placement=engine._get_placement(), side_to_move=engine.side_to_move
+    )
+
+
+def test_unmake_after_spawn(config_path):
+    engine = Engine(config_path)
+    engine.start_game()
+    knight = engine.get_piece_by_position((1, 0))
+    engine.make_move(player="white", player_input={"id": knight.id, "action": (2, 2)})
+    engine.spawn_piece(piece_nr=5, position=(3, 3))
+
+    # See that moves before the spawned piece cannot be taken back
+    with pytest.raises(GameError):
+        engine.unmake_move()
+    expected_hash = hash_position(
+        placement=engine._get_placement(), side_to_move=engine.side_to_move
+    )
+    assert engine.position_hash == expected_hash
+
+
+@pytest.mark.parametrize("use_bitboard", [False, True])
+def test_make_unmake_random_game(config_path, use_bitboard):
+    """
+    Play random moves and take all of them back again.
+    See that the engine ends up in the starting position.
+    """
+    rng = random.Random(42)
+    engine = Engine(config_path, use_bitboard=use_bitboard)
+    engine.start_game()
+    start = snapshot(engine)
+    start_actions = engine.get_all_possible_actions(player="white")
+
+    player = "white"
+    for _ in range(40):
+        actions = engine.get_all_possible_actions(player=player)
+        moves = [
+            {"id": piece.get("id"), "action": action}
+            for pieces in actions.values()
+            for piece in pieces
+            for action in piece.get("actions")
+        ]
+        engine.make_move(player=player, player_input=rng.choice(moves))
+        player = Engine.opponent_of[player]
+
+    for _ in range(40):
+        engine.unmake_move()
+
+    assert snapshot(engine) == start
+    for name, pieces in engine.get_all_possible_actions(player="white").items():
+        for piece, start_piece in zip(pieces, start_actions[name], strict=True):
+            assert set(piece.get("actions")) == set(start_piece.get("actions"))
@@ -178,3 +178,25 @@ def test_pawn_double_jump_blocked(config_path, blocker):
 
     assert white_pawn_1_1.position == (1, 1)
     assert len(moves_1_1) == 0
+
+
+def test_pawn_killer_move_behind_ally(config_path):
+    """
+    Test that pawn can kill diagonally
+    even if an ally is standing in front of it.
+    """
+    engine = Engine(config_path)
+    engine.initiate_empty_board()
+
+    # Spawn white pawn with a white pawn in front of it
+    engine.spawn_piece(piece_nr=1, position=(4, 4))
+    engine.spawn_piece(piece_nr=1, position=(4, 5))
+
+    # Spawn black pawn diagonal to the first white pawn
+    engine.spawn_piece(piece_nr=7, position=(5, 5))
+
+    white_pawn = engine.pieces["white"][0]
+
+    # See that white pawn can only kill black pawn
+    moves = engine.apply_game_rules(white_pawn)
+    assert moves == [(5, 5)]
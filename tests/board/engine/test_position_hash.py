@@ -0,0 +1,61 @@
+import random
+
+from src.board.engine import Engine
+from src.board.zobrist import hash_position
+
+
+def test_position_hash_follows_random_game(config_path):
+    """
+    See that the incrementally updated hash always equals
+    the hash computed from scratch.
+    """
+    rng = random.Random(7)
+    engine = Engine(config_path, use_bitboard=True)
+    engine.start_game()
+    start_hash = engine.position_hash
+
+    player = "white"
+    for _ in range(50):
+        moves = [
+            {"id": piece.get("id"), "action": action}
+            for pieces in engine.get_all_possible_actions(player=player).values()
+            for piece in pieces
+            for action in piece.get("actions")
+        ]
+        engine.make_move(player=player, player_input=rng.choice(moves))
+        player = Engine.opponent_of[player]
+
+        expected_hash = hash_position(
+            placement=engine._get_placement(), side_to_move=engine.side_to_move
+        )
+        assert engine.position_hash == expected_hash
+
+    # See that the hash is restored when moves are taken back
+    for _ in range(50):
+        engine.unmake_move()
+    assert engine.position_hash == start_hash
+
+
+def test_position_hash_transposition(config_path):
+    """
+    See that the same position reached by different moves
+    gives the same hash.
+    """
+    engine = Engine(config_path)
+    engine.start_game()
+    start_hash = engine.position_hash
+
+    # Move both knights out and back again
+    white_knight = engine.get_piece_by_position((6, 0))
+    black_knight = engine.get_piece_by_position((6, 7))
+    engine.make_move("white", {"id": white_knight.id, "action": (5, 2)})
+    engine.make_move("black", {"id": black_knight.id, "action": (5, 5)})
+    assert engine.position_hash != start_hash
+    engine.make_move("white", {"id": white_knight.id, "action": (6, 0)})
+    engine.make_move("black", {"id": black_knight.id, "action": (6, 7)})
+
+    assert engine.position_hash == start_hash
+
+    # See that the position from FEN has the same hash
+    engine.load_fen(engine.to_fen())
+    assert engine.position_hash == start_hash
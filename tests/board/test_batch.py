@@ -0,0 +1,118 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.board.batch import (
+    batch_move_arrays,
+    batch_moves,
+    destination_masks,
+    move_arrays,
+)
+from src.board.engine import Engine
+from src.board.moves import decode_move, is_capture
+
+
+def engine_moves(engine: Engine, player: str) -> list[tuple]:
+    """
+    Helper that collects all moves of player from the engine.
+    """
+    actions = engine.get_all_possible_actions(player=player)
+    return sorted(
+        (piece.get("position"), action)
+        for pieces in actions.values()
+        for piece in pieces
+        for action in piece.get("actions")
+    )
+
+
+def random_positions(config_path: str, n: int) -> tuple[list, list]:
+    """
+    Helper that plays a random game and collects the game states
+    and moves of the player to move on the way.
+    """
+    rng = random.Random(7)
+    engine = Engine(config_path)
+    game_state = engine.start_game()
+    player = "white"
+    boards, moves = [], []
+    for _ in range(n):
+        boards.append(game_state.copy())
+        moves.append((player, engine_moves(engine, player)))
+        position, action = rng.choice(moves[-1][1])
+        game_state = engine.handle_game(
+            player=player,
+            player_input={
+                "id": engine.get_piece_by_position(position).id,
+                "action": action,
+            },
+            game_state=game_state,
+        )
+        player = Engine.opponent_of[player]
+    return boards, moves
+
+
+def test_batch_moves_match_engine(config_path):
+    boards, moves = random_positions(config_path, n=60)
+
+    # See that a batch gives the same moves as the engine for every board
+    for color in ("white", "black"):
+        batch = batch_moves(np.stack(boards), player=color)
+        for board_moves, (player, expected) in zip(batch, moves, strict=True):
+            if player == color:
+                assert sorted(board_moves) == expected
+
+
+def test_king_danger(config_path):
+    engine = Engine(config_path)
+    game_state = engine.initiate_empty_board()
+
+    # White king next to a black rook and in front of a black pawn
+    for piece_nr, position in [(6, (3, 3)), (8, (5, 4)), (7, (2, 6))]:
+        engine.spawn_piece(piece_nr=piece_nr, position=position)
+        game_state[position] = piece_nr
+
+    [moves] = batch_moves(game_state[None], player="white")
+    assert sorted(moves) == engine_moves(engine, "white")
+
+
+def test_destination_masks(config_path):
+    engine = Engine(config_path)
+    start = engine.start_game()
+    boards = np.stack([start, np.zeros_like(start)])
+
+    masks = destination_masks(boards, player="white")
+    assert masks.shape == (2, 8, 8)
+    assert masks.dtype == np.uint64
+
+    # See that the pawn on a2 can move to a3 and a4 (squares 2 and 3)
+    assert masks[0, 0, 1] == 0b1100
+    # See that black pieces and the empty board have no moves
+    assert masks[0, 0, 6] == 0
+    assert not masks[1].any()
+
+    board, old_squares, new_squares = move_arrays(masks)
+    assert len(board) == 20
+    assert set(board.tolist()) == {0}
+
+    with pytest.raises(ValueError):
+        destination_masks(start, player="white")
+
+
+def test_batch_move_arrays(config_path):
+    engine = Engine(config_path)
+    start = engine.start_game()
+    game_state = engine.load_fen("k7/8/8/8/8/2p5/1P6/K7 w - - 0 1")
+    boards = np.stack([start, game_state])
+
+    board, moves = batch_move_arrays(boards, player="white")
+    assert moves.dtype == np.uint16
+    assert len(moves) == len(board)
+
+    # See that the moves are the same as the moves of each board
+    for index, board_moves in enumerate(batch_moves(boards, player="white")):
+        assert [decode_move(move) for move in moves[board == index]] == board_moves
+
+    # See that only the kill on the second board is flagged as capture
+    captures = [decode_move(move) for move in moves.tolist() if is_capture(move)]
+    assert captures == [((1, 1), (2, 2))]
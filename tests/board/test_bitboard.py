@@ -0,0 +1,133 @@
+import random
+
+import pytest
+
+from src.board.bitboard import (
+    POSITIONS,
+    ROOK_RAYS,
+    Bitboard,
+    positions_of,
+    sliding_moves,
+    square_of,
+)
+from src.board.engine import Engine
+from src.pieces.rays import STRAIGHT_DIRECTIONS, ray_table
+
+
+def actions_by_position(engine: Engine, player: str) -> dict[tuple, set]:
+    """
+    Helper to compare actions of two engines,
+    as the instance ids of chess pieces differ between engines.
+    """
+    output = {}
+    for _, pieces in engine.get_all_possible_actions(player=player).items():
+        for piece in pieces:
+            output[piece.get("position")] = set(piece.get("actions"))
+    return output
+
+
+def test_square_of():
+    assert square_of((0, 0)) == 0
+    assert square_of((0, 7)) == 7
+    assert square_of((1, 0)) == 8
+    assert square_of((7, 7)) == 63
+
+
+def test_positions_of():
+    mask = (1 << square_of((4, 4))) | (1 << square_of((0, 1)))
+    assert positions_of(mask) == [(0, 1), (4, 4)]
+
+
+def test_bitboard_follows_handle_game(config_path):
+    engine = Engine(config_path)
+    game_state = engine.initiate_empty_board()
+
+    engine.spawn_piece(piece_nr=2, position=(4, 4))  # White rook
+    engine.spawn_piece(piece_nr=7, position=(4, 6))  # Black pawn
+    white_rook = engine.get_white_rooks()[0]
+
+    player_input = {"id": white_rook.id, "action": (4, 6)}
+    engine.handle_game(player="white", player_input=player_input, game_state=game_state)
+
+    # See that rook has moved and that the pawn is removed
+    assert positions_of(engine.bitboard.boards[2]) == [(4, 6)]
+    assert engine.bitboard.boards[7] == 0
+    assert engine.bitboard.occupancy["black"] == 0
+
+    # See that the incremental updates match a rebuilt bitboard
+    rebuilt = Bitboard.from_placement(engine._get_placement())
+    assert engine.bitboard.boards == rebuilt.boards
+    assert engine.bitboard.occupancy == rebuilt.occupancy
+
+
+@pytest.mark.parametrize("player", ["white", "black"])
+def test_start_game_actions(config_path, player):
+    engine = Engine(config_path)
+    engine.start_game()
+    bitboard_engine = Engine(config_path, use_bitboard=True)
+    bitboard_engine.start_game()
+
+    assert actions_by_position(engine, player) == actions_by_position(
+        bitboard_engine, player
+    )
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_random_game_actions(config_path, seed):
+    """
+    Play random moves and see that both position cores
+    agree on all possible actions along the way.
+    """
+    rng = random.Random(seed)
+    engine = Engine(config_path)
+    game_state = engine.start_game()
+    bitboard_engine = Engine(config_path, use_bitboard=True)
+    bitboard_game_state = bitboard_engine.start_game()
+
+    player = "white"
+    for _ in range(60):
+        expected = actions_by_position(engine, player)
+        assert actions_by_position(bitboard_engine, player) == expected
+
+        moves = [
+            (position, action)
+            for position, actions in expected.items()
+            for action in sorted(actions)
+        ]
+        if not moves:
+            break
+        position, action = rng.choice(moves)
+
+        for eng, state in [
+            (engine, game_state),
+            (bitboard_engine, bitboard_game_state),
+        ]:
+            piece = [
+                p for p in eng.pieces[player] if p.status and p.position == position
+            ]
+            eng.handle_game(
+                player=player,
+                player_input={"id": piece[0].id, "action": action},
+                game_state=state,
+            )
+        player = Engine.opponent_of[player]
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2, 3])
+def test_sliding_moves(seed):
+    """
+    See that the table lookups give the same result
+    as walking the rays square by square.
+    """
+    rng = random.Random(seed)
+    occupied = rng.getrandbits(64) & rng.getrandbits(64)
+    table = ray_table(8)
+
+    for square, position in enumerate(POSITIONS):
+        expected = 0
+        for direction in STRAIGHT_DIRECTIONS:
+            for ray_position in table[position][direction]:
+                expected |= 1 << square_of(ray_position)
+                if occupied & (1 << square_of(ray_position)):
+                    break
+        assert sliding_moves(square, ROOK_RAYS, occupied) == expected
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from src.board.engine import Engine
+from src.board.evaluation import evaluate, evaluate_boards
+
+
+def test_evaluate(config_path):
+    engine = Engine(config_path)
+    engine.start_game()
+
+    # See that the starting position is balanced
+    assert evaluate(engine=engine, player="white") == 0
+
+    engine.initiate_empty_board()
+    engine.spawn_piece(piece_nr=5, position=(3, 0))
+    engine.spawn_piece(piece_nr=7, position=(3, 6))
+
+    # Queen on d1 scores -5 and pawn on d7 scores -20 on their square
+    assert evaluate(engine=engine, player="white") == 815
+    assert evaluate(engine=engine, player="black") == -815
+
+    # See that a knight scores better in the center than in the corner
+    engine.spawn_piece(piece_nr=3, position=(0, 0))
+    corner = evaluate(engine=engine, player="white")
+    engine.initiate_empty_board()
+    engine.spawn_piece(piece_nr=3, position=(3, 3))
+    assert evaluate(engine=engine, player="white") > corner - 800
+
+
+def test_evaluate_boards(config_path):
+    engine = Engine(config_path)
+    rng = np.random.default_rng(0)
+
+    boards = []
+    scores = []
+    for _ in range(20):
+        game_state = rng.integers(0, 13, size=(8, 8)) * (rng.random((8, 8)) < 0.3)
+        engine.initiate_board_from_array(game_state)
+        boards.append(game_state)
+        scores.append(evaluate(engine=engine, player="white"))
+
+    # See that the batch scores match the scores of each board
+    assert evaluate_boards(np.stack(boards)).tolist() == scores
+
+    # See that the starting position and its mirror are balanced
+    start = engine.start_game()
+    assert evaluate_boards(start[None]).tolist() == [0]
+
+
+def test_evaluate_boards_float(config_path):
+    engine = Engine(config_path)
+    empty = engine.initiate_empty_board()
+    engine.spawn_piece(piece_nr=5, position=(3, 3))
+    queen = empty.copy()
+    queen[3, 3] = 5
+
+    # See that float boards are scored like integer boards
+    assert empty.dtype == float
+    assert evaluate_boards(np.stack([empty, queen])).tolist() == [
+        0,
+        evaluate(engine=engine, player="white"),
+    ]
+
+
+def test_evaluate_boards_shape():
+    with pytest.raises(ValueError):
+        evaluate_boards(np.zeros((8, 8), dtype=int))
+    with pytest.raises(ValueError):
+        evaluate_boards(np.zeros((2, 8, 7), dtype=int))
+
+    assert evaluate_boards(np.zeros((0, 8, 8), dtype=int)).shape == (0,)
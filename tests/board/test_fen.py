@@ -0,0 +1,51 @@
+import pytest
+
+from src.board.fen import START_FEN, format_fen, parse_fen
+
+
+def test_parse_start_fen():
+    placement, side_to_move, halfmove_clock, fullmove_number = parse_fen(START_FEN)
+
+    assert len(placement) == 32
+    assert side_to_move == "white"
+    assert halfmove_clock == 0
+    assert fullmove_number == 1
+
+    # See that white king is on e1 and black queen is on d8
+    assert (6, (4, 0)) in placement
+    assert (11, (3, 7)) in placement
+
+
+def test_parse_fen_defaults():
+    placement, side_to_move, halfmove_clock, fullmove_number = parse_fen(
+        "8/8/8/8/8/8/8/K7"
+    )
+    assert placement == [(6, (0, 0))]
+    assert side_to_move == "white"
+    assert halfmove_clock == 0
+    assert fullmove_number == 1
+
+
+@pytest.mark.parametrize(
+    "fen",
+    [
+        "",
+        "8/8/8/8/8/8/8 w - - 0 1",  # Too few rows
+        "9/8/8/8/8/8/8/8 w - - 0 1",  # Too many columns
+        "8/8/8/8/8/8/8/KKKKKKKKK w - - 0 1",  # Too many pieces
+        "8/8/8/8/8/8/8/7X w - - 0 1",  # Unknown piece
+        "8/8/8/8/8/8/8/8 x - - 0 1",  # Unknown player to move
+        "8/8/8/8/8/8/8/8 w - - a 1",  # Invalid halfmove clock
+    ],
+)
+def test_parse_invalid_fen(fen):
+    with pytest.raises(ValueError):
+        parse_fen(fen)
+
+
+def test_format_fen():
+    placement = {(4, 0): 6, (4, 7): 12, (4, 3): 1}
+    fen = format_fen(
+        placement=placement, side_to_move="black", halfmove_clock=3, fullmove_number=7
+    )
+    assert fen == "4k3/8/8/8/4P3/8/8/4K3 b - - 3 7"
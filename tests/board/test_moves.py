@@ -0,0 +1,78 @@
+from array import array
+
+import numpy as np
+
+from src.board.engine import Engine
+from src.board.moves import (
+    CAPTURE,
+    decode_move,
+    decode_moves,
+    encode_move,
+    encode_moves,
+    is_capture,
+    move_flags,
+    new_square,
+    old_square,
+)
+
+
+def test_encode_move():
+    assert encode_move((0, 0), (0, 1)) == 1
+    assert encode_move((7, 7), (0, 0)) == 63 << 6
+
+    move = encode_move((4, 1), (4, 3), CAPTURE)
+    # See that the move fits in 16 bits and decodes to its parts
+    assert move < 1 << 16
+    assert (old_square(move), new_square(move)) == (33, 35)
+    assert move_flags(move) == CAPTURE
+    assert is_capture(move)
+    assert decode_move(move) == ((4, 1), (4, 3))
+
+
+def test_encode_moves():
+    old_squares = np.array([0, 33, 63])
+    new_squares = np.array([1, 35, 0])
+    flags = np.array([0, CAPTURE, 0])
+    moves = encode_moves(old_squares, new_squares, flags)
+
+    assert moves.dtype == np.uint16
+    assert moves.tolist() == [
+        encode_move((0, 0), (0, 1)),
+        encode_move((4, 1), (4, 3), CAPTURE),
+        encode_move((7, 7), (0, 0)),
+    ]
+
+    # See that arrays of moves decode back to their parts
+    decoded = decode_moves(array("H", moves.tolist()))
+    assert [part.tolist() for part in decoded] == [
+        old_squares.tolist(),
+        new_squares.tolist(),
+        flags.tolist(),
+    ]
+
+
+def test_engine_move_array(config_path):
+    engine = Engine(config_path)
+    engine.load_fen("k7/8/8/8/8/2p5/1P6/K7 w - - 0 1")
+    moves = engine.get_move_array(player="white")
+
+    # See that all legal moves are listed, two bytes each
+    assert moves.itemsize == 2
+    assert sorted(decode_move(move) for move in moves) == [
+        ((0, 0), (0, 1)),
+        ((0, 0), (1, 0)),
+        ((1, 1), (1, 2)),
+        ((1, 1), (1, 3)),
+        ((1, 1), (2, 2)),
+    ]
+    assert [decode_move(move) for move in moves if is_capture(move)] == [
+        ((1, 1), (2, 2))
+    ]
+
+    # See that an encoded move can be played
+    capture = next(move for move in moves if is_capture(move))
+    engine.make_move(
+        player="white", player_input=engine.get_player_input(capture, "white")
+    )
+    assert engine.get_piece_by_position((2, 2)).name == "Pawn"
+    assert engine.get_piece_by_position((2, 2)).color.name == "white"
@@ -0,0 +1,15 @@
+import pytest
+
+from src.board.notation import move_to_str, position_to_str, str_to_position
+
+
+@pytest.mark.parametrize(
+    "position, name", [((0, 0), "a1"), ((0, 1), "a2"), ((4, 3), "e4"), ((7, 7), "h8")]
+)
+def test_position_to_str(position, name):
+    assert position_to_str(position) == name
+    assert str_to_position(name) == position
+
+
+def test_move_to_str():
+    assert move_to_str((4, 1), (4, 3)) == "e2e4"
@@ -0,0 +1,46 @@
+from src.board.engine import Engine
+from src.board.ordering import MoveOrdering, mvv_lva
+
+
+def test_mvv_lva():
+    # See that the most valuable victim comes first
+    assert mvv_lva(victim_nr=11, attacker_nr=1) > mvv_lva(victim_nr=8, attacker_nr=1)
+    assert mvv_lva(victim_nr=7, attacker_nr=5) > 0
+
+    # See that the least valuable attacker comes first
+    assert mvv_lva(victim_nr=11, attacker_nr=1) > mvv_lva(victim_nr=11, attacker_nr=5)
+
+
+def test_order(config_path):
+    engine = Engine(config_path)
+    engine.initiate_empty_board()
+
+    # White queen can kill a black pawn and a black rook
+    engine.spawn_piece(piece_nr=5, position=(3, 3))
+    engine.spawn_piece(piece_nr=7, position=(3, 5))
+    engine.spawn_piece(piece_nr=8, position=(5, 5))
+    queen = engine.get_piece_by_position((3, 3))
+
+    def move(action: tuple) -> tuple:
+        return (queen.id, (3, 3), action, 5)
+
+    ordering = MoveOrdering()
+    moves = [move((0, 3)), move((3, 5)), move((1, 1)), move((5, 5)), move((3, 4))]
+
+    # Let a quiet move cause a cutoff, and another move score on history
+    ordering.update(move=move((1, 1)), depth=2, ply=3)
+    ordering.update(move=move((0, 3)), depth=3, ply=0)
+
+    ordered = ordering.order(engine=engine, moves=list(moves), ply=3)
+    assert [move[2] for move in ordered] == [(5, 5), (3, 5), (1, 1), (0, 3), (3, 4)]
+
+    # See that the first move comes before kills
+    ordered = ordering.order(
+        engine=engine, moves=list(moves), ply=3, first_move=((3, 3), (3, 4))
+    )
+    assert ordered[0][2] == (3, 4)
+
+    # See that killers are forgotten in a new search
+    ordering.new_search()
+    ordered = ordering.order(engine=engine, moves=list(moves), ply=3)
+    assert [move[2] for move in ordered][2:4] == [(0, 3), (1, 1)]
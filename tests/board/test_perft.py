@@ -0,0 +1,118 @@
+import pytest
+
+from src.board.engine import Engine
+from src.board.perft import divide, parallel_divide, perft
+
+
+@pytest.mark.parametrize("use_bitboard", [False, True])
+@pytest.mark.parametrize("depth, expected_nodes", [(1, 20), (2, 400)])
+def test_perft_start_game(config_path, use_bitboard, depth, expected_nodes):
+    engine = Engine(config_path, use_bitboard=use_bitboard)
+    engine.start_game()
+    assert perft(engine=engine, player="white", depth=depth) == expected_nodes
+
+
+def test_perft_depth_3(config_path):
+    """
+    See that perft matches the known node count
+    from the starting position.
+    """
+    engine = Engine(config_path, use_bitboard=True)
+    engine.start_game()
+    assert perft(engine=engine, player="white", depth=3) == 8902
+
+
+@pytest.mark.parametrize(
+    "fen, depth, expected_nodes",
+    [
+        ("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1", 3, 8902),
+        # Position 3 of the Chess Programming Wiki, without en passant up to depth 2
+        ("8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1", 1, 14),
+        ("8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1", 2, 191),
+    ],
+)
+def test_perft_legal(config_path, fen, depth, expected_nodes):
+    """
+    See that perft of the legal moves matches the published node counts.
+    """
+    engine = Engine(config_path, use_bitboard=True)
+    engine.load_fen(fen)
+    nodes = perft(engine=engine, player="white", depth=depth, legal=True)
+    assert nodes == expected_nodes
+
+
+def test_divide(config_path):
+    engine = Engine(config_path)
+    engine.start_game()
+
+    counts = divide(engine=engine, player="black", depth=2)
+
+    # See that every move of black has 20 answers from white
+    assert len(counts) == 20
+    assert counts["e7e5"] == 20
+    assert counts["g8f6"] == 20
+    assert sum(counts.values()) == 400
+
+
+def test_divide_invalid_depth(config_path):
+    engine = Engine(config_path)
+    engine.start_game()
+    with pytest.raises(ValueError):
+        divide(engine=engine, player="white", depth=0)
+
+
+@pytest.mark.parametrize("split_depth", [1, 2])
+def test_parallel_divide(config_path, split_depth):
+    engine = Engine(config_path, use_bitboard=True)
+    engine.start_game()
+    fen = engine.to_fen()
+
+    reports = []
+    counts = parallel_divide(
+        engine=engine,
+        player="white",
+        depth=3,
+        workers=2,
+        split_depth=split_depth,
+        progress=lambda *report: reports.append(report),
+    )
+
+    # See that the workers count the same nodes as a single process
+    assert counts == divide(engine=engine, player="white", depth=3)
+    assert engine.to_fen() == fen
+
+    # See that every subtree is reported once
+    assert len(reports) == 20**split_depth
+    assert sum(nodes for _, nodes, _, _ in reports) == 8902
+    assert reports[-1][2:] == (len(reports), len(reports))
+
+
+@pytest.mark.parametrize("split_depth", [1, 2])
+def test_parallel_divide_legal(config_path, split_depth):
+    engine = Engine(config_path, use_bitboard=True)
+    engine.load_fen("8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1")
+
+    counts = parallel_divide(
+        engine=engine,
+        player="white",
+        depth=3,
+        workers=2,
+        split_depth=split_depth,
+        legal=True,
+    )
+
+    # See that the workers count the same legal moves as a single process
+    assert counts == divide(engine=engine, player="white", depth=3, legal=True)
+    assert len(counts) == 14
+    assert sum(counts.values()) == 2810
+
+
+def test_parallel_divide_invalid_input(config_path):
+    engine = Engine(config_path)
+    engine.start_game()
+    with pytest.raises(ValueError):
+        parallel_divide(engine=engine, player="white", depth=2, workers=0)
+    with pytest.raises(ValueError):
+        parallel_divide(
+            engine=engine, player="white", depth=2, workers=2, split_depth=3
+        )
@@ -0,0 +1,154 @@
+import time
+
+import pytest
+
+from src.board.engine import Engine
+from src.board.search import MATE, MAX_DEPTH, Search
+from src.board.transposition import TranspositionTable
+
+
+def test_search_finds_mate(config_path):
+    engine = Engine(config_path)
+    engine.initiate_empty_board()
+
+    # White king and rook against black king in the corner
+    engine.spawn_piece(piece_nr=6, position=(6, 5))
+    engine.spawn_piece(piece_nr=2, position=(0, 0))
+    engine.spawn_piece(piece_nr=12, position=(7, 7))
+    white_rook = engine.get_piece_by_position((0, 0))
+
+    search = Search(engine=engine, table=TranspositionTable(size_mb=1))
+    move = search.search(player="white", max_depth=3)
+
+    # See that the rook moves to the last row
+    assert move == {"id": white_rook.id, "action": (0, 7)}
+    assert search.score == MATE - 1
+
+
+def test_search_escapes_check_in_front_of_pawn(config_path):
+    engine = Engine(config_path)
+    engine.load_fen("R6k/8/6P1/8/8/8/8/K7 b - - 0 1")
+    black_king = engine.get_piece_by_position((7, 7))
+
+    search = Search(engine=engine, table=TranspositionTable(size_mb=1))
+    move = search.search(player="black", max_depth=1)
+
+    # See that the position is not scored as checkmate
+    assert move == {"id": black_king.id, "action": (6, 6)}
+    assert search.score > -MATE + MAX_DEPTH
+
+
+def test_search_kills_free_piece(config_path):
+    engine = Engine(config_path)
+    engine.initiate_empty_board()
+    engine.spawn_piece(piece_nr=6, position=(0, 0))
+    engine.spawn_piece(piece_nr=5, position=(3, 3))
+    engine.spawn_piece(piece_nr=12, position=(6, 7))
+    engine.spawn_piece(piece_nr=8, position=(3, 6))
+    white_queen = engine.get_piece_by_position((3, 3))
+
+    move = Search(engine=engine).search(player="white", max_depth=2)
+    assert move == {"id": white_queen.id, "action": (3, 6)}
+
+
+def test_search_restores_position(config_path):
+    engine = Engine(config_path)
+    engine.start_game()
+    fen = engine.to_fen()
+    position_hash = engine.position_hash
+
+    search = Search(engine=engine)
+    move = search.search(player="white", max_depth=3)
+
+    # See that the engine is back in the position it started from
+    assert engine.to_fen() == fen
+    assert engine.position_hash == position_hash
+    assert search.depth == 3
+
+    # See that the move can be handled by the engine
+    assert move.get("action") in engine.get_possible_actions(
+        id=move.get("id"), color="white"
+    )
+
+
+def test_search_restores_position_out_of_turn(config_path):
+    engine = Engine(config_path)
+    engine.start_game()
+    fen = engine.to_fen()
+    position_hash = engine.position_hash
+
+    # See that searching for black with white to move changes nothing
+    Search(engine=engine).search(player="black", max_depth=2)
+    assert engine.side_to_move == "white"
+    assert engine.to_fen() == fen
+    assert engine.position_hash == position_hash
+
+
+def test_search_budgets(config_path):
+    engine = Engine(config_path)
+    engine.start_game()
+    fen = engine.to_fen()
+
+    # See that the search stops at the node budget
+    search = Search(engine=engine)
+    move = search.search(player="white", max_nodes=100)
+    assert move is not None
+    assert search.nodes <= 100
+    assert engine.to_fen() == fen
+
+    # See that the search stops in time
+    search = Search(engine=engine)
+    start = time.perf_counter()
+    move = search.search(player="white", time_limit=0.2)
+    assert time.perf_counter() - start < 1
+    assert move is not None
+    assert search.depth >= 1
+    assert engine.to_fen() == fen
+
+
+def test_search_without_moves(config_path):
+    engine = Engine(config_path)
+    engine.initiate_empty_board()
+    engine.spawn_piece(piece_nr=12, position=(7, 7))
+
+    search = Search(engine=engine)
+    assert search.search(player="white") is None
+    with pytest.raises(ValueError):
+        search.search(player="black", max_depth=0)
+
+
+def test_parallel_search(config_path):
+    engine = Engine(config_path)
+    engine.initiate_empty_board()
+    engine.spawn_piece(piece_nr=6, position=(6, 5))
+    engine.spawn_piece(piece_nr=2, position=(0, 0))
+    engine.spawn_piece(piece_nr=12, position=(7, 7))
+    white_rook = engine.get_piece_by_position((0, 0))
+    fen = engine.to_fen()
+
+    search = Search(engine=engine, table=TranspositionTable(size_mb=1), workers=2)
+    try:
+        # See that the workers find the same mate as a single process
+        move = search.search(player="white", max_depth=3)
+        assert move == {"id": white_rook.id, "action": (0, 7)}
+        assert search.score == MATE - 1
+        assert search.nodes > 0
+        assert engine.to_fen() == fen
+
+        # See that the workers stop in time
+        engine.start_game()
+        start = time.perf_counter()
+        move = search.search(player="white", time_limit=0.5)
+        assert time.perf_counter() - start < 2
+        assert move.get("action") in engine.get_possible_actions(
+            id=move.get("id"), color="white"
+        )
+
+        # See that the workers share the node budget
+        search.search(player="white", max_nodes=5000)
+        assert 0 < search.nodes <= 5000
+    finally:
+        search.close()
+
+    with pytest.raises(ValueError):
+        Search(engine=engine, workers=0)
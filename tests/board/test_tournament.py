@@ -0,0 +1,52 @@
+import json
+
+from src.board.tournament import PlayerSettings, play_game, run_tournament
+
+
+def test_play_game(config_path):
+    result = play_game(
+        config_path=config_path,
+        white=PlayerSettings(max_depth=2),
+        black=PlayerSettings(max_depth=1),
+        max_moves=12,
+    )
+    assert result.get("game") == 0
+    assert 0 < len(result.get("moves")) <= 12
+    assert result.get("reason") in {
+        "checkmate",
+        "stalemate",
+        "threefold repetition",
+        "fifty-move rule",
+        "king killed",
+        "move limit",
+    }
+
+    # See that the same seed plays the same game
+    again = play_game(
+        config_path=config_path,
+        white=PlayerSettings(max_depth=2),
+        black=PlayerSettings(max_depth=1),
+        max_moves=12,
+    )
+    assert again.get("moves") == result.get("moves")
+
+
+def test_run_tournament(config_path, tmp_path):
+    output_path = tmp_path / "tournament.jsonl"
+    summary = run_tournament(
+        config_path=config_path,
+        games=3,
+        output_path=str(output_path),
+        workers=2,
+        white=PlayerSettings(max_depth=1),
+        black=PlayerSettings(max_depth=1),
+        max_moves=6,
+    )
+    assert summary.get("games") == 3
+    assert summary.get("white") + summary.get("black") + summary.get("draw") == 3
+    assert summary.get("games_per_hour") > 0
+
+    # See that every game is written to the results file
+    results = [json.loads(line) for line in output_path.read_text().splitlines()]
+    assert sorted(result.get("game") for result in results) == [0, 1, 2]
+    assert all(len(result.get("moves")) <= 6 for result in results)
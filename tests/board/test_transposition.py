@@ -0,0 +1,84 @@
+import pytest
+
+from src.board.transposition import (
+    ENTRY_SIZE,
+    SLOTS_PER_BUCKET,
+    Bound,
+    TranspositionTable,
+)
+
+
+def test_table_size():
+    table = TranspositionTable(size_mb=1)
+
+    # See that the table does not use more than the given memory
+    assert table.size * ENTRY_SIZE <= 1024 * 1024
+    assert table.size == 1024 * 1024 // ENTRY_SIZE
+
+    # See that a table without room for a bucket is not allowed
+    with pytest.raises(ValueError):
+        TranspositionTable(size_mb=0)
+
+
+def test_store_and_probe():
+    table = TranspositionTable(size_mb=1)
+    key = 0x1234_5678_9ABC_DEF0
+
+    # See that an empty table misses
+    assert table.probe(key) is None
+    assert table.stats() == {"hits": 0, "misses": 1, "collisions": 0}
+
+    table.store(key, depth=3, score=-150, bound=Bound.lower, move=1234)
+    entry = table.probe(key)
+    assert entry.depth == 3
+    assert entry.score == -150
+    assert entry.bound is Bound.lower
+    assert entry.move == 1234
+    assert table.hits == 1
+
+    # See that storing the same position again overwrites the entry
+    table.store(key, depth=1, score=20, bound=Bound.exact)
+    entry = table.probe(key)
+    assert entry.depth == 1
+    assert entry.score == 20
+
+
+def test_replacement_policy():
+    table = TranspositionTable(size_mb=1)
+    n_buckets = table.size // SLOTS_PER_BUCKET
+
+    # Three positions in the same bucket
+    deep, shallow, newest = 5, 5 + n_buckets, 5 + 2 * n_buckets
+
+    table.store(deep, depth=6, score=1, bound=Bound.exact)
+    table.store(shallow, depth=2, score=2, bound=Bound.exact)
+
+    # See that the shallow search does not replace the deep search
+    assert table.probe(deep).score == 1
+    assert table.probe(shallow).score == 2
+
+    # See that the newest search replaces the always-replace slot
+    table.store(newest, depth=1, score=3, bound=Bound.upper)
+    assert table.probe(deep).score == 1
+    assert table.probe(newest).score == 3
+
+    # See that the evicted position is counted as a collision
+    assert table.probe(shallow) is None
+    assert table.collisions == 1
+
+    # See that a deeper search replaces the depth-preferred slot
+    table.store(shallow, depth=8, score=4, bound=Bound.exact)
+    assert table.probe(deep) is None
+    assert table.probe(shallow).score == 4
+
+
+def test_clear():
+    table = TranspositionTable(size_mb=1)
+    table.store(42, depth=0, score=0, bound=Bound.exact)
+    assert table.probe(42) is not None
+    assert table.usage() > 0
+
+    table.clear()
+    assert table.usage() == 0
+    assert table.probe(42) is None
+    assert table.stats() == {"hits": 0, "misses": 1, "collisions": 0}
@@ -0,0 +1,18 @@
+from src.board.zobrist import BLACK_TO_MOVE, PIECE_KEYS, hash_position, piece_key
+
+
+def test_piece_keys_are_unique():
+    keys = [key for piece_keys in PIECE_KEYS[1:] for key in piece_keys]
+    assert len(set(keys)) == 12 * 64
+    assert BLACK_TO_MOVE not in keys
+
+
+def test_hash_position():
+    placement = {(4, 0): 6, (4, 7): 12}
+    white_hash = hash_position(placement=placement, side_to_move="white")
+
+    assert white_hash == piece_key(6, (4, 0)) ^ piece_key(12, (4, 7))
+    assert hash_position(placement=placement, side_to_move="black") == (
+        white_hash ^ BLACK_TO_MOVE
+    )
+    assert hash_position(placement={}, side_to_move="white") == 0
@@ -0,0 +1,113 @@
+from queue import Queue
+
+import pytest
+
+from src.board.engine import Engine
+from src.board.game import Chess
+from src.board.view.displayer_factory import Displayer, displayer_factory
+from src.board.view.headless_view import HeadlessView
+
+
+def first_action(possible_actions: dict) -> dict:
+    """
+    Helper that picks the first action of the first piece that can move.
+    """
+    for pieces in possible_actions.values():
+        for piece in pieces:
+            if piece.get("actions"):
+                return {"id": piece.get("id"), "action": piece.get("actions")[0]}
+    return {}
+
+
+def test_headless_view_with_queue(config_path, monkeypatch):
+    engine = Engine(config_path)
+    game_state = engine.start_game()
+    white_pawn = engine.get_piece_by_position((4, 1))
+    black_pawn = engine.get_piece_by_position((4, 6))
+
+    moves = Queue()
+    moves.put({"id": white_pawn.id, "action": (4, 3)})
+    moves.put({"id": black_pawn.id, "action": (4, 4)})
+    moves.put({})
+
+    view = displayer_factory(
+        displayer=Displayer.headless, config_path=config_path, source=moves
+    )
+    assert isinstance(view, HeadlessView)
+
+    chess = Chess(engine=engine, displayer=view)
+    # Let the game start from the pieces that the moves refer to
+    monkeypatch.setattr(engine, "start_game", lambda: game_state)
+    chess.run()
+
+    # See that the moves are played and white surrenders on the third move
+    assert chess.game_over
+    assert view.get_events("display_player_turn") == ["white", "black", "white"]
+    assert view.get_events("surrender_message") == ["white"]
+    assert len(view.get_events("await_input")) == 3
+    assert chess.game_state[4, 3] == 1
+    assert chess.game_state[4, 4] == 7
+
+
+def test_headless_view_with_callable(config_path):
+    calls = []
+
+    def source(possible_actions: dict) -> dict:
+        calls.append(possible_actions)
+        return first_action(possible_actions) if len(calls) <= 10 else None
+
+    view = HeadlessView(config_path, source=source, record_boards=True)
+    chess = Chess(engine=Engine(config_path), displayer=view)
+    chess.run()
+
+    # See that every turn is recorded and the last player surrenders
+    assert len(calls) == 11
+    assert view.events[0] == ("initialize", None)
+    assert len(view.get_events("display_board")) == 11
+    assert view.get_events("surrender_message") == ["white"]
+
+    # See that recorded boards do not change with the game
+    first_board, last_board = view.get_events("display_board")[::10]
+    assert (first_board != last_board).any()
+
+
+def test_headless_view_with_empty_queue(config_path):
+    view = HeadlessView(config_path, source=Queue())
+    chess = Chess(engine=Engine(config_path), displayer=view)
+    chess.run()
+
+    # See that an empty queue surrenders instead of blocking the game
+    assert chess.game_over
+    assert view.get_events("await_input") == [{}]
+    assert view.get_events("surrender_message") == ["white"]
+    # See that boards are displayed, but not recorded
+    assert view.get_events("display_board") == [None]
+
+
+def test_headless_view_without_source(config_path):
+    with pytest.raises(ValueError):
+        displayer_factory(displayer=Displayer.headless, config_path=config_path)
+
+
+def test_headless_view_draw_by_repetition(config_path, monkeypatch):
+    engine = Engine(config_path)
+    game_state = engine.start_game()
+    white_knight = engine.get_piece_by_position((1, 0))
+    black_knight = engine.get_piece_by_position((1, 7))
+
+    moves = Queue()
+    for _ in range(2):
+        moves.put({"id": white_knight.id, "action": (2, 2)})
+        moves.put({"id": black_knight.id, "action": (2, 5)})
+        moves.put({"id": white_knight.id, "action": (1, 0)})
+        moves.put({"id": black_knight.id, "action": (1, 7)})
+
+    view = HeadlessView(config_path, source=moves)
+    chess = Chess(engine=engine, displayer=view)
+    monkeypatch.setattr(engine, "start_game", lambda: game_state)
+    chess.run()
+
+    # See that the game ends when the start position occurs the third time
+    assert chess.game_over
+    assert len(view.get_events("await_input")) == 8
+    assert view.get_events("draw_message") == ["threefold repetition"]
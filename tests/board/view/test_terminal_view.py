@@ -0,0 +1,50 @@
+import numpy as np
+
+from src.board.engine import Engine
+from src.board.view.terminal_view import TerminalView
+
+
+def test_generate_view(config_path):
+    view = TerminalView(config_path)
+    board = Engine(config_path).start_game()
+    lines = view.generate_view(board).splitlines()
+
+    # See that row 8 is drawn on top and row 1 at the bottom
+    assert lines[0] == "  | a | b | c | d | e | f | g | h | "
+    assert lines[2] == "8 | r | n | b | q | k | b | n | r | "
+    assert lines[4] == "7 | p | p | p | p | p | p | p | p | "
+    assert lines[14] == "2 | P | P | P | P | P | P | P | P | "
+    assert lines[16] == "1 | R | N | B | Q | K | B | N | R | "
+
+
+def test_generate_update(config_path):
+    engine = Engine(config_path)
+    board = engine.start_game()
+    view = TerminalView(config_path, differential=True)
+
+    # See that the first board is drawn in full
+    first = view.generate_update(board)
+    assert first == "\033[H\033[2J" + view.generate_view(board)
+
+    # Move the pawn on e2 to e4
+    pawn = engine.get_piece_by_position((4, 1))
+    board = engine.handle_game(
+        player="white",
+        player_input={"id": pawn.id, "action": (4, 3)},
+        game_state=board,
+    )
+
+    # See that only e2 and e4 are redrawn, and the cursor ends below the board
+    update = view.generate_update(board)
+    assert update == "\033[15;21H \033[11;21HP\033[19;1H\033[J"
+
+    # See that the redrawn cells are where the full view draws them
+    lines = view.generate_view(board).splitlines()
+    assert lines[15 - 1][21 - 1] == " "
+    assert lines[11 - 1][21 - 1] == "P"
+
+    # See that nothing is redrawn if the board did not change
+    assert view.generate_update(board) == "\033[19;1H\033[J"
+
+    # See that a board of another size is drawn in full
+    assert view.generate_update(np.zeros((4, 4), dtype=int)).startswith("\033[H")
@@ -57,3 +57,10 @@ def test_filter_by_grid_size_5():
 
     # see that the moves outside grid are filtered away
     assert chess_piece.filter_by_grid_size(moves) == moves_inside
+
+
+def test_revive_chess_piece():
+    chess_piece = DummyChessPiece(position=(1, 1), piece_nr=4, color=Color.white)
+    chess_piece.kill()
+    chess_piece.revive()
+    assert chess_piece.status == 1
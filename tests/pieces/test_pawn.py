@@ -35,3 +35,23 @@ def test_pawn_moves_exception():
     with pytest.raises(ValueError) as e:
         pawn.moves()
         assert str(e.value) == "Color [not working] is not supported"
+
+
+def test_pawn_destinations_are_shared():
+    white_pawn = Pawn(position=(1, 1), piece_nr=1, color=Color.white)
+    other_pawn = Pawn(position=(4, 5), piece_nr=1, color=Color.white)
+    black_pawn = Pawn(position=(4, 5), piece_nr=7, color=Color.black)
+
+    # See that pawns of the same color share the table of destinations
+    assert white_pawn.get_destinations() is other_pawn.get_destinations()
+    assert white_pawn.get_destinations() is not black_pawn.get_destinations()
+
+    # See that the applied moves are a copy, which can be changed
+    moves = white_pawn.get_applied_moves()
+    moves.remove((1, 3))
+    assert (1, 3) in white_pawn.get_applied_moves()
+
+
+def test_pawn_moves_outside_grid():
+    pawn = Pawn(position=(1, 9), piece_nr=1, color=Color.black)
+    assert pawn.get_applied_moves() == [(1, 7)]
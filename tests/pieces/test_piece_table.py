@@ -0,0 +1,76 @@
+from src.board.engine import Engine
+from src.pieces import PieceTable
+from src.pieces.color import Color
+from src.pieces.pawn import Pawn
+from src.pieces.rook import Rook
+
+
+def test_piece_table_slots():
+    table = PieceTable()
+    rook = Rook(position=(0, 0), piece_nr=2, color=Color.white, table=table)
+    pawn = Pawn(position=(4, 6), piece_nr=7, color=Color.black, table=table)
+
+    # See that the pieces are views on a slot of the shared table
+    assert len(table) == 2
+    assert (rook.slot, pawn.slot) == (0, 1)
+    assert table.position(pawn.slot) == (4, 6)
+    assert pawn.piece_nr == 7
+
+    pawn.kill()
+    assert pawn.status == 0
+    assert table.slots().tolist() == [rook.slot]
+    assert table.slots(color=Color.black, alive=False).tolist() == [pawn.slot]
+    assert table.slots(alive=None).tolist() == [rook.slot, pawn.slot]
+
+    pawn.revive()
+    assert table.slots(color=Color.black).tolist() == [pawn.slot]
+
+
+def test_piece_table_position():
+    table = PieceTable()
+    rook = Rook(position=(0, 0), piece_nr=2, color=Color.white, table=table)
+
+    rook.update((0, 5))
+    assert rook.position == (0, 5)
+    assert table.squares[rook.slot] == 5
+
+    # See that positions outside the board are kept as they are
+    rook.set_position((0, 9))
+    assert rook.position == (0, 9)
+    rook.set_position((3, 3))
+    assert rook.position == (3, 3)
+
+
+def test_piece_table_placement():
+    table = PieceTable()
+    Rook(position=(0, 0), piece_nr=2, color=Color.white, table=table)
+    pawn = Pawn(position=(4, 6), piece_nr=7, color=Color.black, table=table)
+    Pawn(position=(-1, 2), piece_nr=1, color=Color.white, table=table)
+
+    assert table.placement() == {(0, 0): 2, (4, 6): 7}
+    pawn.kill()
+    assert table.placement() == {(0, 0): 2}
+
+
+def test_engine_piece_table(config_path):
+    engine = Engine(config_path)
+    engine.start_game()
+
+    # See that all pieces of the engine share the table of the engine
+    pieces = engine.pieces["white"] + engine.pieces["black"]
+    assert len(engine.piece_table) == 32
+    assert all(piece._table is engine.piece_table for piece in pieces)
+    assert not any(hasattr(piece, "__dict__") for piece in pieces)
+    assert len(engine.piece_table.slots(color=Color.white)) == 16
+
+
+def test_initiate_pieces_keeps_table(config_path):
+    engine = Engine(config_path)
+    game_state = engine.start_game()
+    piece_table = engine.piece_table
+
+    # See that creating pieces does not replace the table of the game
+    pieces = engine.initiate_pieces(board=game_state)
+    assert engine.piece_table is piece_table
+    assert len(piece_table) == 32
+    assert all(piece._table is not piece_table for piece in pieces["white"])
@@ -0,0 +1,48 @@
+import pytest
+
+from src.pieces.rays import (
+    DIAGONAL_DIRECTIONS,
+    STRAIGHT_DIRECTIONS,
+    destination_table,
+    ray_offsets,
+    ray_table,
+)
+
+
+@pytest.mark.parametrize(
+    "position, direction, expected_ray",
+    [
+        ((5, 5), (1, 1), ((6, 6), (7, 7))),
+        ((0, 0), (-1, 0), ()),
+        ((4, 4), (0, -1), ((4, 3), (4, 2), (4, 1), (4, 0))),
+        ((2, 6), (-1, 1), ((1, 7),)),
+    ],
+)
+def test_ray_table(position, direction, expected_ray):
+    assert ray_table(8)[position][direction] == expected_ray
+
+
+def test_ray_table_grid_size():
+    table = ray_table(5)
+    # See that there is a ray for every direction on every position
+    assert len(table) == 25
+    for rays in table.values():
+        assert set(rays) == set(STRAIGHT_DIRECTIONS + DIAGONAL_DIRECTIONS)
+    assert table[(0, 0)][(1, 1)] == ((1, 1), (2, 2), (3, 3), (4, 4))
+
+
+def test_ray_offsets_are_cached():
+    # See that the offsets are only generated once per grid size
+    assert ray_offsets(STRAIGHT_DIRECTIONS, 8) is ray_offsets(STRAIGHT_DIRECTIONS, 8)
+    assert len(ray_offsets(STRAIGHT_DIRECTIONS, 8)) == 28
+    assert len(ray_offsets(DIAGONAL_DIRECTIONS, 5)) == 16
+
+
+def test_destination_table():
+    knight_offsets = ((-2, 1), (-2, -1), (2, 1), (2, -1), (1, 2), (-1, 2), (1, -2))
+    table = destination_table(knight_offsets, 8)
+    # See that destinations outside the board are left out, in order of the offsets
+    assert len(table) == 64
+    assert table[(0, 0)] == ((2, 1), (1, 2))
+    assert table[(4, 4)] == ((2, 5), (2, 3), (6, 5), (6, 3), (5, 6), (3, 6), (5, 2))
+    assert destination_table(knight_offsets, 8) is table